@@ -0,0 +1,209 @@
+"""Parallel pitch analysis of a corpus of WAV files"""
+
+import json
+import os
+import wave
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+from audio.pitch import PitchSettings, estimate_pitch, frame_signal
+from audio.transcription import frequencies_to_steps
+from audio.wav_reader import read_wav_chunks, wav_info
+from core.frequency import Frequency
+from core.note_names import MAX_OCTAVE, MIN_OCTAVE, QUARTERTONES_PER_OCTAVE, STEP_COUNT
+from core.tuning import TuningTable, tuning_table
+
+OCTAVE_COUNT = MAX_OCTAVE - MIN_OCTAVE + 1
+
+# State of the worker process, i.e. its tuning table, set once per worker by _initialize_worker()
+# (which builds the table in the worker: a pickled table would lose its read-only flags)
+_WORKER_STATE: Dict[str, TuningTable] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisOptions:
+    """Pitch estimation options of a corpus analysis (see audio.pitch.PitchSettings)"""
+
+    frame_length: int = 2048
+    hop_length: int = 512
+    min_frequency: float = 60.0
+    max_frequency: float = 2000.0
+
+    def pitch_settings(self, sample_rate: int) -> PitchSettings:
+        """Return the PitchSettings of a file with the given sample rate"""
+        return PitchSettings(sample_rate, **asdict(self))
+
+
+@dataclass
+class CorpusSummary:
+    """Merged pitch histograms of the files of a corpus
+
+    histogram[octave - MIN_OCTAVE, quartertone_index] is the number of voiced frames closest to the
+    note, over all files. Files that could not be analyzed are listed in errors.
+    """
+
+    a4_frequency: Frequency
+    histogram: np.ndarray = field(
+        default_factory=lambda: np.zeros((OCTAVE_COUNT, QUARTERTONES_PER_OCTAVE), dtype=np.int64)
+    )
+    file_histograms: Dict[str, np.ndarray] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def add(self, file_path: str, histogram: np.ndarray):
+        """Merge the histogram of a file"""
+        self.file_histograms[file_path] = histogram
+        self.histogram += histogram
+
+
+def find_wav_files(directory: str) -> List[str]:
+    """Return the sorted paths of all .wav files under directory (recursively)"""
+    return sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(directory)
+        for name in names
+        if name.lower().endswith(".wav")
+    )
+
+
+def pitch_histogram(file_path: str, table: TuningTable, options: AnalysisOptions) -> np.ndarray:
+    """Return the (octaves x quartertones) histogram of the closest notes of the voiced frames of
+    a WAV file. The file is streamed in chunks, and no Note is created."""
+    settings = options.pitch_settings(wav_info(file_path).sample_rate)
+    counts = np.zeros(STEP_COUNT, dtype=np.int64)
+    carry = np.empty(0)
+    for chunk in read_wav_chunks(file_path):
+        samples = np.concatenate([carry, chunk])
+        frames = frame_signal(samples, settings.frame_length, settings.hop_length)
+        carry = samples[len(frames) * settings.hop_length :]
+        steps = frequencies_to_steps(estimate_pitch(frames, settings)[0], table)
+        counts += np.bincount(steps[steps >= 0], minlength=STEP_COUNT)
+    return counts.reshape(OCTAVE_COUNT, QUARTERTONES_PER_OCTAVE)
+
+
+def _initialize_worker(a4_frequency_value: float):
+    """Get the shared tuning table once per worker process, instead of once per file"""
+    _WORKER_STATE["table"] = tuning_table(Frequency(a4_frequency_value))
+
+
+def _analyze_file(
+    file_path: str, options: AnalysisOptions
+) -> Tuple[str, Optional[np.ndarray], Optional[str]]:
+    """Return (file path, histogram, None), or (file path, None, error) if it can not be read"""
+    try:
+        return file_path, pitch_histogram(file_path, _WORKER_STATE["table"], options), None
+    except (wave.Error, EOFError, ValueError) as error:
+        return file_path, None, f"{type(error).__name__}: {error}"
+
+
+class Checkpoint:
+    """Append-only JSON lines file of the histograms of analyzed files, to resume a run
+
+    Every line is {"file": path, "a4_frequency": value, "options": {...}, "histogram": [[...],
+    ...]}, options being the AnalysisOptions of the histogram. A last line cut short by an
+    interruption is removed on load, so that the next record starts on a line of its own.
+    """
+
+    def __init__(self, file_path: str, a4_frequency: Frequency, options: AnalysisOptions):
+        self.file_path = file_path
+        self.a4_frequency = a4_frequency
+        self.options = options
+
+    def _truncate_torn_line(self):
+        """Cut the file back to its last newline, if an interruption left a partial last line"""
+        with open(self.file_path, "rb+") as checkpoint_file:
+            if checkpoint_file.seek(0, os.SEEK_END) == 0:
+                return
+            checkpoint_file.seek(-1, os.SEEK_END)
+            if checkpoint_file.read(1) == b"\n":
+                return
+            checkpoint_file.seek(0)
+            checkpoint_file.truncate(checkpoint_file.read().rfind(b"\n") + 1)
+
+    def load(self) -> Iterator[Tuple[str, np.ndarray]]:
+        """Yield (file path, histogram) of the files already analyzed"""
+        if not os.path.exists(self.file_path):
+            return
+        self._truncate_torn_line()
+        with open(self.file_path, "r", encoding="utf-8") as checkpoint_file:
+            for line in checkpoint_file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if Frequency(record["a4_frequency"]) != self.a4_frequency:
+                    raise ValueError(
+                        f"Checkpoint is of A4 = {record['a4_frequency']} Hz, "
+                        f"not {self.a4_frequency} Hz"
+                    )
+                if record.get("options") != asdict(self.options):
+                    raise ValueError(
+                        f"Checkpoint is of options {record.get('options')}, "
+                        f"not {asdict(self.options)}"
+                    )
+                yield record["file"], np.asarray(record["histogram"], dtype=np.int64)
+
+    def append(self, file_path: str, histogram: np.ndarray):
+        """Record the histogram of an analyzed file"""
+        record = {
+            "file": file_path,
+            "a4_frequency": self.a4_frequency.value,
+            "options": asdict(self.options),
+            "histogram": histogram.tolist(),
+        }
+        with open(self.file_path, "a", encoding="utf-8") as checkpoint_file:
+            checkpoint_file.write(json.dumps(record) + "\n")
+
+
+def _results(
+    file_paths: List[str], a4_frequency: Frequency, options: AnalysisOptions, jobs: int
+) -> Iterable[Tuple[str, Optional[np.ndarray], Optional[str]]]:
+    initargs = (float(a4_frequency.value),)
+    if jobs == 1 or len(file_paths) <= 1:
+        _initialize_worker(*initargs)
+        yield from (_analyze_file(file_path, options) for file_path in file_paths)
+        return
+    with ProcessPoolExecutor(jobs, initializer=_initialize_worker, initargs=initargs) as executor:
+        futures = [executor.submit(_analyze_file, file_path, options) for file_path in file_paths]
+        yield from (future.result() for future in as_completed(futures))
+
+
+def analyze_corpus(
+    file_paths: Iterable[str],
+    a4_frequency: Frequency,
+    jobs: Optional[int] = None,
+    options: AnalysisOptions = AnalysisOptions(),
+    checkpoint_path: Optional[str] = None,
+) -> CorpusSummary:
+    """Return the merged pitch histograms of WAV files, analyzed in parallel by `jobs` processes
+    (default: one per CPU).
+
+    With a checkpoint, files already in it are not analyzed again, and every newly analyzed file
+    is appended to it as soon as it is done.
+    """
+    jobs = (os.cpu_count() or 1) if jobs is None else jobs
+    if jobs <= 0:
+        raise ValueError(f"Number of jobs must be positive: {jobs}")
+    summary = CorpusSummary(a4_frequency)
+    checkpoint = None
+    if checkpoint_path is not None:
+        checkpoint = Checkpoint(checkpoint_path, a4_frequency, options)
+    done: Set[str] = set()
+    if checkpoint is not None:
+        for file_path, histogram in checkpoint.load():
+            if file_path not in done:
+                done.add(file_path)
+                summary.add(file_path, histogram)
+
+    pending = [file_path for file_path in dict.fromkeys(file_paths) if file_path not in done]
+    results = _results(pending, a4_frequency, options, jobs)
+    for file_path, file_histogram, error in results:
+        if file_histogram is None:
+            summary.errors[file_path] = str(error)
+            continue
+        summary.add(file_path, file_histogram)
+        if checkpoint is not None:
+            checkpoint.append(file_path, file_histogram)
+    return summary
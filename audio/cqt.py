@@ -0,0 +1,284 @@
+"""Constant-Q transform on the quartertone grid (24 bins per octave), streamed in blocks
+
+The bins are the notes of the tuning table of an A4 reference, from the C of the lowest octave to
+the Bs of the highest. Only the spectral kernel of the highest octave is computed (Brown and
+Puckette's method): every lower octave is the same kernel applied to the signal decimated by 2
+once more, so every octave costs the same (small) FFT size, and the frames of all octaves are
+aligned. The signal is first decimated as much as the highest octave allows.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Iterator, List
+
+import numpy as np
+
+from audio.sparse import CsrMatrix
+from audio.wav_reader import read_wav_chunks, wav_info
+from core.frequency import Frequency
+from core.note_names import MAX_OCTAVE, MIN_OCTAVE, QUARTERTONES_PER_OCTAVE
+from core.tuning import TuningTable, tuning_table
+
+# Quality factor of the quartertone grid: the bandwidth of a bin is the spacing of the bins
+Q_FACTOR = 1.0 / (2.0 ** (1.0 / QUARTERTONES_PER_OCTAVE) - 1.0)
+# Spectral kernel values below this fraction of the peak of their bin are dropped
+KERNEL_SPARSITY = 0.0054
+# The highest bin must be below this fraction of the sample rate, for the decimation filter
+MAX_FREQUENCY_RATIO = 0.4
+# Upper bound on the number of kernels (i.e. sample rates, A4 references and octave ranges) cached
+CQT_KERNEL_CACHE_MAXSIZE = 32
+
+
+@dataclass(frozen=True)
+class CqtKernel:
+    """Everything a ConstantQ needs, computed once per (sample rate, A4, octave range)
+
+    The highest octave is analyzed at sample_rate / 2 ** decimation_count. matrix is its sparse
+    (quartertones x fft_length // 2 + 1) spectral kernel, and lowpass the anti-aliasing filter
+    applied before every decimation by 2.
+    """
+
+    steps: np.ndarray  # absolute step of every bin, ascending
+    frequencies: np.ndarray  # center frequency (Hz) of every bin
+    octave_count: int
+    decimation_count: int  # decimations by 2 before the highest octave
+    fft_length: int
+    matrix: CsrMatrix
+    lowpass: np.ndarray
+
+
+def _top_octave_matrix(frequencies: np.ndarray, sample_rate: float) -> CsrMatrix:
+    """Return the sparse spectral kernel of windowed complex sinusoids, normalized so that a
+    sinusoid of amplitude 1 at the frequency of a bin has a magnitude of 1 in it"""
+    lengths = np.ceil(Q_FACTOR * sample_rate / frequencies).astype(np.int64)
+    fft_length = 1 << int(lengths.max() - 1).bit_length()
+    atoms = np.zeros((len(frequencies), fft_length), dtype=np.complex128)
+    for row, (frequency, length) in enumerate(zip(frequencies, lengths)):
+        window = np.hanning(length + 2)[1:-1]
+        times = np.arange(length) - length // 2
+        start = fft_length // 2 - length // 2  # centered in the frame
+        atoms[row, start : start + length] = (
+            2 * window / window.sum() * np.exp(2j * np.pi * frequency / sample_rate * times)
+        )
+    kernel = np.conj(np.fft.fft(atoms, axis=1))[:, : fft_length // 2 + 1] / fft_length
+    peaks = np.abs(kernel).max(axis=1, keepdims=True)
+    return CsrMatrix.from_dense(np.where(np.abs(kernel) >= KERNEL_SPARSITY * peaks, kernel, 0))
+
+
+def _lowpass(highest_frequency: float, sample_rate: float) -> np.ndarray:
+    """Return a half-band Blackman-windowed sinc, for the decimation of a signal of sample rate
+    2 * sample_rate: it passes the bins up to highest_frequency, and stops everything that would
+    alias into them"""
+    pass_edge = highest_frequency / 2 / sample_rate
+    half_length = int(np.ceil(5.5 / (0.5 - 2 * pass_edge) / 2))
+    taps = np.arange(-half_length, half_length + 1)
+    lowpass = np.sinc(taps / 2) * np.blackman(2 * half_length + 3)[1:-1]
+    lowpass[(taps % 2 == 0) & (taps != 0)] = 0.0  # exact zeros of the half-band sinc
+    return lowpass / lowpass.sum()
+
+
+@lru_cache(maxsize=CQT_KERNEL_CACHE_MAXSIZE)
+def _cqt_kernel(
+    sample_rate: int, a4_frequency_value: float, min_octave: int, max_octave: int
+) -> CqtKernel:
+    table = tuning_table(Frequency(a4_frequency_value))
+    first_step = TuningTable.step_of(0, min_octave)
+    last_step = TuningTable.step_of(QUARTERTONES_PER_OCTAVE - 1, max_octave)
+    steps = np.arange(first_step, last_step + 1)
+    steps.flags.writeable = False
+    frequencies = table.frequencies[steps]
+    if frequencies[-1] >= MAX_FREQUENCY_RATIO * sample_rate:
+        raise ValueError(
+            f"The highest bin ({frequencies[-1]:.1f} Hz) is too close to the Nyquist frequency"
+        )
+    decimation_count = 0
+    while frequencies[-1] < MAX_FREQUENCY_RATIO * sample_rate / 2 ** (decimation_count + 1):
+        decimation_count += 1
+    top_sample_rate = sample_rate / 2**decimation_count
+    matrix = _top_octave_matrix(frequencies[-QUARTERTONES_PER_OCTAVE:], top_sample_rate)
+    return CqtKernel(
+        steps,
+        frequencies,
+        max_octave - min_octave + 1,
+        decimation_count,
+        2 * (matrix.shape[1] - 1),
+        matrix,
+        _lowpass(frequencies[-1], top_sample_rate),
+    )
+
+
+def cqt_kernel(
+    sample_rate: int, a4_frequency: Frequency, min_octave: int, max_octave: int
+) -> CqtKernel:
+    """Return the shared CqtKernel of a sample rate, A4 reference and octave range (computed once,
+    then cached)"""
+    if not MIN_OCTAVE <= min_octave <= max_octave <= MAX_OCTAVE:
+        raise ValueError(f"Invalid octave range: [{min_octave}, {max_octave}]")
+    return _cqt_kernel(sample_rate, float(a4_frequency.value), min_octave, max_octave)
+
+
+@dataclass(slots=True)
+class _Level:
+    """The signal of one octave, at its (decimated) sample rate, and what is left to compute"""
+
+    start: int  # sample index of samples[0], negative for the zero padding before the signal
+    samples: np.ndarray
+    next_frame: int = 0
+    next_decimated: int = 0  # next sample of the level below
+    magnitudes: List[np.ndarray] = field(default_factory=list)
+
+    @property
+    def end(self) -> int:
+        """Sample index after the last sample"""
+        return self.start + len(self.samples)
+
+
+class ConstantQ:
+    """Streaming constant-Q transform on the quartertone grid of an A4 reference.
+
+    push() blocks of samples of any size, then flush() at the end: each returns the magnitudes of
+    the frames completed so far, as a (bins x frames) array, bins being kernel.steps. Frame t is
+    centered at t * hop_length samples, and there are ceil(samples / hop_length) frames.
+
+    hop_length must be a multiple of 2 ** (number of decimations), as octaves are decimated by 2.
+    Memory use is bounded by the block size, not the length of the signal.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        a4_frequency: Frequency,
+        min_octave: int = 1,
+        max_octave: int = 7,
+        hop_length: int = 512,
+    ):
+        self.kernel = cqt_kernel(sample_rate, a4_frequency, min_octave, max_octave)
+        self.hop_length = hop_length
+        level_count = self.kernel.decimation_count + self.kernel.octave_count
+        if hop_length <= 0 or hop_length % (1 << (level_count - 1)) != 0:
+            raise ValueError(
+                f"Hop length ({hop_length}) must be a multiple of {1 << (level_count - 1)}"
+            )
+        self.sample_count = 0
+        self.frame_count = 0
+        # levels[0] is the signal, and levels[decimation_count] the highest octave. Every level is
+        # padded with enough zeros for its frames, and the decimation filter of the level below,
+        # at the start of the signal
+        half_filter = len(self.kernel.lowpass) // 2
+        padding = [self.kernel.fft_length // 2]
+        for depth in reversed(range(level_count - 1)):
+            frame_padding = self.kernel.fft_length // 2 if self._analyzed(depth) else 0
+            padding.insert(0, max(frame_padding, 2 * padding[0] + half_filter))
+        self._levels = [_Level(-padding[0], np.zeros(padding[0]))]
+        self._levels += [_Level(-size, np.zeros(0)) for size in padding[1:]]
+        for level, size in zip(self._levels, padding[1:]):
+            level.next_decimated = -size
+
+    def _analyzed(self, depth: int) -> bool:
+        """Whether the level at depth is an octave, rather than a decimation of the signal"""
+        return depth >= self.kernel.decimation_count
+
+    @property
+    def steps(self) -> np.ndarray:
+        """Absolute step of every bin (row of the output)"""
+        return self.kernel.steps
+
+    def _decimate(self, level: _Level, lower: _Level):
+        """Append to lower every sample of level, low-pass filtered and decimated by 2, that can
+        be computed"""
+        half_filter = len(self.kernel.lowpass) // 2
+        last = (level.end - 1 - half_filter) // 2
+        if last < level.next_decimated:
+            return
+        first_index = 2 * level.next_decimated - half_filter - level.start
+        segment = level.samples[first_index : 2 * last + half_filter + 1 - level.start]
+        # polyphase: only the decimated outputs, filtering the even and odd samples separately
+        decimated = np.correlate(segment[::2], self.kernel.lowpass[::2], "valid")
+        decimated += np.correlate(segment[1::2], self.kernel.lowpass[1::2], "valid")
+        lower.samples = np.concatenate([lower.samples, decimated])
+        level.next_decimated = last + 1
+
+    def _analyze(self, level: _Level, hop_length: int):
+        """Compute the magnitudes of every frame of level that can be computed"""
+        fft_length = self.kernel.fft_length
+        last = (level.end - fft_length // 2) // hop_length
+        if last < level.next_frame:
+            return
+        first_index = level.next_frame * hop_length - fft_length // 2 - level.start
+        segment = level.samples[first_index : last * hop_length + fft_length // 2 - level.start]
+        frames = np.lib.stride_tricks.sliding_window_view(segment, fft_length)[::hop_length]
+        spectra = np.fft.rfft(frames, axis=1)
+        level.magnitudes.append(np.abs(self.kernel.matrix @ spectra.T))
+        level.next_frame = last + 1
+
+    def _advance(self) -> np.ndarray:
+        for depth, level in enumerate(self._levels):
+            keep_from = level.end
+            if self._analyzed(depth):
+                self._analyze(level, self.hop_length >> depth)
+                keep_from = level.next_frame * (self.hop_length >> depth)
+                keep_from -= self.kernel.fft_length // 2
+            if depth + 1 < len(self._levels):
+                self._decimate(level, self._levels[depth + 1])
+                keep_from = min(keep_from, 2 * level.next_decimated - len(self.kernel.lowpass) // 2)
+            level.samples = level.samples[keep_from - level.start :]
+            level.start = keep_from
+        # frames are complete when computed in all octaves; the lowest octave is the first row
+        octave_levels = self._levels[self.kernel.decimation_count :][::-1]
+        for level in octave_levels:
+            level.magnitudes = [
+                (
+                    np.concatenate(level.magnitudes, axis=1)
+                    if level.magnitudes
+                    else np.zeros((QUARTERTONES_PER_OCTAVE, 0))
+                )
+            ]
+        ready = min(level.magnitudes[0].shape[1] for level in octave_levels)
+        octaves = []
+        for level in octave_levels:
+            octaves.append(level.magnitudes[0][:, :ready])
+            level.magnitudes = [level.magnitudes[0][:, ready:]]
+        self.frame_count += ready
+        return np.concatenate(octaves, axis=0)
+
+    def push(self, samples: np.ndarray) -> np.ndarray:
+        """Add a block of (mono, float) samples, and return the (bins x frames) magnitudes of the
+        frames it completes"""
+        samples = np.asarray(samples, dtype=np.float64)
+        top = self._levels[0]
+        top.samples = np.concatenate([top.samples, samples])
+        self.sample_count += len(samples)
+        return self._advance()
+
+    def flush(self) -> np.ndarray:
+        """Return the magnitudes of the remaining frames, the signal being over (zero after)"""
+        total_frames = -(-self.sample_count // self.hop_length)
+        half_filter = len(self.kernel.lowpass) // 2
+        level_count = self.kernel.decimation_count + self.kernel.octave_count
+        padding = (self.kernel.fft_length // 2 + half_filter + 1) << level_count
+        magnitudes = self.push(np.zeros(padding))
+        self.sample_count -= padding
+        remaining = max(total_frames - (self.frame_count - magnitudes.shape[1]), 0)
+        self.frame_count = total_frames
+        return magnitudes[:, :remaining]
+
+    def transform(self, chunks: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """Yield the (bins x frames) magnitudes of a signal given in chunks, block by block"""
+        for chunk in chunks:
+            yield self.push(chunk)
+        yield self.flush()
+
+
+def quartertone_roll(
+    file_path: str,
+    a4_frequency: Frequency,
+    min_octave: int = 1,
+    max_octave: int = 7,
+    hop_length: int = 512,
+) -> np.ndarray:
+    """Return the (bins x frames) constant-Q magnitudes of a WAV file (mixed down to mono), bins
+    being the quartertones of octaves [min_octave, max_octave]. The file is streamed in chunks."""
+    transform = ConstantQ(
+        wav_info(file_path).sample_rate, a4_frequency, min_octave, max_octave, hop_length
+    )
+    return np.concatenate(list(transform.transform(read_wav_chunks(file_path))), axis=1)
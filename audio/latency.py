@@ -0,0 +1,77 @@
+"""Latency histograms, for instrumenting the stages of real-time processing"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+
+# Upper edges (milliseconds) of the histogram bins; the last bin is unbounded
+DEFAULT_BIN_EDGES_MS = (0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0)
+
+
+class LatencyHistogram:
+    """Counts of latencies in (logarithmic) bins, plus their exact count, total and maximum.
+
+    Recording a latency is O(log(bins)) with no allocation, so it can be called on every hop.
+    """
+
+    __slots__ = ("bin_edges_ms", "counts", "count", "total_ms", "max_ms")
+
+    def __init__(self, bin_edges_ms: Sequence[float] = DEFAULT_BIN_EDGES_MS):
+        self.bin_edges_ms = np.asarray(bin_edges_ms, dtype=np.float64)
+        if self.bin_edges_ms.ndim != 1 or np.any(np.diff(self.bin_edges_ms) <= 0):
+            raise ValueError("Bin edges must be strictly increasing")
+        self.counts = np.zeros(len(self.bin_edges_ms) + 1, dtype=np.int64)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, seconds: float):
+        """Add one latency, measured in seconds (e.g. a difference of time.perf_counter())"""
+        milliseconds = 1000.0 * seconds
+        self.counts[np.searchsorted(self.bin_edges_ms, milliseconds)] += 1
+        self.count += 1
+        self.total_ms += milliseconds
+        self.max_ms = max(self.max_ms, milliseconds)
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean latency in milliseconds"""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Return an upper bound (a bin edge, or the maximum) of the latency percentile in ms"""
+        if not 0 <= percent <= 100:
+            raise ValueError(f"Percent must be in [0, 100]: {percent}")
+        if self.count == 0:
+            return 0.0
+        bin_index = int(np.searchsorted(np.cumsum(self.counts), percent / 100 * self.count))
+        if bin_index >= len(self.bin_edges_ms):
+            return self.max_ms
+        return min(float(self.bin_edges_ms[bin_index]), self.max_ms)
+
+    def fraction_within(self, budget_ms: float) -> float:
+        """Return the fraction of latencies known to be within the budget (in ms).
+
+        NOTE: only bins entirely within the budget are counted, so the fraction is a lower bound,
+              exact when budget_ms is one of the bin edges.
+        """
+        if self.count == 0:
+            return 1.0
+        bin_count = int(np.searchsorted(self.bin_edges_ms, budget_ms, side="right"))
+        return float(self.counts[:bin_count].sum()) / self.count
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return a summary: count, mean, p50, p99 and max (in ms)"""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean_ms,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms,
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"n={self.count} mean={self.mean_ms:.3f} ms p50<={self.percentile(50):.3f} ms "
+            f"p99<={self.percentile(99):.3f} ms max={self.max_ms:.3f} ms"
+        )
@@ -0,0 +1,128 @@
+"""Quartertone note rolls of spectrograms, by one product with a cached bin-to-note matrix"""
+
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from audio.pitch import frame_signal
+from audio.sparse import CsrMatrix
+from audio.transcription import UNVOICED, NoteEvent, frequencies_to_steps
+from core.frequency import Frequency
+from core.note_names import STEP_COUNT, STEP_NAMES
+from core.notes import cached_note
+from core.tuning import tuning_table
+
+# Upper bound on the number of matrices (i.e. FFT sizes, sample rates and A4 references) cached
+BIN_NOTE_MATRIX_CACHE_MAXSIZE = 32
+
+
+@lru_cache(maxsize=BIN_NOTE_MATRIX_CACHE_MAXSIZE)
+def _bin_note_matrix(fft_length: int, sample_rate: int, a4_frequency_value: float) -> CsrMatrix:
+    bin_frequencies = np.fft.rfftfreq(fft_length, 1.0 / sample_rate)
+    steps = np.full(len(bin_frequencies), UNVOICED, dtype=np.int64)
+    table = tuning_table(Frequency(a4_frequency_value))
+    steps[1:] = frequencies_to_steps(bin_frequencies[1:], table)  # DC has no note
+    # built from the note of every bin, without a dense (STEP_COUNT x bins) matrix
+    mapped = np.flatnonzero(steps != UNVOICED)
+    rows = steps[mapped]
+    order = np.argsort(rows, kind="stable")
+    indptr = np.zeros(STEP_COUNT + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=STEP_COUNT), out=indptr[1:])
+    shape = (STEP_COUNT, len(bin_frequencies))
+    return CsrMatrix(np.ones(len(mapped)), mapped[order], indptr, shape)
+
+
+def bin_note_matrix(fft_length: int, sample_rate: int, a4_frequency: Frequency) -> CsrMatrix:
+    """Return the sparse (STEP_COUNT x fft_length // 2 + 1) matrix that sums every FFT bin into the
+    absolute step of the closest quartertone note to its frequency (computed once, then cached).
+
+    DC and bins out of the range of the tuning table belong to no note. Below a few hundred Hz
+    (depending on fft_length) bins are wider than quartertones, so some notes get no bin.
+    """
+    if fft_length <= 0 or sample_rate <= 0:
+        raise ValueError(f"Invalid FFT length ({fft_length}) or sample rate ({sample_rate})")
+    return _bin_note_matrix(fft_length, sample_rate, float(a4_frequency.value))
+
+
+def power_spectrogram(samples: np.ndarray, fft_length: int, hop_length: int) -> np.ndarray:
+    """Return the (bins x frames) power of the Hann-windowed STFT of samples, scaled so that a
+    sinusoid of amplitude A has a peak of A ** 2. Samples that do not fill a frame are left out."""
+    frames = frame_signal(np.asarray(samples, dtype=np.float64), fft_length, hop_length)
+    window = np.hanning(fft_length)
+    spectra = np.fft.rfft(frames * window, axis=1) / (window.sum() / 2)
+    return (spectra.real**2 + spectra.imag**2).T
+
+
+def power_spectrogram_chunks(
+    chunks: Iterable[np.ndarray], fft_length: int, hop_length: int
+) -> Iterator[np.ndarray]:
+    """Yield the power spectrogram (see power_spectrogram) of a stream of sample chunks, e.g. of
+    read_wav_chunks(), chunk by chunk. Only the samples of the last, incomplete, frame are carried
+    over to the next chunk."""
+    carry = np.empty(0)
+    for chunk in chunks:
+        samples = np.concatenate([carry, chunk])
+        spectrogram = power_spectrogram(samples, fft_length, hop_length)
+        carry = samples[spectrogram.shape[1] * hop_length :]
+        yield spectrogram
+
+
+def note_roll(spectrogram: np.ndarray, sample_rate: int, a4_frequency: Frequency) -> np.ndarray:
+    """Return the (STEP_COUNT x frames) note activations of a (bins x frames) power spectrogram of
+    a real signal (bins = fft_length // 2 + 1), i.e. the power of the bins of every note"""
+    spectrogram = np.asarray(spectrogram)
+    if spectrogram.ndim != 2 or spectrogram.shape[0] < 2:
+        raise ValueError(f"Expected a (bins x frames) spectrogram, got shape {spectrogram.shape}")
+    fft_length = 2 * (spectrogram.shape[0] - 1)
+    return bin_note_matrix(fft_length, sample_rate, a4_frequency) @ spectrogram
+
+
+def note_peaks(roll: np.ndarray) -> np.ndarray:
+    """Return a copy of a note roll with only the notes louder than their quartertone neighbours
+    in every frame, the others being zero (e.g. to drop the leakage of a note into its neighbours
+    before roll_to_events())"""
+    padded = np.pad(roll, ((1, 1), (0, 0)))
+    peaks = (roll > padded[:-2]) & (roll >= padded[2:])
+    return np.where(peaks, roll, 0.0)
+
+
+def roll_segments(
+    roll: np.ndarray, threshold: float, min_note_frames: int = 3
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the (steps, first frames, frame counts) of the runs of frames in which a note (row
+    of roll) is active, i.e. at or above threshold, for at least min_note_frames frames. Runs are
+    sorted by first frame, then step."""
+    active = np.zeros((roll.shape[0], roll.shape[1] + 2), dtype=np.int8)
+    active[:, 1:-1] = roll >= threshold
+    changes = np.diff(active, axis=1)
+    # np.nonzero is row-major, so the n-th start and the n-th end of a row belong together
+    steps, starts = np.nonzero(changes == 1)
+    ends = np.nonzero(changes == -1)[1]
+    frame_counts = ends - starts
+    kept = frame_counts >= min_note_frames
+    steps, starts, frame_counts = steps[kept], starts[kept], frame_counts[kept]
+    order = np.lexsort((steps, starts))
+    return steps[order], starts[order], frame_counts[order]
+
+
+def roll_to_events(
+    roll: np.ndarray,
+    a4_frequency: Frequency,
+    hop_seconds: float,
+    threshold: float,
+    min_note_frames: int = 3,
+) -> List[NoteEvent]:
+    """Return a NoteEvent for every run of active frames of a note roll (see roll_segments), the
+    rows of roll being absolute steps"""
+    if roll.shape[0] != STEP_COUNT:
+        raise ValueError(f"Expected {STEP_COUNT} rows (one per step), got {roll.shape[0]}")
+    steps, starts, frame_counts = roll_segments(roll, threshold, min_note_frames)
+    return [
+        NoteEvent(
+            cached_note(STEP_NAMES[step], a4_frequency),
+            start * hop_seconds,
+            frame_count * hop_seconds,
+        )
+        for step, start, frame_count in zip(steps.tolist(), starts.tolist(), frame_counts.tolist())
+    ]
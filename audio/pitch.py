@@ -0,0 +1,239 @@
+"""Vectorized, frame-wise pitch estimation"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+@dataclass(frozen=True, slots=True)
+class PitchSettings:
+    """Parameters of the pitch estimation
+
+    frame_length and hop_length are in samples.
+    A frame is voiced if its RMS is above silence_threshold, and its normalized autocorrelation at
+    the detected period is above voicing_threshold.
+    """
+
+    sample_rate: int
+    frame_length: int = 2048
+    hop_length: int = 512
+    min_frequency: float = 60.0
+    max_frequency: float = 2000.0
+    silence_threshold: float = 0.01
+    voicing_threshold: float = 0.5
+
+    def __post_init__(self):
+        if self.sample_rate <= 0:
+            raise ValueError(f"Sample rate must be positive: {self.sample_rate}")
+        if not 0 < self.hop_length <= self.frame_length:
+            raise ValueError("Hop length must be positive and not larger than frame length")
+        if not 0 < self.min_frequency < self.max_frequency <= self.sample_rate / 2:
+            raise ValueError("Frequency range must be within (0, sample_rate / 2]")
+        if self.sample_rate / self.min_frequency >= self.frame_length / 2:
+            raise ValueError("Frame must be longer than twice the period of the minimum frequency")
+
+
+def frame_signal(samples: np.ndarray, frame_length: int, hop_length: int) -> np.ndarray:
+    """Return a read-only (frames x frame_length) view of overlapping frames of samples.
+
+    Samples that do not fill a whole frame at the end are left out.
+    """
+    if len(samples) < frame_length:
+        return np.empty((0, frame_length), dtype=samples.dtype)
+    return sliding_window_view(samples, frame_length)[::hop_length]
+
+
+@lru_cache(maxsize=16)
+def _window_and_autocorrelation(frame_length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the Hann window and its normalized autocorrelation (lags 0 .. frame_length - 1)"""
+    window = np.hanning(frame_length + 2)[1:-1]  # without the zeros at both ends
+    spectrum = np.fft.rfft(window, n=2 * frame_length)
+    autocorrelation = np.fft.irfft(np.abs(spectrum) ** 2)[:frame_length]
+    autocorrelation /= autocorrelation[0]
+    window.flags.writeable = False
+    autocorrelation.flags.writeable = False
+    return window, autocorrelation
+
+
+def _normalized_autocorrelation(frames: np.ndarray) -> np.ndarray:
+    """Return the autocorrelation of each (Hann windowed) frame, as the inverse FFT of its power
+    spectrum, normalized by its energy and by the autocorrelation of the window itself."""
+    frame_length = frames.shape[1]
+    window, window_autocorrelation = _window_and_autocorrelation(frame_length)
+    windowed = (frames - frames.mean(axis=1, keepdims=True)) * window
+    spectrum = np.fft.rfft(windowed, n=2 * frame_length, axis=1)
+    autocorrelation = np.fft.irfft(np.abs(spectrum) ** 2, axis=1)[:, :frame_length]
+    scale = autocorrelation[:, :1] * window_autocorrelation
+    return np.divide(autocorrelation, scale, out=np.zeros_like(autocorrelation), where=scale > 0)
+
+
+def _period_lags(normalized: np.ndarray, min_lag: int, max_lag: int) -> np.ndarray:
+    """Return the lag (in samples) of the period of each frame, from its normalized autocorrelation
+
+    The period is the first lag, in [min_lag, max_lag] and past the main lobe around lag 0, whose
+    autocorrelation is close to the highest peak. This avoids picking a multiple of the period
+    (i.e. an octave below).
+    """
+    # the main lobe ends where the autocorrelation first goes negative
+    first_negative = np.argmax(normalized[:, : max_lag + 1] < 0, axis=1)
+    candidates = np.where(
+        np.arange(min_lag, max_lag + 1) >= first_negative[:, np.newaxis],
+        normalized[:, min_lag : max_lag + 1],
+        -np.inf,
+    )
+    peaks = np.max(candidates, axis=1, keepdims=True)
+    lags = min_lag + np.argmax(candidates >= 0.9 * peaks, axis=1)
+    # walk the found lags up to their local maximum, which is at most a few samples away
+    rows = np.arange(len(normalized))
+    for _ in range(max_lag - min_lag):
+        step_up = normalized[rows, np.minimum(lags + 1, max_lag)] > normalized[rows, lags]
+        if not np.any(step_up):
+            break
+        lags = lags + step_up
+    return lags
+
+
+def _interpolate_peaks(normalized: np.ndarray, lags: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the (sub-sample) lags and values of the autocorrelation peaks around the given lags,
+    by parabolic interpolation"""
+    rows = np.arange(len(normalized))
+    previous, peak, following = (normalized[rows, lags + offset] for offset in (-1, 0, 1))
+    curvature = previous - 2 * peak + following
+    shift = np.divide(
+        previous - following, 2 * curvature, out=np.zeros_like(peak), where=curvature < 0
+    )
+    return lags + np.clip(shift, -0.5, 0.5), peak
+
+
+@dataclass(frozen=True, slots=True)
+class _FrameBuffers:
+    """Preallocated arrays of FramePitchEstimator"""
+
+    padded: np.ndarray  # windowed frame, zero padded to twice the frame (linear autocorrelation)
+    spectra: np.ndarray  # spectrum of the windowed frame, and its conjugate
+    autocorrelation: np.ndarray
+    scale: np.ndarray
+    positive: np.ndarray
+    normalized: np.ndarray
+    mask: np.ndarray
+
+    @classmethod
+    def allocate(cls, frame_length: int, max_lag: int) -> "_FrameBuffers":
+        """Allocate the buffers of frames of frame_length samples"""
+        return cls(
+            padded=np.zeros(2 * frame_length),
+            spectra=np.zeros((2, frame_length + 1), dtype=np.complex128),
+            autocorrelation=np.zeros(2 * frame_length),
+            scale=np.zeros(frame_length),
+            positive=np.zeros(frame_length, dtype=bool),
+            normalized=np.zeros(frame_length),
+            mask=np.zeros(max_lag + 1, dtype=bool),
+        )
+
+
+class FramePitchEstimator:
+    """Pitch of one frame at a time, with the same algorithm as estimate_pitch(), in buffers that
+    are allocated once (e.g. for a real-time tuner analyzing the latest frame on every hop).
+
+    window() removes the mean of a frame and applies the Hann window, estimate() returns the
+    (frequency, confidence) of the last windowed frame. Every intermediate array (windowed frame,
+    spectrum, autocorrelation, masks) is computed into its preallocated buffer with out=.
+    """
+
+    def __init__(self, settings: PitchSettings):
+        frame_length = settings.frame_length
+        self.settings = settings
+        self._window, self._window_autocorrelation = _window_and_autocorrelation(frame_length)
+        self._lag_range = (
+            max(int(settings.sample_rate / settings.max_frequency), 1),
+            min(int(np.ceil(settings.sample_rate / settings.min_frequency)), frame_length // 2),
+        )
+        self._buffers = _FrameBuffers.allocate(frame_length, self._lag_range[1])
+        self._rms = 0.0
+
+    def window(self, frame: np.ndarray):
+        """Remove the mean of a frame (of frame_length samples) and apply the window"""
+        frame_length = self.settings.frame_length
+        if frame.shape != (frame_length,):
+            raise ValueError(f"Expected a frame of {frame_length} samples, got {frame.shape}")
+        windowed = self._buffers.padded[:frame_length]
+        np.subtract(frame, frame.mean(), out=windowed)
+        self._rms = math.sqrt(float(np.dot(frame, frame)) / frame_length)
+        np.multiply(windowed, self._window, out=windowed)
+
+    def _normalize(self) -> np.ndarray:
+        """Normalized autocorrelation of the windowed frame (see _normalized_autocorrelation)"""
+        frame_length = self.settings.frame_length
+        buffers = self._buffers
+        spectrum, conjugate = buffers.spectra
+        np.fft.rfft(buffers.padded, out=spectrum)
+        np.conjugate(spectrum, out=conjugate)
+        np.multiply(spectrum, conjugate, out=spectrum)  # power spectrum
+        np.fft.irfft(spectrum, n=2 * frame_length, out=buffers.autocorrelation)
+        autocorrelation = buffers.autocorrelation[:frame_length]
+        np.multiply(self._window_autocorrelation, autocorrelation[0], out=buffers.scale)
+        np.greater(buffers.scale, 0, out=buffers.positive)
+        buffers.normalized.fill(0.0)
+        np.divide(autocorrelation, buffers.scale, out=buffers.normalized, where=buffers.positive)
+        return buffers.normalized
+
+    def _period_lag(self, normalized: np.ndarray) -> int:
+        """Lag of the period of the frame (see _period_lags)"""
+        min_lag, max_lag = self._lag_range
+        mask = self._buffers.mask
+        np.less(normalized[: max_lag + 1], 0, out=mask)
+        start = max(min_lag, int(np.argmax(mask)))
+        candidates = normalized[start : max_lag + 1]
+        near_peak = mask[: len(candidates)]
+        np.greater_equal(candidates, 0.9 * candidates.max(), out=near_peak)
+        index = int(np.argmax(near_peak))
+        if not near_peak[index]:
+            return min_lag
+        lag = start + index
+        while lag < max_lag and normalized[lag + 1] > normalized[lag]:
+            lag += 1
+        return lag
+
+    def estimate(self) -> Tuple[float, float]:
+        """Return (frequency in Hz, voicing confidence in [0, 1]) of the last windowed frame.
+
+        The frequency of an unvoiced frame is NaN.
+        """
+        normalized = self._normalize()
+        lag = self._period_lag(normalized)
+        previous, peak, following = (float(value) for value in normalized[lag - 1 : lag + 2])
+        curvature = previous - 2 * peak + following
+        shift = (previous - following) / (2 * curvature) if curvature < 0 else 0.0
+        frequency = self.settings.sample_rate / (lag + min(max(shift, -0.5), 0.5))
+        confidence = min(max(peak, 0.0), 1.0)
+        voiced = (
+            self._rms > self.settings.silence_threshold
+            and confidence > self.settings.voicing_threshold
+        )
+        return (frequency if voiced else math.nan), confidence
+
+
+def estimate_pitch(frames: np.ndarray, settings: PitchSettings) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (frequencies in Hz, voicing confidence in [0, 1]) of every frame.
+
+    Frequencies of unvoiced frames are NaN. All frames are processed at once: the period of each
+    frame is found on its autocorrelation (computed with FFT), then refined with a parabolic
+    interpolation around the peak, for sub-sample precision.
+    """
+    normalized = _normalized_autocorrelation(frames)
+    min_lag = max(int(settings.sample_rate / settings.max_frequency), 1)
+    max_lag = min(int(np.ceil(settings.sample_rate / settings.min_frequency)), frames.shape[1] // 2)
+    lags = _period_lags(normalized, min_lag, max_lag)
+
+    periods, peaks = _interpolate_peaks(normalized, lags)
+    frequencies = settings.sample_rate / periods
+
+    confidence = np.clip(peaks, 0.0, 1.0)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    voiced = (rms > settings.silence_threshold) & (confidence > settings.voicing_threshold)
+    frequencies[~voiced] = np.nan
+    return frequencies, confidence
@@ -0,0 +1,138 @@
+"""Karplus-Strong plucked-string synthesis, vectorized over blocks of samples and over voices"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, Sequence, Union
+
+import numpy as np
+
+from audio.synthesis import DEFAULT_BLOCK_SIZE
+from core.notes import Note
+
+# Fade out (seconds) of a voice at the end of its duration, to avoid clicks
+_RELEASE = 0.01
+
+
+@dataclass(frozen=True, slots=True)
+class Pluck:
+    """How strings are plucked and ring: decay_seconds is the time for a voice to decay by 60 dB,
+    the same for every pitch. The excitation is a burst of uniform noise (seeded) of amplitude."""
+
+    decay_seconds: float = 2.0
+    amplitude: float = 0.3
+    seed: int = 0
+
+
+class PluckedStrings:
+    """Plucked strings (voices), each starting at an onset and ringing for a duration.
+
+    Every voice is a Karplus-Strong delay line whose loop filter is the average of two samples
+    (0.5 sample of delay) combined with a linear interpolation (the fractional part of the delay).
+    The filter taps are at least N samples back, N being the integer part of the delay, so a run
+    of up to N samples only depends on samples already computed: the delay lines are run in
+    sub-blocks of min(N) samples, for all sounding voices at once.
+
+    NOTE: the voices are stateful, so blocks() can be iterated only once.
+    """
+
+    def __init__(
+        self,
+        frequencies: Union[Sequence[float], np.ndarray],
+        onsets: Union[Sequence[float], np.ndarray],
+        duration: Union[float, Sequence[float], np.ndarray],
+        sample_rate: int = 44100,
+        pluck: Pluck = Pluck(),
+    ):
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        onsets = np.asarray(onsets, dtype=np.float64)
+        if frequencies.ndim != 1 or frequencies.shape != onsets.shape:
+            raise ValueError("frequencies and onsets must be 1D arrays of the same length")
+        if np.any(frequencies <= 0) or np.any(frequencies >= sample_rate / 4):
+            raise ValueError("Frequencies must be positive and below a quarter of the sample rate")
+        if np.any(onsets < 0) or np.any(np.asarray(duration) <= 0):
+            raise ValueError("Onsets must not be negative, and durations must be positive")
+        self.sample_rate = sample_rate
+        periods = sample_rate / frequencies
+        self._delays = np.floor(periods - 0.5).astype(np.int64)
+        fractions = periods - 0.5 - self._delays
+        # loop filter: [0.5, 0.5] convolved with [1 - fraction, fraction], at delays N, N+1, N+2
+        gains = 10.0 ** (-3.0 / (pluck.decay_seconds * frequencies))
+        self._taps = gains[:, np.newaxis] * np.stack(
+            [0.5 * (1 - fractions), np.full_like(fractions, 0.5), 0.5 * fractions], axis=1
+        )
+        self._onsets = np.round(onsets * sample_rate).astype(np.int64)
+        durations = np.broadcast_to(np.asarray(duration, dtype=np.float64), onsets.shape)
+        self._ends = self._onsets + np.round(durations * sample_rate).astype(np.int64)
+        history = int(self._delays.max(initial=0)) + 2
+        # excitation: a burst of (zero mean) noise, one period long
+        noise = np.random.default_rng(pluck.seed).uniform(-1, 1, (len(frequencies), history))
+        self._excitation = pluck.amplitude * (noise - noise.mean(axis=1, keepdims=True))
+        # last samples of every delay line (the latest at the end)
+        self._lines = np.zeros((len(frequencies), history), dtype=np.float64)
+
+    @property
+    def length(self) -> int:
+        """Total number of samples, until the end of the last voice"""
+        return int(self._ends.max(initial=0))
+
+    def _excite(self, voices: np.ndarray, times: np.ndarray) -> np.ndarray:
+        """Return the excitation of voices at (voices x samples) times counted from their onsets,
+        zero outside of the burst"""
+        burst = (times >= 0) & (times <= self._delays[voices][:, np.newaxis])
+        times = np.clip(times, 0, self._excitation.shape[1] - 1)
+        return np.where(burst, self._excitation[voices[:, np.newaxis], times], 0.0)
+
+    def _run(self, voices: np.ndarray, start: int, stop: int) -> np.ndarray:
+        """Run the delay lines of voices over [start, stop), and return their (voices x samples)
+        outputs"""
+        size, history = stop - start, self._lines.shape[1]
+        lines = np.concatenate([self._lines[voices], np.zeros((len(voices), size))], axis=1)
+        rows = np.arange(len(voices))[:, np.newaxis]
+        delays = self._delays[voices][:, np.newaxis]
+        taps = self._taps[voices]
+        onsets = self._onsets[voices][:, np.newaxis]
+        sub_block = int(delays.min())
+        for sub_start in range(0, size, sub_block):
+            positions = history + sub_start + np.arange(min(sub_block, size - sub_start))
+            lines[:, positions] = self._excite(voices, start + positions - history - onsets) + sum(
+                taps[:, tap, np.newaxis] * lines[rows, positions - delays - tap] for tap in range(3)
+            )
+        self._lines[voices] = lines[:, -history:]
+        return lines[:, history:]
+
+    def render(self, start: int, stop: int) -> np.ndarray:
+        """Return the mixed samples in [start, stop). Blocks must be rendered in order."""
+        block = np.zeros(stop - start, dtype=np.float64)
+        voices = np.flatnonzero((self._onsets < stop) & (self._ends > start))
+        if len(voices) == 0:
+            return block
+        outputs = self._run(voices, start, stop)
+        # gate: fade out at the end of every voice
+        remaining = self._ends[voices][:, np.newaxis] - np.arange(start, stop)
+        gate = np.clip(remaining / max(_RELEASE * self.sample_rate, 1.0), 0.0, 1.0)
+        return block + (outputs * gate).sum(axis=0)
+
+    def blocks(self, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[np.ndarray]:
+        """Yield the whole mixed signal in blocks of block_size samples (the last may be shorter)"""
+        if block_size <= 0:
+            raise ValueError(f"Block size must be positive: {block_size}")
+        for start in range(0, self.length, block_size):
+            yield self.render(start, min(start + block_size, self.length))
+
+
+def fret_sweep(
+    strings: Sequence[Dict[int, Note]],
+    note_interval: float = 0.5,
+    ring_duration: float = 1.5,
+    **kwargs,
+) -> PluckedStrings:
+    """Return the plucks of all frets of the strings (e.g. of tar_string()), fret by fret from the
+    open string up, every note_interval seconds. The strings are swept at the same time.
+
+    kwargs are passed to PluckedStrings (i.e. sample_rate and pluck).
+    """
+    frequencies, onsets = [], []
+    for string in strings:
+        for position, note in enumerate(string.values()):
+            frequencies.append(note.frequency.value)
+            onsets.append(position * note_interval)
+    return PluckedStrings(frequencies, onsets, ring_duration, **kwargs)
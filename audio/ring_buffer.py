@@ -0,0 +1,49 @@
+"""Preallocated ring buffer of audio samples"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """The last `capacity` samples of a stream, in a buffer allocated once.
+
+    Every sample is stored twice, capacity apart, so the latest samples are always contiguous
+    and latest() returns a view (no copy, no allocation).
+    """
+
+    __slots__ = ("capacity", "_buffer", "_position", "_count")
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive: {capacity}")
+        self.capacity = capacity
+        self._buffer = np.zeros(2 * capacity, dtype=np.float64)
+        self._position = 0  # where the next sample is written, in [0, capacity)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of valid samples, at most capacity"""
+        return min(self._count, self.capacity)
+
+    def write(self, samples: np.ndarray):
+        """Append samples, overwriting the oldest ones"""
+        samples = samples[-self.capacity :]
+        size = len(samples)
+        first = min(size, self.capacity - self._position)
+        for offset in (0, self.capacity):
+            start = self._position + offset
+            self._buffer[start : start + first] = samples[:first]
+        # the part that wraps around: at the start of both halves
+        wrapped = samples[first:]
+        self._buffer[: len(wrapped)] = wrapped
+        self._buffer[self.capacity : self.capacity + len(wrapped)] = wrapped
+        self._position = (self._position + size) % self.capacity
+        self._count += size
+
+    def latest(self, size: int) -> np.ndarray:
+        """Return a read-only view of the latest `size` samples, oldest first"""
+        if not 0 < size <= len(self):
+            raise ValueError(f"Only {len(self)} samples are available, requested: {size}")
+        end = self._position + self.capacity
+        view = self._buffer[end - size : end]
+        view.flags.writeable = False
+        return view
@@ -0,0 +1,79 @@
+"""Compressed sparse row (CSR) matrices, with NumPy only"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+class CsrMatrix:
+    """A (rows x columns) sparse matrix: the non-zero values of row i are data[indptr[i]:
+    indptr[i + 1]], in the columns indices[indptr[i]:indptr[i + 1]].
+
+    Only what the spectral kernels of this package need: building from a dense matrix, and
+    multiplying a dense matrix (or vector) on the right, i.e. matrix @ dense. The matrix keeps
+    read-only copies of the arrays it is built from.
+    """
+
+    __slots__ = ("data", "indices", "indptr", "shape")
+
+    def __init__(
+        self, data: np.ndarray, indices: np.ndarray, indptr: np.ndarray, shape: Tuple[int, int]
+    ):
+        data = np.array(data)
+        indices = np.array(indices, dtype=np.int64)
+        indptr = np.array(indptr, dtype=np.int64)
+        if len(indptr) != shape[0] + 1 or len(data) != len(indices) or indptr[-1] != len(data):
+            raise ValueError("Inconsistent CSR arrays")
+        if np.any(np.diff(indptr) < 0) or np.any((indices < 0) | (indices >= shape[1])):
+            raise ValueError("Invalid CSR row pointers or column indices")
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.shape = shape
+        for array in (data, indices, indptr):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_dense(cls, dense: np.ndarray, threshold: float = 0.0) -> "CsrMatrix":
+        """Return the sparse form of a 2D matrix, keeping the values of magnitude above threshold"""
+        dense = np.asarray(dense)
+        if dense.ndim != 2:
+            raise ValueError(f"Expected a 2D matrix, got {dense.ndim}D")
+        rows, columns = np.nonzero(np.abs(dense) > threshold)
+        indptr = np.zeros(dense.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=dense.shape[0]), out=indptr[1:])
+        return cls(dense[rows, columns], columns, indptr, dense.shape)
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored values"""
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        return f"CsrMatrix({self.shape[0]}x{self.shape[1]}, {self.nnz} values)"
+
+    def to_dense(self) -> np.ndarray:
+        """Return the matrix as a dense array"""
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        dense[rows, self.indices] = self.data
+        return dense
+
+    def __matmul__(self, other: np.ndarray) -> np.ndarray:
+        """Return self @ other, for other a vector of, or a matrix of rows, self.shape[1] long.
+
+        Every row is the sum, by np.add.reduceat(), of the products of its values with the rows of
+        other at its columns, so the cost is nnz rows of other, not rows x columns.
+        """
+        other = np.asarray(other)
+        if other.ndim not in (1, 2) or len(other) != self.shape[1]:
+            raise ValueError(f"Can not multiply {self!r} by an array of shape {other.shape}")
+        data = self.data if other.ndim == 1 else self.data[:, np.newaxis]
+        result_dtype = np.result_type(self.data, other)
+        result = np.zeros((self.shape[0],) + other.shape[1:], dtype=result_dtype)
+        if self.nnz == 0:
+            return result
+        products = data * other[self.indices]
+        filled = np.flatnonzero(np.diff(self.indptr))
+        result[filled] = np.add.reduceat(products, self.indptr[filled], axis=0)
+        return result
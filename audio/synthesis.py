@@ -0,0 +1,174 @@
+"""Vectorized additive synthesis of note sequences"""
+
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, Optional, Protocol, Sequence, Tuple, Union
+
+import numpy as np
+
+from audio.transcription import ThroughputStats
+from audio.wav_writer import WavWriter
+from core.notes import Note
+
+# Number of points of one period of a wavetable
+WAVETABLE_SIZE = 2048
+# Upper bound on the number of wavetables (i.e. distinct frequencies and timbres) kept in cache
+WAVETABLE_CACHE_MAXSIZE = 512
+DEFAULT_BLOCK_SIZE = 65536
+
+
+@dataclass(frozen=True, slots=True)
+class Timbre:
+    """Relative amplitudes of the harmonics (the first is the fundamental), and linear attack and
+    release times in seconds"""
+
+    harmonic_amplitudes: Tuple[float, ...] = (1.0, 0.5, 0.3, 0.2, 0.1)
+    attack: float = 0.01
+    release: float = 0.05
+
+
+@lru_cache(maxsize=WAVETABLE_CACHE_MAXSIZE)
+def _wavetable(frequency_value: float, sample_rate: int, timbre: Timbre) -> np.ndarray:
+    harmonics = np.arange(1, len(timbre.harmonic_amplitudes) + 1)
+    # band-limited: harmonics at or above Nyquist would alias
+    audible = harmonics * frequency_value < sample_rate / 2
+    amplitudes = np.asarray(timbre.harmonic_amplitudes)[audible]
+    phases = 2 * np.pi * np.arange(WAVETABLE_SIZE + 1) / WAVETABLE_SIZE  # +1 to interpolate
+    table = amplitudes @ np.sin(np.outer(harmonics[audible], phases))
+    table /= max(np.max(np.abs(table)), np.finfo(float).tiny)
+    table.flags.writeable = False
+    return table
+
+
+def wavetable(frequency_value: float, sample_rate: int, timbre: Timbre) -> np.ndarray:
+    """Return one period (WAVETABLE_SIZE + 1 points, the last equal to the first) of the waveform
+    of a timbre at a frequency, normalized to a peak of 1.
+
+    Harmonics above Nyquist are left out, so the table depends on the frequency. Tables are
+    computed once per (frequency, sample rate, timbre) and cached.
+    """
+    return _wavetable(float(frequency_value), sample_rate, timbre)
+
+
+def _oscillate(
+    frequency_value: float, sample_rate: int, timbre: Timbre, sample_indices: np.ndarray
+) -> np.ndarray:
+    """Return the waveform at sample indices (counted from the note onset), by linear
+    interpolation in the wavetable"""
+    table = wavetable(frequency_value, sample_rate, timbre)
+    position = (sample_indices * (frequency_value / sample_rate) % 1.0) * WAVETABLE_SIZE
+    index = position.astype(np.int64)
+    fraction = position - index
+    return table[index] + fraction * (table[index + 1] - table[index])
+
+
+def _envelope(sample_indices: np.ndarray, length: int, sample_rate: int, timbre: Timbre):
+    attack = max(timbre.attack * sample_rate, 1.0)
+    release = max(timbre.release * sample_rate, 1.0)
+    return np.minimum(
+        np.minimum(sample_indices / attack, (length - sample_indices) / release), 1.0
+    ).clip(0.0, 1.0)
+
+
+class Synthesizer:
+    """Render a sequence of notes, each held for a duration, one after another.
+
+    A None note is a rest. Samples are produced in blocks (see blocks()); each block only touches
+    the few notes sounding in it, and every note is rendered with array operations.
+    """
+
+    def __init__(
+        self,
+        notes: Sequence[Optional[Note]],
+        durations: Union[float, Sequence[float]],
+        sample_rate: int = 44100,
+        timbre: Timbre = Timbre(),
+        amplitude: float = 0.5,
+    ):
+        note_durations = np.broadcast_to(np.asarray(durations, dtype=np.float64), (len(notes),))
+        if np.any(note_durations < 0):
+            raise ValueError("Durations must not be negative")
+        if sample_rate <= 0:
+            raise ValueError(f"Sample rate must be positive: {sample_rate}")
+        self.sample_rate = sample_rate
+        self.timbre = timbre
+        self.amplitude = amplitude
+        self._frequencies = [None if note is None else note.frequency.value for note in notes]
+        # sample index of each onset, and of the end of the sequence
+        self._boundaries = np.concatenate(
+            [[0], np.round(np.cumsum(note_durations) * sample_rate).astype(np.int64)]
+        )
+
+    @property
+    def length(self) -> int:
+        """Total number of samples"""
+        return int(self._boundaries[-1])
+
+    def render(self, start: int, stop: int) -> np.ndarray:
+        """Return the samples in [start, stop)"""
+        block = np.zeros(max(stop - start, 0), dtype=np.float64)
+        first = int(np.searchsorted(self._boundaries, start, side="right")) - 1
+        last = int(np.searchsorted(self._boundaries, stop, side="left"))
+        for note_index in range(max(first, 0), min(last, len(self._frequencies))):
+            frequency_value = self._frequencies[note_index]
+            onset, end = self._boundaries[note_index], self._boundaries[note_index + 1]
+            if frequency_value is None or end <= onset:
+                continue
+            segment_start, segment_stop = max(onset, start), min(end, stop)
+            sample_indices = np.arange(segment_start - onset, segment_stop - onset, dtype=np.int64)
+            block[segment_start - start : segment_stop - start] = _oscillate(
+                frequency_value, self.sample_rate, self.timbre, sample_indices
+            ) * _envelope(sample_indices, end - onset, self.sample_rate, self.timbre)
+        return self.amplitude * block
+
+    def blocks(self, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[np.ndarray]:
+        """Yield the whole signal in blocks of block_size samples (the last may be shorter)"""
+        if block_size <= 0:
+            raise ValueError(f"Block size must be positive: {block_size}")
+        for start in range(0, self.length, block_size):
+            yield self.render(start, min(start + block_size, self.length))
+
+
+def synthesize(
+    notes: Sequence[Optional[Note]],
+    durations: Union[float, Sequence[float]],
+    sample_rate: int = 44100,
+    timbre: Timbre = Timbre(),
+) -> np.ndarray:
+    """Return the whole rendered signal of a sequence of notes (see Synthesizer)"""
+    synthesizer = Synthesizer(notes, durations, sample_rate, timbre)
+    return synthesizer.render(0, synthesizer.length)
+
+
+class BlockRenderer(Protocol):
+    """A signal rendered block by block (e.g. Synthesizer)"""
+
+    sample_rate: int
+
+    @property
+    def length(self) -> int:
+        """Total number of samples"""
+
+    def blocks(self, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[np.ndarray]:
+        """Yield the whole signal in blocks of block_size samples"""
+
+
+def render_to_wav(
+    file_path: str, synthesizer: BlockRenderer, block_size: int = DEFAULT_BLOCK_SIZE
+) -> ThroughputStats:
+    """Stream the signal of a synthesizer (or any BlockRenderer) to a 16-bit WAV file, one block at
+    a time.
+
+    Return the throughput of the rendering (frame_count is the number of samples), including the
+    time to write the file.
+    """
+    stats = ThroughputStats()
+    start_time = time.perf_counter()
+    with WavWriter(file_path, synthesizer.sample_rate) as writer:
+        for block in synthesizer.blocks(block_size):
+            writer.write(block)
+            stats.frame_count += len(block)
+    stats.audio_seconds = stats.frame_count / synthesizer.sample_rate
+    stats.elapsed_seconds = time.perf_counter() - start_time
+    return stats
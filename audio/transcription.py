@@ -0,0 +1,133 @@
+"""Streaming transcription of audio into quartertone note events"""
+
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from audio.pitch import PitchSettings, estimate_pitch, frame_signal
+from core.frequency import Frequency
+from core.note_names import STEP_NAMES
+from core.notes import Note, cached_note
+from core.tuning import TuningTable, tuning_table
+
+# Step of frames with no (or an out of range) pitch
+UNVOICED = -1
+
+
+@dataclass(frozen=True, slots=True)
+class NoteEvent:
+    """A note sounding from onset, for duration (both in seconds)"""
+
+    note: Note
+    onset: float
+    duration: float
+
+
+@dataclass(slots=True)
+class ThroughputStats:
+    """Amount of audio processed by a pipeline, and the time it took (excluding the consumer)"""
+
+    frame_count: int = 0
+    audio_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def frames_per_second(self) -> float:
+        """Number of pitch frames processed per second"""
+        return self.frame_count / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def realtime_factor(self) -> float:
+        """Seconds of audio processed per second, e.g. 10 means ten times faster than real-time"""
+        return self.audio_seconds / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.frame_count} frames in {self.elapsed_seconds:.3f} s: "
+            f"{self.frames_per_second:.0f} frames/s, {self.realtime_factor:.1f}x real-time"
+        )
+
+
+def frequencies_to_steps(frequencies: np.ndarray, table: TuningTable) -> np.ndarray:
+    """Return the absolute step of the closest note to each frequency, i.e. a batch form of
+    frequency_to_note(). NaN frequencies, and those out of the range of the table, are UNVOICED.
+    """
+    lowest, highest = table.frequencies[0], table.frequencies[-1]
+    valid = (frequencies >= lowest) & (frequencies <= highest)  # False for NaN
+    steps = np.full(frequencies.shape, UNVOICED, dtype=np.int64)
+    steps[valid] = table.nearest_steps(frequencies[valid])
+    return steps
+
+
+class NoteSegmenter:
+    """Turn a stream of frame-wise steps (see frequencies_to_steps) into NoteEvents
+
+    A note starts when the step of the frames changes. Notes lasting less than min_note_frames
+    frames, and runs of UNVOICED frames, yield no event. Only the current run is kept in memory.
+    """
+
+    def __init__(self, a4_frequency: Frequency, hop_seconds: float, min_note_frames: int = 3):
+        self.a4_frequency = a4_frequency
+        self.hop_seconds = hop_seconds
+        self.min_note_frames = min_note_frames
+        self.frame_count = 0
+        self._run_step = UNVOICED
+        self._run_start = 0
+
+    def _end_run(self, end_frame: int) -> List[NoteEvent]:
+        frame_count = end_frame - self._run_start
+        if self._run_step == UNVOICED or frame_count < self.min_note_frames:
+            return []
+        note = cached_note(STEP_NAMES[self._run_step], self.a4_frequency)
+        return [NoteEvent(note, self._run_start * self.hop_seconds, frame_count * self.hop_seconds)]
+
+    def push(self, steps: np.ndarray) -> List[NoteEvent]:
+        """Consume the steps of the next frames, and return the events of the notes they ended"""
+        events = []
+        previous_steps = np.concatenate([[self._run_step], steps[:-1]])
+        for frame in np.flatnonzero(steps != previous_steps).tolist():
+            events += self._end_run(self.frame_count + frame)
+            self._run_step, self._run_start = int(steps[frame]), self.frame_count + frame
+        self.frame_count += len(steps)
+        return events
+
+    def flush(self) -> List[NoteEvent]:
+        """End the stream, and return the event of the last note (if any)"""
+        events = self._end_run(self.frame_count)
+        self._run_step, self._run_start = UNVOICED, self.frame_count
+        return events
+
+
+def transcribe(
+    chunks: Iterable[np.ndarray],
+    settings: PitchSettings,
+    a4_frequency: Frequency,
+    min_note_frames: int = 3,
+    stats: Optional[ThroughputStats] = None,
+) -> Iterator[NoteEvent]:
+    """Yield a NoteEvent for every note in a stream of mono sample chunks (e.g. read_wav_chunks)
+
+    Memory use is bounded by the chunk size: only the samples of the last, incomplete, frame are
+    carried over to the next chunk. See NoteSegmenter for when a note starts and ends.
+    If stats is given, it is updated as the chunks are processed.
+    """
+    stats = ThroughputStats() if stats is None else stats
+    table = tuning_table(a4_frequency)
+    segmenter = NoteSegmenter(
+        a4_frequency, settings.hop_length / settings.sample_rate, min_note_frames
+    )
+    carry = np.empty(0)
+    for chunk in chunks:
+        start_time = time.perf_counter()
+        samples = np.concatenate([carry, chunk])
+        frames = frame_signal(samples, settings.frame_length, settings.hop_length)
+        carry = samples[len(frames) * settings.hop_length :]
+        frequencies, _ = estimate_pitch(frames, settings)
+        events = segmenter.push(frequencies_to_steps(frequencies, table))
+        stats.frame_count += len(frames)
+        stats.audio_seconds += len(chunk) / settings.sample_rate
+        stats.elapsed_seconds += time.perf_counter() - start_time
+        yield from events
+    yield from segmenter.flush()
@@ -0,0 +1,115 @@
+"""Real-time tuner: nearest quartertone note and cents offset of every hop of a PCM stream"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional
+
+import numpy as np
+
+from audio.latency import LatencyHistogram
+from audio.pitch import FramePitchEstimator, PitchSettings
+from audio.ring_buffer import RingBuffer
+from audio.wav_reader import pcm_to_float
+from core.frequency import Frequency
+from core.intervals import CENTS_PER_OCTAVE
+from core.notes import Note, frequency_to_note
+from core.tuning import tuning_table
+
+# Instrumented stages of every hop. "analysis" is the sum of window, estimate and snap, i.e. the
+# processing that has to fit in the latency budget ("read" includes waiting for a live source).
+STAGES = ("read", "window", "estimate", "snap", "analysis")
+
+
+@dataclass(frozen=True, slots=True)
+class TunerReading:
+    """Pitch of the latest frame: time (seconds from the start of the stream, at the end of the
+    frame), frequency (Hz), nearest note and cents offset from it (positive means sharp).
+
+    For unvoiced frames, note is None, and frequency and cents are NaN.
+    """
+
+    time: float
+    frequency: float
+    note: Optional[Note]
+    cents: float
+
+    def __str__(self) -> str:
+        if self.note is None:
+            return f"{self.time:.3f}\t-"
+        return f"{self.time:.3f}\t{self.note.name}\t{self.cents:+.1f} cents"
+
+
+class Tuner:
+    """Analyze the latest frame of a stream, on every hop.
+
+    Samples go to a ring buffer of one frame, and the latest frame is windowed and analyzed in the
+    preallocated buffers of a FramePitchEstimator, so no array is allocated per hop. Latency of
+    every stage (see STAGES) is kept in a histogram.
+    """
+
+    def __init__(self, settings: PitchSettings, a4_frequency: Frequency):
+        self.settings = settings
+        self.a4_frequency = a4_frequency
+        self.latency: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in STAGES}
+        self._buffer = RingBuffer(settings.frame_length)
+        self._estimator = FramePitchEstimator(settings)
+        self._sample_count = 0
+        table = tuning_table(a4_frequency)
+        self._frequency_range = (float(table.frequencies[0]), float(table.frequencies[-1]))
+
+    def _snap(self, frequency: float) -> TunerReading:
+        reading_time = self._sample_count / self.settings.sample_rate
+        lowest, highest = self._frequency_range
+        if not lowest <= frequency <= highest:  # False for NaN
+            return TunerReading(reading_time, math.nan, None, math.nan)
+        note = frequency_to_note(Frequency(frequency), self.a4_frequency)
+        cents = CENTS_PER_OCTAVE * math.log2(frequency / note.frequency.value)
+        return TunerReading(reading_time, frequency, note, cents)
+
+    def process(self, samples: np.ndarray) -> Optional[TunerReading]:
+        """Append a hop of (mono) samples, and return the reading of the latest frame.
+
+        Returns None until a whole frame has been received.
+        """
+        start_time = time.perf_counter()
+        self._buffer.write(samples)
+        self._sample_count += len(samples)
+        if len(self._buffer) < self.settings.frame_length:
+            return None
+        self._estimator.window(self._buffer.latest(self.settings.frame_length))
+        window_time = time.perf_counter()
+        frequency, _ = self._estimator.estimate()
+        estimate_time = time.perf_counter()
+        reading = self._snap(frequency)
+        snap_time = time.perf_counter()
+
+        self.latency["window"].record(window_time - start_time)
+        self.latency["estimate"].record(estimate_time - window_time)
+        self.latency["snap"].record(snap_time - estimate_time)
+        self.latency["analysis"].record(snap_time - start_time)
+        return reading
+
+    def run(
+        self, read_pcm: Callable[[int], bytes], sample_width: int, channel_count: int = 1
+    ) -> Iterator[TunerReading]:
+        """Yield a reading for every hop of a PCM source, until the source is exhausted.
+
+        read_pcm(frame_count) returns the raw little-endian PCM bytes of up to frame_count frames
+        (e.g. wave.Wave_read.readframes), and empty bytes at the end of the stream.
+        """
+        hop_bytes = self.settings.hop_length * sample_width * channel_count
+        while True:
+            start_time = time.perf_counter()
+            data = read_pcm(self.settings.hop_length)
+            data = data[: len(data) - len(data) % (sample_width * channel_count)]
+            if not data:
+                return
+            samples = pcm_to_float(data, sample_width, channel_count)
+            hop = samples[:, 0] if channel_count == 1 else samples.mean(axis=1)
+            self.latency["read"].record(time.perf_counter() - start_time)
+            reading = self.process(hop)
+            if reading is not None:
+                yield reading
+            if len(data) < hop_bytes:
+                return
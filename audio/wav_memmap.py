@@ -0,0 +1,267 @@
+"""Memory-mapped PCM WAV files: zero-copy views of the samples, and in-place chunked appends"""
+
+import io
+import os
+import struct
+from dataclasses import dataclass, replace
+from types import TracebackType
+from typing import BinaryIO, Dict, Iterator, Literal, Optional, Tuple, Type
+
+import numpy as np
+
+from audio.wav_reader import DEFAULT_CHUNK_FRAMES, WavInfo, pcm_to_float
+from audio.wav_writer import float_to_pcm
+
+# PCM sample width (bytes) -> dtype of a sample (24-bit samples have no numpy dtype)
+_MEMMAP_DTYPES: Dict[int, np.dtype] = {1: np.dtype("u1"), 2: np.dtype("<i2"), 4: np.dtype("<i4")}
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+# An extensible fmt chunk ends with the GUID of the actual format, whose first 2 bytes are the
+# format tag, e.g. PCM (1) or IEEE float (3), and the rest is this fixed suffix
+_SUBFORMAT_GUID_SUFFIX = b"\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71"
+_EXTENSIBLE_FMT_SIZE = 40
+# RIFF chunk sizes are unsigned 32-bit
+_MAX_CHUNK_SIZE = 0xFFFFFFFF
+# Offset of the size field of the RIFF chunk, and size of the header written by WavAppender
+_RIFF_SIZE_OFFSET = 4
+_HEADER_SIZE = 44
+
+
+@dataclass(frozen=True, slots=True)
+class _Layout:
+    """Format of a WAV file, and where its data chunk is"""
+
+    info: WavInfo
+    data_offset: int  # offset of the first sample
+    data_is_last: bool  # the data chunk is the last chunk, so it can be appended to
+    # bytes after the (unpadded) end of the data chunk, other than its pad byte, that are not a
+    # chunk (i.e. samples not yet recorded in the header by an interrupted writer, which may have
+    # overwritten the pad byte)
+    trailing_size: int
+
+
+def _parse_fmt(fmt_chunk: bytes) -> Tuple[int, ...]:
+    """Return the fields of a fmt chunk, the format tag of an extensible one being its SubFormat"""
+    if len(fmt_chunk) < 16:
+        raise ValueError(f"Truncated fmt chunk of {len(fmt_chunk)} bytes")
+    fields = struct.unpack("<HHIIHH", fmt_chunk[:16])
+    if fields[0] != _WAVE_FORMAT_EXTENSIBLE:
+        return fields
+    if len(fmt_chunk) < _EXTENSIBLE_FMT_SIZE:
+        raise ValueError(f"Truncated extensible fmt chunk of {len(fmt_chunk)} bytes")
+    subformat = fmt_chunk[24:_EXTENSIBLE_FMT_SIZE]
+    if subformat[2:] != _SUBFORMAT_GUID_SUFFIX:
+        raise ValueError(f"Unsupported WAV SubFormat: {subformat.hex()}")
+    return (struct.unpack("<H", subformat[:2])[0], *fields[1:])
+
+
+def _find_chunks(wav_file: BinaryIO) -> Tuple[Tuple[int, ...], int, int]:
+    """Return the fields of the fmt chunk, and the offset and size of the data chunk"""
+    riff, _, wave_id = struct.unpack("<4sI4s", wav_file.read(12))
+    if riff != b"RIFF" or wave_id != b"WAVE":
+        raise ValueError("Not a RIFF WAVE file")
+    fmt = None
+    while True:
+        header = wav_file.read(8)
+        if len(header) < 8:
+            raise ValueError("No data chunk")
+        chunk_id, chunk_size = struct.unpack("<4sI", header)
+        chunk_offset = wav_file.tell()
+        if chunk_id == b"fmt ":
+            fmt = _parse_fmt(wav_file.read(chunk_size))
+        elif chunk_id == b"data":
+            break
+        wav_file.seek(chunk_offset + chunk_size + chunk_size % 2)  # chunks are word-aligned
+    if fmt is None:
+        raise ValueError("No fmt chunk before the data chunk")
+    return fmt, chunk_offset, chunk_size
+
+
+def _is_last_chunk(wav_file: BinaryIO, chunk_end: int, file_size: int) -> bool:
+    """Return whether no chunk follows the (padded) end of a chunk"""
+    wav_file.seek(chunk_end)
+    next_header = wav_file.read(8)
+    return not (
+        len(next_header) == 8
+        and all(32 <= byte < 127 for byte in next_header[:4])  # printable chunk id
+        and chunk_end + 8 + struct.unpack("<I", next_header[4:])[0] <= file_size
+    )
+
+
+def _read_layout(wav_file: BinaryIO) -> _Layout:
+    fmt, chunk_offset, chunk_size = _find_chunks(wav_file)
+    file_size = os.fstat(wav_file.fileno()).st_size
+    format_tag, channel_count, sample_rate, _, block_align, bits_per_sample = fmt
+    if format_tag != _WAVE_FORMAT_PCM:
+        raise ValueError(f"Unsupported WAV format: {format_tag:#x} (only PCM is)")
+    sample_width = (bits_per_sample + 7) // 8
+    if block_align != sample_width * channel_count:
+        raise ValueError(f"Inconsistent block align: {block_align}")
+    # a truncated file is shorter than its header says
+    data_size = min(chunk_size, file_size - chunk_offset)
+    data_is_last = _is_last_chunk(wav_file, chunk_offset + chunk_size + chunk_size % 2, file_size)
+    trailing_size = file_size - (chunk_offset + chunk_size)
+    return _Layout(
+        WavInfo(sample_rate, channel_count, sample_width, data_size // block_align),
+        chunk_offset,
+        data_is_last,
+        trailing_size if data_is_last and trailing_size > chunk_size % 2 else 0,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class WavMemmap:
+    """The samples of a WAV file mapped in memory, not read.
+
+    samples is the (frames x channels) np.memmap of the raw PCM integers, e.g. samples[:, 1] is a
+    strided view of the second channel, and samples[start:stop] a view of a range of frames. Pages
+    are only read as they are accessed, so files larger than memory can be processed.
+    """
+
+    info: WavInfo
+    samples: np.memmap
+
+    def channel(self, index: int) -> np.ndarray:
+        """Return a (zero-copy, strided) view of the raw samples of a channel"""
+        if not -self.info.channel_count <= index < self.info.channel_count:
+            raise ValueError(f"Channel {index} out of {self.info.channel_count} channels")
+        return self.samples[:, index]
+
+    def to_float(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Return the (frames x channels) float64 samples, in [-1, 1), of frames [start, stop)"""
+        return pcm_to_float(
+            self.samples[start:stop].tobytes(), self.info.sample_width, self.info.channel_count
+        )
+
+    def chunks(self, chunk_frames: int = DEFAULT_CHUNK_FRAMES) -> Iterator[np.ndarray]:
+        """Yield the samples mixed down to mono, in float64 chunks of chunk_frames (the last may be
+        shorter), like audio.wav_reader.read_wav_chunks()"""
+        if chunk_frames <= 0:
+            raise ValueError(f"Chunk size must be positive: {chunk_frames}")
+        for start in range(0, self.info.frame_count, chunk_frames):
+            yield self.to_float(start, start + chunk_frames).mean(axis=1)
+
+
+def memmap_wav(file_path: str, mode: Literal["r", "r+"] = "r") -> WavMemmap:
+    """Map the samples of a PCM WAV file (8, 16 or 32-bit) in memory.
+
+    mode is "r" (read-only), or "r+" to modify the samples in place. 24-bit files can not be
+    mapped, as numpy has no 3-byte integer: read them with audio.wav_reader.read_wav_chunks().
+    """
+    if mode not in ("r", "r+"):
+        raise ValueError(f"Unsupported mode: {mode}")
+    with open(file_path, "rb") as wav_file:
+        layout = _read_layout(wav_file)
+    info = layout.info
+    if info.sample_width not in _MEMMAP_DTYPES:
+        raise ValueError(f"{8 * info.sample_width}-bit samples can not be memory-mapped")
+    shape = (info.frame_count, info.channel_count)
+    if info.frame_count == 0:
+        # an empty file can not be mapped
+        return WavMemmap(
+            info, np.zeros(shape, dtype=_MEMMAP_DTYPES[info.sample_width]).view(np.memmap)
+        )
+    samples = np.memmap(
+        file_path, _MEMMAP_DTYPES[info.sample_width], mode, layout.data_offset, shape, order="C"
+    )
+    return WavMemmap(info, samples)
+
+
+class WavAppender:
+    """Append blocks of samples to a WAV file, created if it does not exist.
+
+    The RIFF and data sizes of the header are updated after every append, so the file is a valid
+    WAV file at any time: it can be memory-mapped while it grows, and a run can resume appending
+    to the file of an interrupted one.
+
+    with WavAppender("out.wav", 44100, channel_count=2) as appender:
+        for block in blocks:
+            appender.append(block)
+    """
+
+    def __init__(
+        self, file_path: str, sample_rate: int, channel_count: int = 1, sample_width: int = 2
+    ):
+        if sample_width not in (1, 2, 3, 4):
+            raise ValueError(f"Unsupported sample width: {sample_width} bytes")
+        self.info = WavInfo(sample_rate, channel_count, sample_width, 0)
+        resume = os.path.exists(file_path) and os.path.getsize(file_path) > 0
+        self._wav_file = io.FileIO(file_path, "r+" if resume else "w+")
+        if resume:
+            self._data_offset, self.frame_count = self._resume()
+        else:
+            self._data_offset, self.frame_count = self._create(), 0
+
+    def _create(self) -> int:
+        self._wav_file.write(
+            struct.pack(
+                "<4sI4s4sIHHIIHH4sI",
+                b"RIFF",
+                _HEADER_SIZE - 8,
+                b"WAVE",
+                b"fmt ",
+                16,
+                _WAVE_FORMAT_PCM,
+                self.info.channel_count,
+                self.info.sample_rate,
+                self.info.sample_rate * self._block_align,
+                self._block_align,
+                8 * self.info.sample_width,
+                b"data",
+                0,
+            )
+        )
+        return _HEADER_SIZE
+
+    def _resume(self) -> Tuple[int, int]:
+        layout = _read_layout(self._wav_file)
+        if layout.info != replace(self.info, frame_count=layout.info.frame_count):
+            self._wav_file.close()
+            raise ValueError(f"Can not append {self.info} to a file of {layout.info}")
+        if not layout.data_is_last:
+            self._wav_file.close()
+            raise ValueError("Can not append to a file with chunks after its data chunk")
+        frame_count = layout.info.frame_count + layout.trailing_size // self._block_align
+        return layout.data_offset, frame_count
+
+    @property
+    def _block_align(self) -> int:
+        return self.info.sample_width * self.info.channel_count
+
+    def append(self, samples: np.ndarray):
+        """Append (frames,) mono, or (frames x channels) float samples in [-1, 1]"""
+        samples = np.asarray(samples, dtype=np.float64)
+        samples = samples[:, np.newaxis] if samples.ndim == 1 else samples
+        if samples.shape[1] != self.info.channel_count:
+            raise ValueError(f"Expected {self.info.channel_count} channels, got {samples.shape[1]}")
+        data_size = (self.frame_count + len(samples)) * self._block_align
+        pad_size = data_size % 2  # chunks are word-aligned
+        if self._data_offset + data_size + pad_size - 8 > _MAX_CHUNK_SIZE:
+            raise ValueError("A WAV file can not be larger than 4 GiB")
+        self._wav_file.seek(self._data_offset + self.frame_count * self._block_align)
+        self._wav_file.write(float_to_pcm(samples, self.info.sample_width) + b"\0" * pad_size)
+        self._wav_file.truncate()  # e.g. the pad byte of the previous append
+        self.frame_count += len(samples)
+        self._write_sizes(data_size, pad_size)
+
+    def _write_sizes(self, data_size: int, pad_size: int):
+        self._wav_file.seek(_RIFF_SIZE_OFFSET)
+        self._wav_file.write(struct.pack("<I", self._data_offset + data_size + pad_size - 8))
+        self._wav_file.seek(self._data_offset - 4)
+        self._wav_file.write(struct.pack("<I", data_size))
+        self._wav_file.flush()
+
+    def close(self):
+        """Close the file (the header is always up to date)"""
+        self._wav_file.close()
+
+    def __enter__(self) -> "WavAppender":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ):
+        self.close()
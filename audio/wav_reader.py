@@ -0,0 +1,80 @@
+"""Chunked reading of PCM WAV files (stdlib wave module)"""
+
+import wave
+from dataclasses import dataclass
+from typing import Iterator
+
+import numpy as np
+
+# Number of frames read from the file at once, i.e. the bound on memory use of read_wav_chunks()
+DEFAULT_CHUNK_FRAMES = 65536
+
+# PCM sample width (bytes) -> (dtype of a sample, value of silence, full scale)
+_SAMPLE_FORMATS = {
+    1: (np.uint8, 128.0, 128.0),  # 8-bit WAV is unsigned
+    2: (np.int16, 0.0, 32768.0),
+    4: (np.int32, 0.0, 2147483648.0),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class WavInfo:
+    """Format of a PCM WAV file"""
+
+    sample_rate: int
+    channel_count: int
+    sample_width: int  # bytes per sample
+    frame_count: int  # a frame is one sample of each channel
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds"""
+        return self.frame_count / self.sample_rate
+
+
+def wav_info(file_path: str) -> WavInfo:
+    """Return the format of a WAV file, without reading its samples"""
+    with wave.open(file_path, "rb") as wav_file:
+        return WavInfo(
+            wav_file.getframerate(),
+            wav_file.getnchannels(),
+            wav_file.getsampwidth(),
+            wav_file.getnframes(),
+        )
+
+
+def pcm_to_float(data: bytes, sample_width: int, channel_count: int) -> np.ndarray:
+    """Return the (frames x channels) float64 samples, in [-1, 1), of raw little-endian PCM data"""
+    if sample_width == 3:
+        # 24-bit: pad every sample to a 32-bit int, the padding byte being the least significant
+        packed = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((len(packed), 4), dtype=np.uint8)
+        padded[:, 1:] = packed
+        samples = padded.view("<i4").reshape(-1)
+        offset, scale = _SAMPLE_FORMATS[4][1:]
+    elif sample_width in _SAMPLE_FORMATS:
+        dtype, offset, scale = _SAMPLE_FORMATS[sample_width]
+        samples = np.frombuffer(data, dtype=np.dtype(dtype).newbyteorder("<"))
+    else:
+        raise ValueError(f"Unsupported sample width: {sample_width} bytes")
+    return ((samples - offset) / scale).reshape(-1, channel_count)
+
+
+def read_wav_chunks(
+    file_path: str, chunk_frames: int = DEFAULT_CHUNK_FRAMES
+) -> Iterator[np.ndarray]:
+    """Yield the samples of a WAV file, mixed down to mono, in float64 chunks of chunk_frames
+    (the last chunk may be shorter).
+
+    Only one chunk is held in memory at a time, no matter how long the file is.
+    """
+    if chunk_frames <= 0:
+        raise ValueError(f"Chunk size must be positive: {chunk_frames}")
+    with wave.open(file_path, "rb") as wav_file:
+        sample_width = wav_file.getsampwidth()
+        channel_count = wav_file.getnchannels()
+        while True:
+            data = wav_file.readframes(chunk_frames)
+            if not data:
+                return
+            yield pcm_to_float(data, sample_width, channel_count).mean(axis=1)
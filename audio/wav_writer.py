@@ -0,0 +1,75 @@
+"""Block-wise writing of PCM WAV files (stdlib wave module)"""
+
+import wave
+from types import TracebackType
+from typing import Optional, Type
+
+import numpy as np
+
+# PCM sample width (bytes) -> (dtype of a sample, value of silence, full scale)
+_SAMPLE_FORMATS = {
+    1: ("u1", 128.0, 127.0),  # 8-bit WAV is unsigned
+    2: ("<i2", 0.0, 32767.0),
+    3: ("<i4", 0.0, 8388607.0),  # packed to 3 bytes after conversion
+    4: ("<i4", 0.0, 2147483647.0),
+}
+
+
+def float_to_pcm(samples: np.ndarray, sample_width: int) -> bytes:
+    """Return raw little-endian PCM data of (frames x channels) float samples in [-1, 1].
+
+    Samples out of [-1, 1] are clipped.
+    """
+    if sample_width not in _SAMPLE_FORMATS:
+        raise ValueError(f"Unsupported sample width: {sample_width} bytes")
+    dtype, offset, scale = _SAMPLE_FORMATS[sample_width]
+    pcm = np.round(np.clip(samples, -1.0, 1.0) * scale + offset).astype(dtype)
+    if sample_width == 3:
+        return pcm.reshape(-1, 1).view(np.uint8)[:, :3].tobytes()
+    return pcm.tobytes()
+
+
+class WavWriter:
+    """Write a WAV file block by block, so a long signal is never held in memory as a whole.
+
+    with WavWriter("out.wav", 44100) as writer:
+        for block in blocks:
+            writer.write(block)
+    """
+
+    def __init__(
+        self, file_path: str, sample_rate: int, channel_count: int = 1, sample_width: int = 2
+    ):
+        if sample_width not in _SAMPLE_FORMATS:
+            raise ValueError(f"Unsupported sample width: {sample_width} bytes")
+        self.sample_width = sample_width
+        self.channel_count = channel_count
+        self.frame_count = 0
+        self._wav_file = wave.Wave_write(file_path)
+        self._wav_file.setnchannels(channel_count)
+        self._wav_file.setsampwidth(sample_width)
+        self._wav_file.setframerate(sample_rate)
+
+    def write(self, samples: np.ndarray):
+        """Append (frames,) mono, or (frames x channels) float samples in [-1, 1]"""
+        samples = np.asarray(samples, dtype=np.float64)
+        samples = samples[:, np.newaxis] if samples.ndim == 1 else samples
+        if samples.shape[1] != self.channel_count:
+            raise ValueError(f"Expected {self.channel_count} channels, got {samples.shape[1]}")
+        self._wav_file.writeframesraw(float_to_pcm(samples, self.sample_width))
+        self.frame_count += len(samples)
+
+    def close(self):
+        """Finalize the header, and close the file"""
+        self._wav_file.close()
+
+    def __enter__(self) -> "WavWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ):
+        self.close()
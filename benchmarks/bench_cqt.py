@@ -0,0 +1,44 @@
+"""Throughput benchmark: the quartertone constant-Q transform of 60 minutes of tar fret sweeps
+
+$ python3 -m benchmarks.bench_cqt [minutes]
+"""
+
+import sys
+import time
+from typing import List
+
+from audio.cqt import ConstantQ
+from audio.synthesis import Synthesizer
+from audio.transcription import ThroughputStats
+from core.frequency import Frequency
+from core.notes import Note
+from instruments.tar_instrument import tar_string
+
+SAMPLE_RATE = 44100
+MINUTES = 60.0
+NOTE_DURATION = 0.25
+
+
+def main(argv: List[str]) -> int:
+    # pylint: disable=missing-function-docstring
+    minutes = float(argv[0]) if argv else MINUTES
+    a4_frequency = Frequency(440)
+    frets = list(tar_string(Note.from_name("C3", a4_frequency), 27).values())
+    note_count = int(minutes * 60 / NOTE_DURATION)
+    synthesizer = Synthesizer([frets[i % len(frets)] for i in range(note_count)], NOTE_DURATION)
+    transform = ConstantQ(SAMPLE_RATE, a4_frequency)
+    kernel = transform.kernel
+    print(f"{len(kernel.steps)} bins, {kernel.matrix!r}, FFT of {kernel.fft_length} samples")
+    stats = ThroughputStats()
+    for block in synthesizer.blocks():
+        start_time = time.perf_counter()
+        magnitudes = transform.push(block)
+        stats.elapsed_seconds += time.perf_counter() - start_time
+        stats.audio_seconds += len(block) / SAMPLE_RATE
+        stats.frame_count += magnitudes.shape[1]
+    print(f"{stats.audio_seconds / 60:.1f} minutes of audio: {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
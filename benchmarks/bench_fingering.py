@@ -0,0 +1,43 @@
+"""Throughput benchmark: Viterbi fingering of random melodies on the frets of a tar
+
+$ python3 -m benchmarks.bench_fingering [note_count]
+"""
+
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+from core.frequency import Frequency
+from instruments.fingering import FingeringOptimizer
+from instruments.fretboard import Fretboard
+
+NOTE_COUNT = 10_000
+BATCH_SIZE = 100
+
+
+def main(argv: List[str]) -> int:
+    # pylint: disable=missing-function-docstring
+    count = int(argv[0]) if argv else NOTE_COUNT
+    fretboard = Fretboard.from_preset("tar", Frequency(440))
+    optimizer = FingeringOptimizer(fretboard)
+    rng = np.random.default_rng(0)
+    steps = np.unique(fretboard.steps)
+
+    melody = rng.choice(steps, count)
+    start = time.perf_counter()
+    optimizer.solve(melody)
+    elapsed = time.perf_counter() - start
+    print(f"1 melody of {count} notes: {elapsed:.3f} s")
+
+    melodies = [rng.choice(steps, count // BATCH_SIZE) for _ in range(BATCH_SIZE)]
+    start = time.perf_counter()
+    optimizer.solve_batch(melodies)
+    elapsed = time.perf_counter() - start
+    print(f"batch of {BATCH_SIZE} melodies of {count // BATCH_SIZE} notes: {elapsed:.3f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""Throughput benchmark: fret positions of (scale lengths x base notes) configurations, to CSV/NPY
+
+$ python3 -m benchmarks.bench_fret_positions [configuration_count]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+import numpy as np
+
+from instruments.fret_positions import (
+    fret_position_table,
+    save_fret_positions_npy,
+    write_fret_positions_csv,
+)
+
+CONFIGURATION_COUNT = 100_000
+BASE_NOTE_NAMES = ["C4", "B3", "A3", "G3", "F3", "E3", "D3", "C3", "B2", "A2"]
+
+
+def main(argv: List[str]) -> int:
+    # pylint: disable=missing-function-docstring
+    count = int(argv[0]) if argv else CONFIGURATION_COUNT
+    scale_lengths = np.linspace(550, 750, max(count // len(BASE_NOTE_NAMES), 1))
+    start = time.perf_counter()
+    table = fret_position_table(scale_lengths, BASE_NOTE_NAMES, 28)
+    elapsed = time.perf_counter() - start
+    print(f"{table.configuration_count} configurations, {table.positions_mm.size} positions")
+    print(f"table: {elapsed:.3f} s")
+
+    start = time.perf_counter()
+    write_fret_positions_csv(io.StringIO(), table)
+    print(f"csv: {time.perf_counter() - start:.3f} s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        save_fret_positions_npy(os.path.join(directory, "positions.npy"), table)
+        print(f"npy: {time.perf_counter() - start:.3f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,35 @@
+"""Throughput benchmark: NoteSearchIndex batch queries against the frets of a tar string
+
+$ python3 -m benchmarks.bench_note_index [query_count]
+"""
+
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+from core.frequency import Frequency
+from core.note_index import NoteSearchIndex
+from core.notes import Note
+from instruments.tar_instrument import tar_string
+
+QUERY_COUNT = 10_000_000
+
+
+def main(argv: List[str]) -> int:
+    # pylint: disable=missing-function-docstring
+    count = int(argv[0]) if argv else QUERY_COUNT
+    a4_frequency = Frequency(440)
+    index = NoteSearchIndex(list(tar_string(Note.from_name("C3", a4_frequency), 27).values()))
+    frequencies = np.random.default_rng(0).uniform(100, 800, count)
+    start = time.perf_counter()
+    index.query(frequencies)
+    elapsed = time.perf_counter() - start
+    print(f"{count} queries over {len(index)} notes: {elapsed:.3f} s")
+    print(f"throughput: {count / elapsed / 1e6:.1f} M queries/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,67 @@
+"""Memory benchmark: bytes per Note, for the slotted/frozen types vs plain dataclasses
+
+$ python3 -m benchmarks.bench_note_memory [note_count]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import make_dataclass
+from typing import Callable, List
+
+from core.frequency import Frequency
+from core.notes import Note
+from core.validation import ValidationPolicy, set_validation_policy
+
+NOTE_COUNT = 1_000_000
+NAMES = ["C4", "Dk4", "D4", "Ek4", "E4", "F4", "Fs4", "G4", "Ak4", "A4", "Bk4", "B4"]
+
+# Plain (non-slotted, mutable) equivalents of Note and Frequency, i.e. one __dict__ per instance
+_PlainFrequency = make_dataclass("_PlainFrequency", [("value", float)])
+_PlainNote = make_dataclass(
+    "_PlainNote",
+    ["name", "letter", "accidental", "octave", "frequency", "a4_frequency"],
+)
+
+
+def _plain_note(note: Note, a4_frequency: object) -> object:
+    return _PlainNote(
+        note.name,
+        note.letter,
+        note.accidental,
+        note.octave,
+        _PlainFrequency(note.frequency.value * 1.0),
+        a4_frequency,
+    )
+
+
+def _bytes_per_note(factory: Callable[[int], object], count: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    notes: List[object] = [factory(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del notes
+    return (after - before) / count
+
+
+def main(argv: List[str]) -> int:
+    # pylint: disable=missing-function-docstring
+    count = int(argv[0]) if argv else NOTE_COUNT
+    set_validation_policy(ValidationPolicy.TRUSTED)
+    a4_frequency = Frequency(440)
+    templates = [Note.from_name(name, a4_frequency) for name in NAMES]
+    plain_a4_frequency = _PlainFrequency(440.0)
+
+    plain = _bytes_per_note(
+        lambda i: _plain_note(templates[i % len(NAMES)], plain_a4_frequency), count
+    )
+    slotted = _bytes_per_note(lambda i: Note.from_name(NAMES[i % len(NAMES)], a4_frequency), count)
+    print(f"{count} notes (each with its own frequency object, sharing name/octave/accidental/A4)")
+    print(f"plain dataclasses:   {plain:6.1f} bytes/note")
+    print(f"frozen + __slots__:  {slotted:6.1f} bytes/note")
+    print(f"saving:              {100 * (1 - slotted / plain):6.1f} %")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
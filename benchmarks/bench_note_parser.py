@@ -0,0 +1,62 @@
+"""Micro-benchmark: table-driven note name parser vs the previous parse chain
+
+$ python3 -m benchmarks.bench_note_parser
+"""
+
+import re
+import sys
+import timeit
+from typing import Sequence, Tuple
+
+from core.accidentals import Accidental
+from core.note_names import CONVERSION_TO_STANDARD_NOTE, STANDARD_NOTES, parse_note_name
+from core.octaves import Octave
+
+NAMES = ["Dk4", "A4", "G#3", "Fs2", "Bb5", "B#3", "Ck1", "E6"]
+NUMBER = 20000
+
+
+def _legacy_decompose(name: str) -> Tuple[str, Accidental, Octave]:
+    """The parse chain as it was before core.note_names (regex, then one lookup per part)"""
+    match = re.search(r"-?\d+$", name)
+    if not match:
+        raise ValueError(f"No integer found at the end of '{name}'")
+    octave = Octave.from_number(int(match.group()))
+    letter_accidental = name[: -len(str(octave))]
+    if len(letter_accidental) == 1:
+        letter, symbol = letter_accidental, ""
+    elif len(letter_accidental) == 2:
+        letter, symbol = letter_accidental[0], letter_accidental[1]
+    else:
+        raise ValueError(f"Invalid letter+accidental {letter_accidental}")
+    if letter not in ["A", "B", "C", "D", "E", "F", "G"]:
+        raise ValueError(f"Invalid note letter: {letter}")
+    return letter, Accidental.from_symbol(symbol), octave
+
+
+def _legacy_parse(name: str) -> Tuple[str, Accidental, Octave, int]:
+    letter, accidental, octave = _legacy_decompose(name)
+    _legacy_decompose(f"{letter}{accidental}{octave}")  # _standardize_note re-parsed the name
+    letter_accidental = f"{letter}{accidental}"
+    standard = CONVERSION_TO_STANDARD_NOTE.get(letter_accidental, letter_accidental)
+    return letter, accidental, octave, STANDARD_NOTES["quartertone"].index(standard)
+
+
+def _run(parse, names: Sequence[str]):
+    for name in names:
+        parse(name)
+
+
+def main() -> int:
+    # pylint: disable=missing-function-docstring
+    legacy = timeit.timeit(lambda: _run(_legacy_parse, NAMES), number=NUMBER)
+    table = timeit.timeit(lambda: _run(parse_note_name, NAMES), number=NUMBER)
+    count = NUMBER * len(NAMES)
+    print(f"legacy parse chain: {1e9 * legacy / count:8.1f} ns/name")
+    print(f"parse_note_name:    {1e9 * table / count:8.1f} ns/name")
+    print(f"speedup:            {legacy / table:8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""Real-time factor benchmark: render 10 minutes of tar string fret sweeps to a WAV file
+
+$ python3 -m benchmarks.bench_synthesis [minutes]
+"""
+
+import os
+import sys
+import tempfile
+from typing import List
+
+from audio.synthesis import Synthesizer, render_to_wav
+from core.frequency import Frequency
+from core.notes import Note
+from instruments.tar_instrument import tar_string
+
+MINUTES = 10.0
+NOTE_DURATION = 0.25
+
+
+def main(argv: List[str]) -> int:
+    # pylint: disable=missing-function-docstring
+    minutes = float(argv[0]) if argv else MINUTES
+    frets = list(tar_string(Note.from_name("C3", Frequency(440)), 27).values())
+    note_count = int(minutes * 60 / NOTE_DURATION)
+    notes = [frets[i % len(frets)] for i in range(note_count)]
+    synthesizer = Synthesizer(notes, NOTE_DURATION)
+    with tempfile.TemporaryDirectory() as directory:
+        stats = render_to_wav(os.path.join(directory, "render.wav"), synthesizer)
+    print(f"{note_count} notes, {stats.audio_seconds / 60:.1f} minutes of audio")
+    print(f"rendered in {stats.elapsed_seconds:.2f} s: {stats.realtime_factor:.0f}x real-time")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""Latency benchmark: the tuner on a tar string played fret by fret, against a 10 ms budget
+
+$ python3 -m benchmarks.bench_tuner [seconds_per_fret]
+"""
+
+import io
+import sys
+from typing import List
+
+import numpy as np
+
+from audio.pitch import PitchSettings
+from audio.tuner import Tuner
+from core.frequency import Frequency
+from core.notes import Note
+from instruments.tar_instrument import tar_string
+
+SAMPLE_RATE = 44100
+SECONDS_PER_FRET = 1.0
+BUDGET_MS = 10.0
+
+
+def main(argv: List[str]) -> int:
+    # pylint: disable=missing-function-docstring
+    seconds_per_fret = float(argv[0]) if argv else SECONDS_PER_FRET
+    a4_frequency = Frequency(440)
+    time = np.arange(int(seconds_per_fret * SAMPLE_RATE)) / SAMPLE_RATE
+    frets = tar_string(Note.from_name("C4", a4_frequency), 27)
+    tuner = Tuner(PitchSettings(SAMPLE_RATE), a4_frequency)
+    samples = np.concatenate(
+        [0.5 * np.sin(2 * np.pi * note.frequency.value * time) for note in frets.values()]
+    )
+    # 16-bit PCM in memory, standing in for a live source
+    stream = io.BytesIO(np.round(samples * 32767).astype("<i2").tobytes())
+    played = np.repeat(list(frets.values()), len(time))
+    mistuned = 0
+    for reading in tuner.run(lambda frame_count: stream.read(2 * frame_count), sample_width=2):
+        note = played[round(reading.time * SAMPLE_RATE) - 1]
+        mistuned += reading.note is not None and reading.note != note
+    for stage, histogram in tuner.latency.items():
+        print(f"{stage:<9}{histogram}")
+    within = tuner.latency["analysis"].fraction_within(BUDGET_MS)
+    print(f"analysis within {BUDGET_MS} ms: {100 * within:.2f}% of hops")
+    print(f"readings off the played fret (frames across two frets): {mistuned}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from core.intervals import MusicalInterval
@@ -17,7 +18,7 @@ SYMBOL_TO_INTERVAL_MAP = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Accidental:
     """Accidentals are symbols that pair with a notes to create new notes.
     Three common accidentals are:
@@ -59,7 +60,11 @@ class Accidental:
             return self._eq_to_accidental(other)
         raise NotImplementedError(f"Type {type(other)} is not supported for comparison")
 
+    def __hash__(self) -> int:
+        return hash(self.name)
+
     @staticmethod
+    @lru_cache(maxsize=None)
     def from_name(name: str) -> "Accidental":
         """Create and return an Accidental from the name"""
         if name not in SYMBOL_TO_NAME_MAP.values():
@@ -68,6 +73,7 @@ class Accidental:
         return accidental.value
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def from_symbol(symbol: str) -> "Accidental":
         """Create and return an Accidental from the symbol (single character)"""
         if symbol not in SYMBOL_TO_NAME_MAP:
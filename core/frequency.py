@@ -8,12 +8,14 @@ from typing import Any
 
 
 @total_ordering
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class Frequency:
     """Frequency in Hz
 
     NOTE: by defining __eq__ and one other rich comparison ordering method (__lt__, __le__,
           __gt__, or __ge__), total_ordering decorator will automatically provide the rest.
+    NOTE: __eq__ tolerates tiny differences (math.isclose), which no hash can be consistent with,
+          so Frequency is not hashable. Key on .value, or on Note (hashed by step), instead.
     """
 
     value: float
@@ -35,6 +37,8 @@ class Frequency:
             return isclose(self.value, other)
         return NotImplemented
 
+    __hash__ = None  # type: ignore[assignment]
+
     def __lt__(self, other: Any):
         if isinstance(other, Frequency):
             return self.value < other.value
@@ -0,0 +1,96 @@
+"""A representation of many frequencies, interoperable with NumPy"""
+
+from typing import Any, List, Sequence, Union
+
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+
+from core.frequency import Frequency
+
+# Same relative tolerance as math.isclose(), used by Frequency.__eq__
+RELATIVE_TOLERANCE = 1e-09
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, FrequencyArray):
+        return value.values
+    if isinstance(value, Frequency):
+        return value.value
+    return value
+
+
+class FrequencyArray(NDArrayOperatorsMixin):
+    """Frequencies in Hz, stored in one float64 NumPy array
+
+    Batch counterpart of Frequency:
+    * positivity of all values is checked once, on creation.
+    * arithmetic (+, -, *, /, ...) and NumPy ufuncs (np.log2, ...) return plain np.ndarray, not
+      FrequencyArray (the result of an operation is not necessarily a frequency).
+    * == and != are element-wise with the same tolerance as Frequency (i.e. math.isclose), and
+      <= and >= are consistent with them. Comparisons return boolean arrays.
+    * operands can be FrequencyArray, Frequency, scalars or arrays.
+
+    NOTE: like np.ndarray, FrequencyArray is not hashable.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: Union[float, Sequence[float], np.ndarray]):
+        values = np.asarray(values, dtype=np.float64)
+        if not np.all(values > 0):
+            raise ValueError("Frequencies must be non-zero and positive")
+        self.values: np.ndarray = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"FrequencyArray({self.values.tolist()} Hz)"
+
+    def __getitem__(self, key: Any) -> Union[Frequency, "FrequencyArray"]:
+        item = self.values[key]
+        if np.ndim(item) == 0:
+            return Frequency(float(item))
+        return FrequencyArray(item)
+
+    @property
+    def shape(self):
+        """Shape of the underlying array"""
+        return self.values.shape
+
+    def __array__(self, dtype=None, copy=None):
+        # pylint: disable=unused-argument
+        return np.asarray(self.values, dtype=dtype)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = tuple(_unwrap(value) for value in inputs)
+        if "out" in kwargs:
+            kwargs["out"] = tuple(_unwrap(value) for value in kwargs["out"])
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def isclose(self, other: Any) -> np.ndarray:
+        """Element-wise equality with the tolerance of Frequency.__eq__"""
+        return np.isclose(self.values, _unwrap(other), rtol=RELATIVE_TOLERANCE, atol=0.0)
+
+    def __eq__(self, other: Any) -> np.ndarray:  # type: ignore[override]
+        return self.isclose(other)
+
+    def __ne__(self, other: Any) -> np.ndarray:  # type: ignore[override]
+        return ~self.isclose(other)
+
+    def __le__(self, other: Any) -> np.ndarray:
+        return (self.values < _unwrap(other)) | self.isclose(other)
+
+    def __ge__(self, other: Any) -> np.ndarray:
+        return (self.values > _unwrap(other)) | self.isclose(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @staticmethod
+    def from_frequencies(frequencies: Sequence[Frequency]) -> "FrequencyArray":
+        """Create a FrequencyArray from Frequency objects"""
+        return FrequencyArray([frequency.value for frequency in frequencies])
+
+    def to_frequencies(self) -> List[Frequency]:
+        """Return a list of Frequency objects (NOTE: this creates one Python object per value)"""
+        return [Frequency(value) for value in self.values.ravel().tolist()]
@@ -0,0 +1,102 @@
+"""Harmonic series of notes, and near-collisions between the partials of different notes"""
+
+from dataclasses import dataclass
+from typing import Iterable, Tuple, Union
+
+import numpy as np
+
+from core.intervals import CENTS_PER_OCTAVE
+from core.notes import Note
+from core.tuning import TuningTable
+
+# Step of partials out of the range of the tuning table
+OUT_OF_RANGE = -1
+
+
+def harmonic_series(
+    fundamentals: Union[Iterable[float], Iterable[Note], np.ndarray], partial_count: int
+) -> np.ndarray:
+    """Return the (notes x partial_count) matrix of the frequencies of the first partials of every
+    note, the first partial being the fundamental.
+
+    fundamentals are frequencies (Hz), e.g. TuningTable.frequencies, or Notes, e.g. the values of
+    instruments.tar_instrument.tar_string().
+    """
+    if partial_count <= 0:
+        raise ValueError(f"Number of partials must be positive: {partial_count}")
+    if not isinstance(fundamentals, np.ndarray):
+        fundamentals = list(fundamentals)  # e.g. the dict_values of tar_string(), not indexable
+    if len(fundamentals) > 0 and isinstance(fundamentals[0], Note):
+        fundamentals = [
+            note.frequency.value if isinstance(note, Note) else note for note in fundamentals
+        ]
+    fundamentals = np.asarray(fundamentals, dtype=np.float64)
+    if fundamentals.ndim != 1 or np.any(fundamentals <= 0):
+        raise ValueError("Fundamentals must be a 1D sequence of positive frequencies")
+    return np.multiply.outer(fundamentals, np.arange(1, partial_count + 1))
+
+
+def nearest_notes(partials: np.ndarray, table: TuningTable) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the absolute steps of the closest notes of a tuning table to partials (of any
+    shape), and how far in cents each partial is from its note (positive if sharper).
+
+    Partials out of the range of the table are at step OUT_OF_RANGE, and NaN cents away.
+    """
+    partials = np.asarray(partials, dtype=np.float64)
+    lowest, highest = table.frequencies[0], table.frequencies[-1]
+    valid = (partials >= lowest) & (partials <= highest)
+    steps = np.full(partials.shape, OUT_OF_RANGE, dtype=np.int64)
+    steps[valid] = table.nearest_steps(partials[valid])
+    cents = np.full(partials.shape, np.nan)
+    cents[valid] = CENTS_PER_OCTAVE * np.log2(partials[valid] / table.frequencies[steps[valid]])
+    return steps, cents
+
+
+@dataclass(frozen=True, slots=True)
+class PartialCollisions:
+    """Pairs of partials of two different notes that are within a tolerance of each other
+
+    Row k is the pair (note_indices[k, 0], partial_numbers[k, 0]) and (note_indices[k, 1],
+    partial_numbers[k, 1]), the first being the lower (or equal) partial, cents[k] >= 0 apart.
+    Note indices are rows of the partials matrix, and partial numbers start at 1 (fundamental).
+    """
+
+    note_indices: np.ndarray
+    partial_numbers: np.ndarray
+    cents: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.cents)
+
+
+def find_collisions(partials: np.ndarray, tolerance_cents: float) -> PartialCollisions:
+    """Return every pair of partials of different notes (rows of a harmonic_series() matrix) that
+    are at most tolerance_cents apart.
+
+    All partials are sorted by pitch once: the partials close to one are the next ones in that
+    order, found by a binary search, so the cost is O(P log P) for P partials, plus the number of
+    collisions, instead of comparing all P * P pairs.
+    """
+    if tolerance_cents < 0:
+        raise ValueError(f"Tolerance must not be negative: {tolerance_cents}")
+    partials = np.asarray(partials, dtype=np.float64)
+    if partials.ndim != 2:
+        raise ValueError(f"Expected a (notes x partials) matrix, got shape {partials.shape}")
+    pitches = CENTS_PER_OCTAVE * np.log2(partials.ravel())
+    order = np.argsort(pitches, kind="stable")
+    sorted_pitches = pitches[order]
+    # every partial is paired with the next ones, up to tolerance_cents higher
+    ends = np.searchsorted(sorted_pitches, sorted_pitches + tolerance_cents, side="right")
+    counts = ends - np.arange(len(order)) - 1
+    lower = np.repeat(np.arange(len(order)), counts)
+    # offset of every pair in the run of pairs of its lower partial: 1, 2, ..., count
+    offsets = np.arange(len(lower)) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+    pairs = np.stack([order[lower], order[lower + offsets]], axis=1)
+    note_indices, partial_indices = np.divmod(pairs, partials.shape[1])
+    different = note_indices[:, 0] != note_indices[:, 1]
+    pairs = pairs[different]
+    return PartialCollisions(
+        note_indices[different],
+        partial_indices[different] + 1,
+        pitches[pairs[:, 1]] - pitches[pairs[:, 0]],
+    )
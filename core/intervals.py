@@ -1,6 +1,11 @@
 """The common musical intervals"""
 
 from enum import Enum
+from typing import Sequence, Union
+
+import numpy as np
+
+CENTS_PER_OCTAVE = 1200
 
 
 class MusicalInterval(Enum):
@@ -20,3 +25,16 @@ class MusicalInterval(Enum):
             MusicalInterval.SEMITONE: 2,
             MusicalInterval.QUARTERTONE: 1,
         }[interval]
+
+
+def cents(
+    frequencies: Union[float, Sequence[float], np.ndarray],
+    reference_frequencies: Union[float, Sequence[float], np.ndarray],
+) -> np.ndarray:
+    """Return the interval from reference to frequencies in cents (100 cents = 1 semitone)
+
+    NOTE: positive means higher (sharper) than the reference. Inputs are broadcast together.
+    """
+    return CENTS_PER_OCTAVE * np.log2(
+        np.asarray(frequencies, dtype=np.float64) / np.asarray(reference_frequencies)
+    )
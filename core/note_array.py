@@ -0,0 +1,145 @@
+"""Columnar, vectorized representation of many notes"""
+
+from typing import Any, List, Sequence, Union
+
+import numpy as np
+
+from core.frequency import Frequency
+from core.note_names import (
+    A4_STEP,
+    MAX_OCTAVE,
+    MIN_OCTAVE,
+    QUARTERTONES_PER_OCTAVE,
+    STANDARD_NOTES,
+    parse_note_name,
+)
+from core.notes import Note
+from core.tuning import tuning_table
+
+
+class NoteArray:
+    """A batch of notes stored as NumPy columns, all sharing the same A4 reference.
+
+    Each note is represented by its quartertone index in STANDARD_NOTES["quartertone"], its octave
+    number and its frequency. No Note object is created unless explicitly asked by to_notes().
+
+    NOTE: notes are stored in their standard form, e.g. "Eb4" is stored (and named) as "D#4".
+    """
+
+    def __init__(self, index: np.ndarray, octave: np.ndarray, a4_frequency: Frequency):
+        self.index = np.asarray(index, dtype=np.int64)
+        self.octave = np.asarray(octave, dtype=np.int64)
+        if self.index.shape != self.octave.shape or self.index.ndim != 1:
+            raise ValueError("index and octave must be 1D arrays of the same length")
+        if np.any((self.index < 0) | (self.index >= QUARTERTONES_PER_OCTAVE)):
+            raise ValueError("Quartertone index out of range [0, 24)")
+        if np.any((self.octave < MIN_OCTAVE) | (self.octave > MAX_OCTAVE)):
+            raise ValueError(f"Octave out of range [{MIN_OCTAVE}, {MAX_OCTAVE}]")
+        self.a4_frequency = a4_frequency
+        self.frequency = tuning_table(a4_frequency)[self.steps]
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __repr__(self) -> str:
+        return f"NoteArray({len(self)} notes, A4: {self.a4_frequency} Hz)"
+
+    def __getitem__(self, key: Any) -> "NoteArray":
+        index = np.atleast_1d(self.index[key])
+        octave = np.atleast_1d(self.octave[key])
+        return NoteArray(index, octave, self.a4_frequency)
+
+    @property
+    def steps(self) -> np.ndarray:
+        """Absolute quartertone step of each note (see core.note_names.absolute_step)"""
+        return (self.octave - MIN_OCTAVE) * QUARTERTONES_PER_OCTAVE + self.index
+
+    @property
+    def steps_from_a4(self) -> np.ndarray:
+        """Signed quartertone distance of each note from A4"""
+        return self.steps - A4_STEP
+
+    @property
+    def names(self) -> List[str]:
+        """Standard names of the notes (e.g. ["C4", "Dk4"])"""
+        letters = np.asarray(STANDARD_NOTES["quartertone"])[self.index]
+        return [f"{letter}{octave}" for letter, octave in zip(letters, self.octave.tolist())]
+
+    def _steps_of(self, other: Any) -> np.ndarray:
+        if not isinstance(other, (NoteArray, Note)):
+            raise NotImplementedError(f"Type {type(other)} is not supported for comparison")
+        if other.a4_frequency != self.a4_frequency:
+            raise ValueError("Cannot compare notes with different A4 frequencies")
+        if isinstance(other, NoteArray):
+            return other.steps
+        return np.asarray(other.step)
+
+    def __eq__(self, other: Any) -> np.ndarray:  # type: ignore[override]
+        return self.steps == self._steps_of(other)
+
+    def __ne__(self, other: Any) -> np.ndarray:  # type: ignore[override]
+        return self.steps != self._steps_of(other)
+
+    def __lt__(self, other: Any) -> np.ndarray:
+        return self.steps < self._steps_of(other)
+
+    def __le__(self, other: Any) -> np.ndarray:
+        return self.steps <= self._steps_of(other)
+
+    def __gt__(self, other: Any) -> np.ndarray:
+        return self.steps > self._steps_of(other)
+
+    def __ge__(self, other: Any) -> np.ndarray:
+        return self.steps >= self._steps_of(other)
+
+    def transpose(self, quartertone_steps: Union[int, np.ndarray]) -> "NoteArray":
+        """Return a new NoteArray with every note shifted by (signed) quartertone steps.
+
+        quartertone_steps is either a single int or an array broadcastable to len(self).
+        """
+        steps = self.steps + np.asarray(quartertone_steps, dtype=np.int64)
+        return NoteArray.from_steps(steps, self.a4_frequency)
+
+    @staticmethod
+    def from_steps(steps: np.ndarray, a4_frequency: Frequency) -> "NoteArray":
+        """Create a NoteArray from absolute quartertone steps"""
+        octave_offset, index = np.divmod(np.asarray(steps, dtype=np.int64), QUARTERTONES_PER_OCTAVE)
+        return NoteArray(index, octave_offset + MIN_OCTAVE, a4_frequency)
+
+    @staticmethod
+    def from_names(names: Sequence[str], a4_frequency: Frequency) -> "NoteArray":
+        """Create a NoteArray from note names.
+
+        Each distinct name is parsed only once, no matter how many times it repeats.
+        """
+        unique_names, inverse = np.unique(np.asarray(names, dtype=str), return_inverse=True)
+        unique_steps = np.array(
+            [parse_note_name(name).step for name in unique_names.tolist()], dtype=np.int64
+        )
+        return NoteArray.from_steps(unique_steps[inverse.reshape(-1)], a4_frequency)
+
+    @staticmethod
+    def from_frequencies(
+        frequencies: Union[Sequence[float], np.ndarray], a4_frequency: Frequency
+    ) -> "NoteArray":
+        """Create a NoteArray by snapping each frequency (Hz) to its closest quartertone note.
+
+        This is the batch equivalent of frequency_to_note().
+        """
+        return NoteArray.from_steps(
+            tuning_table(a4_frequency).nearest_steps(frequencies), a4_frequency
+        )
+
+    @staticmethod
+    def from_notes(notes: Sequence[Note]) -> "NoteArray":
+        """Create a NoteArray from a list of Note objects, all sharing the same A4 frequency"""
+        if len(notes) == 0:
+            raise ValueError("Cannot infer the A4 frequency from an empty list of notes")
+        a4_frequency = notes[0].a4_frequency
+        if any(note.a4_frequency != a4_frequency for note in notes):
+            raise ValueError("All notes must share the same A4 frequency")
+        return NoteArray.from_names([note.name for note in notes], a4_frequency)
+
+    def to_notes(self) -> List[Note]:
+        """Return a list of Note objects (NOTE: this creates one Python object per note)"""
+        return [Note.from_name(name, self.a4_frequency) for name in self.names]
@@ -0,0 +1,59 @@
+"""Nearest-note search over an arbitrary collection of notes"""
+
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.frequency import Frequency
+from core.intervals import CENTS_PER_OCTAVE
+from core.notes import Note
+
+
+class NoteSearchIndex:
+    """Snap frequencies to the nearest note of a given note set (e.g. frets of a string, or keys of
+    a piano), and report the deviation in cents.
+
+    Notes are sorted once by pitch. A batch query is then a single np.searchsorted over the
+    midpoints (in log2 domain, i.e. in pitch) between consecutive notes.
+    """
+
+    def __init__(self, notes: Sequence[Note]):
+        if len(notes) == 0:
+            raise ValueError("Cannot build a search index over an empty collection of notes")
+        frequencies = np.array([note.frequency.value for note in notes], dtype=np.float64)
+        order = np.argsort(frequencies, kind="stable")
+        self.notes: List[Note] = [notes[i] for i in order]
+        self.frequencies = frequencies[order]
+        self._log2_frequencies = np.log2(self.frequencies)
+        self._log2_boundaries = (self._log2_frequencies[1:] + self._log2_frequencies[:-1]) / 2
+
+    def __len__(self) -> int:
+        return len(self.notes)
+
+    def query(
+        self, frequencies: Union[float, Sequence[float], np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (indices into self.notes, deviations in cents) of the nearest note to each
+        frequency (Hz).
+
+        NOTE: positive deviation means the frequency is higher (sharper) than the nearest note.
+        """
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        if np.any(frequencies <= 0):
+            raise ValueError("Frequencies must be non-zero and positive")
+        log2_frequencies = np.log2(frequencies)
+        indices = np.searchsorted(self._log2_boundaries, log2_frequencies)
+        deviations = CENTS_PER_OCTAVE * (log2_frequencies - self._log2_frequencies[indices])
+        return indices, deviations
+
+    def nearest_notes(
+        self, frequencies: Union[Sequence[float], np.ndarray]
+    ) -> Tuple[List[Note], np.ndarray]:
+        """Return the nearest Note to each frequency (Hz), and the deviations in cents"""
+        indices, deviations = self.query(frequencies)
+        return [self.notes[i] for i in np.ravel(indices).tolist()], deviations
+
+    def nearest(self, frequency: Frequency) -> Tuple[Note, float]:
+        """Return the nearest Note to the frequency, and the deviation in cents"""
+        indices, deviations = self.query(frequency.value)
+        return self.notes[int(indices)], float(deviations)
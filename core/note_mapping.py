@@ -0,0 +1,67 @@
+"""Read-only mappings to notes that are only created when accessed"""
+
+from typing import Dict, Iterator, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from core.frequency import Frequency
+from core.note_names import STEP_COUNT, STEP_NAMES
+from core.notes import Note, cached_note
+
+
+class LazyNoteMapping(Mapping[int, Note]):
+    """An ordered, read-only mapping of keys (e.g. fret or key numbers) to the notes at absolute
+    steps (see core.note_names), all sharing one A4 reference.
+
+    Only the steps are stored: a Note is created (or found in the cached_note() cache) when it is
+    accessed, so a mapping of many notes costs two integer arrays until it is used.
+    """
+
+    __slots__ = ("a4_frequency", "_keys", "_steps", "_positions")
+
+    def __init__(
+        self,
+        keys: Union[Sequence[int], np.ndarray],
+        steps: Union[Sequence[int], np.ndarray],
+        a4_frequency: Frequency,
+    ):
+        # copies, frozen below, so that the arrays of the caller are left as they are
+        keys = np.array(keys, dtype=np.int64)
+        steps = np.array(steps, dtype=np.int64)
+        if keys.ndim != 1 or keys.shape != steps.shape:
+            raise ValueError("keys and steps must be 1D arrays of the same length")
+        if np.any((steps < 0) | (steps >= STEP_COUNT)):
+            raise ValueError(f"Steps must be in range [0, {STEP_COUNT})")
+        if len(np.unique(keys)) != len(keys):
+            raise ValueError("Keys must be unique")
+        keys.flags.writeable = False
+        steps.flags.writeable = False
+        self.a4_frequency = a4_frequency
+        self._keys = keys
+        self._steps = steps
+        self._positions: Optional[Dict[int, int]] = None
+
+    @property
+    def keys_array(self) -> np.ndarray:
+        """The keys, in order, as a read-only array"""
+        return self._keys
+
+    @property
+    def steps(self) -> np.ndarray:
+        """Absolute step of the note of every key, in order, as a read-only array"""
+        return self._steps
+
+    def __getitem__(self, key: int) -> Note:
+        if self._positions is None:
+            self._positions = {key: position for position, key in enumerate(self._keys.tolist())}
+        position = self._positions[key]  # KeyError for a missing key, as a Mapping should
+        return cached_note(STEP_NAMES[self._steps[position]], self.a4_frequency)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._keys.tolist())
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"LazyNoteMapping({len(self)} notes, A4: {self.a4_frequency} Hz)"
@@ -0,0 +1,170 @@
+"""Note names and a precompiled note name parser"""
+
+from typing import Dict, List, NamedTuple, Tuple
+
+from core.accidentals import SYMBOL_TO_NAME_MAP, Accidental
+from core.octaves import NUMBER_TO_NAME_MAP, Octave
+
+STANDARD_NOTES = {
+    "natural": [
+        "C",
+        "D",
+        "E",
+        "F",
+        "G",
+        "A",
+        "B",
+    ],
+    "semitone": [
+        "C",
+        "C#",
+        "D",
+        "D#",
+        "E",
+        "F",
+        "F#",
+        "G",
+        "G#",
+        "A",
+        "A#",
+        "B",
+    ],
+    "quartertone": [
+        "C",
+        "Cs",
+        "C#",
+        "Dk",
+        "D",
+        "Ds",
+        "D#",
+        "Ek",
+        "E",
+        "Es",
+        "F",
+        "Fs",
+        "F#",
+        "Gk",
+        "G",
+        "Gs",
+        "G#",
+        "Ak",
+        "A",
+        "As",
+        "A#",
+        "Bk",
+        "B",
+        "Bs",
+    ],
+}
+
+
+CONVERSION_TO_STANDARD_NOTE = {
+    "E#": "F",
+    "B#": "C",
+    "Cb": "B",
+    "Fb": "E",
+    "Db": "C#",
+    "Eb": "D#",
+    "Gb": "F#",
+    "Ab": "G#",
+    "Bb": "A#",
+    "Ck": "Bs",
+    "Fk": "Es",
+}
+
+# Standardizing these letter+accidentals moves the note to the next octave
+OCTAVE_CHANGING_CONVERSIONS = {"B#": 1}
+
+LETTERS = ["C", "D", "E", "F", "G", "A", "B"]
+QUARTERTONES_PER_OCTAVE = len(STANDARD_NOTES["quartertone"])
+MIN_OCTAVE = min(NUMBER_TO_NAME_MAP)
+MAX_OCTAVE = max(NUMBER_TO_NAME_MAP)
+# Number of distinct (standard) quartertone pitches over the whole octave range
+STEP_COUNT = (MAX_OCTAVE - MIN_OCTAVE + 1) * QUARTERTONES_PER_OCTAVE
+
+
+def absolute_step(quartertone_index: int, octave_number: int) -> int:
+    """Return the quartertone distance of a standard note from the lowest note, C-1"""
+    return (octave_number - MIN_OCTAVE) * QUARTERTONES_PER_OCTAVE + quartertone_index
+
+
+def index_and_octave(step: int) -> Tuple[int, int]:
+    """Return (quartertone index, octave number) of the standard note at an absolute step"""
+    octave_offset, quartertone_index = divmod(step, QUARTERTONES_PER_OCTAVE)
+    return quartertone_index, octave_offset + MIN_OCTAVE
+
+
+A4_STEP = absolute_step(STANDARD_NOTES["quartertone"].index("A"), 4)
+
+
+class ParsedName(NamedTuple):
+    """Components of a note name, as written, and the position of its standard equivalent"""
+
+    letter: str
+    accidental: Accidental
+    octave: Octave
+    quartertone_index: int  # index of the standard equivalent in STANDARD_NOTES["quartertone"]
+    step: int  # absolute step of the standard equivalent, see absolute_step()
+
+
+def _build_quartertone_index_table() -> Dict[str, int]:
+    table = {}
+    for letter in LETTERS:
+        for symbol in SYMBOL_TO_NAME_MAP:
+            letter_accidental = f"{letter}{symbol}"
+            standard = CONVERSION_TO_STANDARD_NOTE.get(letter_accidental, letter_accidental)
+            table[letter_accidental] = STANDARD_NOTES["quartertone"].index(standard)
+    return table
+
+
+# Every valid letter+accidental, mapped to the index of its standard equivalent in
+# STANDARD_NOTES["quartertone"]
+QUARTERTONE_INDEX = _build_quartertone_index_table()
+
+
+def _build_name_table() -> Dict[str, ParsedName]:
+    table = {}
+    for letter in LETTERS:
+        for symbol in SYMBOL_TO_NAME_MAP:
+            letter_accidental = f"{letter}{symbol}"
+            quartertone_index = QUARTERTONE_INDEX[letter_accidental]
+            octave_shift = OCTAVE_CHANGING_CONVERSIONS.get(letter_accidental, 0)
+            for octave_number in NUMBER_TO_NAME_MAP:
+                if octave_number + octave_shift not in NUMBER_TO_NAME_MAP:
+                    continue  # e.g. B#9 is C10, which is out of range
+                table[f"{letter_accidental}{octave_number}"] = ParsedName(
+                    letter,
+                    Accidental.from_symbol(symbol),
+                    Octave.from_number(octave_number),
+                    quartertone_index,
+                    absolute_step(quartertone_index, octave_number + octave_shift),
+                )
+    return table
+
+
+def _build_step_names() -> List[str]:
+    return [
+        f"{STANDARD_NOTES['quartertone'][index]}{octave}"
+        for index, octave in map(index_and_octave, range(STEP_COUNT))
+    ]
+
+
+# Every valid note name, mapped to its parsed components
+_NAME_TABLE = _build_name_table()
+# Standard note name at every absolute step
+STEP_NAMES = _build_step_names()
+
+
+def parse_note_name(name: str) -> ParsedName:
+    """Parse and validate a note name (e.g. "Dk4") with a single table lookup"""
+    try:
+        return _NAME_TABLE[name]
+    except KeyError:
+        raise ValueError(f"Invalid note name: {name}") from None
+
+
+def step_to_name(step: int) -> str:
+    """Return the standard note name at an absolute step"""
+    if not 0 <= step < STEP_COUNT:
+        raise ValueError(f"Step {step} is out of range [0, {STEP_COUNT})")
+    return STEP_NAMES[step]
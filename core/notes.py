@@ -1,133 +1,45 @@
 """Musical note and utils"""
 
-import re
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Tuple, Union
+from dataclasses import dataclass, field
+from functools import lru_cache, total_ordering
+from typing import Any, List, Sequence, Tuple, Union
 
 import numpy as np
 
 from core.accidentals import Accidental
 from core.frequency import Frequency
 from core.intervals import MusicalInterval
+from core.note_names import (
+    LETTERS,
+    STANDARD_NOTES,
+    STEP_COUNT,
+    STEP_NAMES,
+    ParsedName,
+    parse_note_name,
+    step_to_name,
+)
 from core.octaves import Octave
+from core.tuning import frequency_sweep, tuning_table
+from core.validation import is_strict
 
-STANDARD_NOTES = {
-    "natural": [
-        "C",
-        "D",
-        "E",
-        "F",
-        "G",
-        "A",
-        "B",
-    ],
-    "semitone": [
-        "C",
-        "C#",
-        "D",
-        "D#",
-        "E",
-        "F",
-        "F#",
-        "G",
-        "G#",
-        "A",
-        "A#",
-        "B",
-    ],
-    "quartertone": [
-        "C",
-        "Cs",
-        "C#",
-        "Dk",
-        "D",
-        "Ds",
-        "D#",
-        "Ek",
-        "E",
-        "Es",
-        "F",
-        "Fs",
-        "F#",
-        "Gk",
-        "G",
-        "Gs",
-        "G#",
-        "Ak",
-        "A",
-        "As",
-        "A#",
-        "Bk",
-        "B",
-        "Bs",
-    ],
-}
-
-
-CONVERSION_TO_STANDARD_NOTE = {
-    "E#": "F",
-    "B#": "C",
-    "Cb": "B",
-    "Fb": "E",
-    "Db": "C#",
-    "Eb": "D#",
-    "Gb": "F#",
-    "Ab": "G#",
-    "Bb": "A#",
-    "Ck": "Bs",
-    "Fk": "Es",
-}
-
-
-def _standardize_letter_accidental(letter_accidental: str) -> str:
-    return CONVERSION_TO_STANDARD_NOTE.get(letter_accidental, letter_accidental)
-
-
-def _index_in_standard_notes_list(letter_accidental: str) -> int:
-    # pylint: disable=fixme
-    # TODO: currently only supports standard notes with quartertone
-    letter_accidental_standard = _standardize_letter_accidental(letter_accidental)
-    return STANDARD_NOTES["quartertone"].index(f"{letter_accidental_standard}")
-
-
-def _trailing_number(s: str) -> int:
-    """Return an integer from the end of a string."""
-    match = re.search(r"-?\d+$", s)
-    if match:
-        return int(match.group())
-    raise ValueError(f"No integer found at the end of '{s}'")
+# Upper bound on the number of shared notes kept by cached_note(), least recently used are evicted
+NOTE_CACHE_MAXSIZE = 4096
 
 
 def _validate_letter(letter: str):
     """validates that the note letter is valid"""
-    if letter not in ["A", "B", "C", "D", "E", "F", "G"]:
+    if letter not in LETTERS:
         raise ValueError(f"Invalid note letter: {letter}")
 
 
-def _decompose_letter_accidental(letter_accidental: str) -> Tuple[str, Accidental]:
-    letter_accidental_standard = letter_accidental
-    if len(letter_accidental_standard) == 1:
-        letter, accidental_symbol = letter_accidental_standard, ""
-    elif len(letter_accidental_standard) == 2:
-        letter, accidental_symbol = letter_accidental_standard[0], letter_accidental_standard[1]
-    else:
-        raise ValueError(f"Letter+Accidental should be 1 or 2 char, got: {letter_accidental}")
-    accidental = Accidental.from_symbol(accidental_symbol)
-    _validate_letter(letter)
-    return letter, accidental
-
-
 def _decompose_name(name: str) -> Tuple[str, Accidental, Octave]:
     """Return (letter, accidental, octave) from the name
 
-    It validates the name correctness.
+    It validates the name correctness, including the range of its standard equivalent
+    (e.g. B#9 is C10, which is out of range).
     """
-    # pylint: disable=fixme
-    # TODO: B#9 is technically out of range, but this function does not notice it!
-    octave = Octave.from_number(_trailing_number(name))
-    letter_accidental = name[: -len(str(octave))]
-    letter, accidental = _decompose_letter_accidental(letter_accidental)
-    return letter, accidental, octave
+    parsed = parse_note_name(name)
+    return parsed.letter, parsed.accidental, parsed.octave
 
 
 def _standardize_note(
@@ -137,29 +49,30 @@ def _standardize_note(
 
     Makes sure that the note belong set of "standard notes"
     """
-    _ = _decompose_name(f"{letter}{accidental}{octave}")  # Validate name correctness
-    letter_accidental = f"{letter}{accidental}"
-    new_octave = octave + 1 if letter_accidental == "B#" else octave
-    letter_accidental_standard = _standardize_letter_accidental(letter_accidental)
-    new_letter, new_accidental = _decompose_letter_accidental(letter_accidental_standard)
-    return new_letter, new_accidental, new_octave
-
-
-def _compute_frequency(
-    letter: str, accidental: Accidental, octave: Octave, a4_frequency: Frequency
-) -> Frequency:
-    """Calculate the frequency of a note."""
-    # pylint: disable=invalid-name
-    letter, accidental, octave = _standardize_note(letter, accidental, octave)
-    note_index = _index_in_standard_notes_list(f"{letter}{accidental}")
-    A_index = _index_in_standard_notes_list("A")
-    quartertone_steps_from_A4 = note_index - A_index + (octave.number - 4) * 24
-    return a4_frequency * 2 ** (quartertone_steps_from_A4 / 24)
-
-
-@dataclass
+    step = parse_note_name(f"{letter}{accidental}{octave}").step
+    return _decompose_name(step_to_name(step))
+
+
+def _step_frequency(step: int, a4_frequency: Frequency) -> Frequency:
+    """Look up the frequency of the note at an absolute step (see core.note_names)"""
+    return tuning_table(a4_frequency).frequency(step)
+
+
+@total_ordering
+@dataclass(frozen=True, slots=True)
 class Note:
-    """A representation of musical note with helper functions"""
+    """A representation of musical note with helper functions
+
+    NOTE: Notes are immutable, which allows sharing instances (see cached_note()).
+    NOTE: Notes created directly are always validated. Notes created by the library from values
+          that are correct by construction (e.g. from_name) skip the validation, unless the
+          validation policy is strict (see core.validation).
+    NOTE: The identity of a note is its (standard) absolute quartertone step and its A4 reference.
+          Notes are hashable and totally ordered on it, e.g. "Eb4" == "D#4" and "Eb4" < "E4".
+          Notes of different A4 references are ordered by step first, then by A4 reference, and
+          are never equal (compare their .frequency to compare pitches).
+          sorted(notes, key=attrgetter("step")) avoids Python level comparisons altogether.
+    """
 
     # pylint: disable=fixme
     # TODO: Except a4_frequency, all others could be optional at creation (use builder pattern?)
@@ -170,6 +83,8 @@ class Note:
     octave: Octave
     frequency: Frequency
     a4_frequency: Frequency
+    # absolute quartertone step of the standard equivalent (see core.note_names), from the name
+    step: int = field(init=False, repr=False)
 
     def __str__(self) -> str:
         return self.name
@@ -178,8 +93,8 @@ class Note:
         return f"{self.name}: {self.frequency} Hz"
 
     def __post_init__(self):
-        letter, accidental, octave = _decompose_name(self.name)
-        frequency = _compute_frequency(letter, accidental, octave, self.a4_frequency)
+        letter, accidental, octave, _, step = parse_note_name(self.name)
+        frequency = _step_frequency(step, self.a4_frequency)
         if letter != self.letter:
             raise ValueError(f"Letter does not match the name: {letter} vs {self.name}")
         if accidental != self.accidental:
@@ -190,53 +105,50 @@ class Note:
             raise ValueError(f"Octave does not match the name: {octave} vs {self.octave}")
         if frequency != self.frequency:
             raise ValueError(f"Frequency does not match the name: {frequency} vs {self.frequency}")
-
-    def _eq_to_frequency(self, other_frequency: Union[Frequency, int, float]) -> bool:
-        return self.frequency == other_frequency
-
-    def _eq_to_note(self, other: "Note") -> bool:
-        return self._eq_to_frequency(other.frequency)
+        object.__setattr__(self, "step", step)
 
     def __eq__(self, other: Any) -> bool:
-        type_dispatch: Dict[type, Callable] = {
-            Frequency: self._eq_to_frequency,
-            float: self._eq_to_frequency,
-            int: self._eq_to_frequency,
-            Note: self._eq_to_note,
-        }
         other_type = type(other)
-        if other_type not in type_dispatch:
-            raise NotImplementedError(f"Type {other_type} is not supported for comparison")
-        return type_dispatch[other_type](other)
+        if other_type is Note:
+            return self.step == other.step and self.a4_frequency.value == other.a4_frequency.value
+        if other_type in _FREQUENCY_TYPES:
+            return self.frequency == other
+        raise NotImplementedError(f"Type {other_type} is not supported for comparison")
+
+    def __lt__(self, other: Any) -> bool:
+        other_type = type(other)
+        if other_type is Note:
+            return (self.step, self.a4_frequency.value) < (other.step, other.a4_frequency.value)
+        if other_type in _FREQUENCY_TYPES:
+            return self.frequency < other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.step, self.a4_frequency.value))
 
     def __add__(self, other: Any) -> "Note":
-        """Return a Note that is the transposed version of self by the specified interval"""
-        if not isinstance(other, MusicalInterval):
-            raise NotImplementedError(f"Type {type(other)} is not supported")
-        quartertone_steps = MusicalInterval.as_quartertone_steps(other)
-
-        note_index = _index_in_standard_notes_list(f"{self.letter}{self.accidental}")
-        if note_index + quartertone_steps >= len(STANDARD_NOTES["quartertone"]):
-            new_octave = self.octave + 1
-        else:
-            new_octave = self.octave
-        new_note_index = (note_index + quartertone_steps) % len(STANDARD_NOTES["quartertone"])
-        new_name = f"{STANDARD_NOTES['quartertone'][new_note_index]}{new_octave.number}"
-        new_letter, new_accidental, _ = _decompose_name(new_name)
-        # computing the frequency this way has the advantage that it will be tested against
-        # the _compute_frequency approach executed in the __post_init__
-        frequency_ratio = MusicalInterval.QUARTERTONE.value**quartertone_steps
-        new_frequency = Frequency(self.frequency.value * frequency_ratio)
-        return Note(
-            new_name, new_letter, new_accidental, new_octave, new_frequency, self.a4_frequency
-        )
+        """Return a Note that is the transposed version of self by the specified interval, or by a
+        (signed) number of quartertone steps"""
+        return self.transpose(_as_quartertone_steps(other))
+
+    def __sub__(self, other: Any) -> "Note":
+        """Return a Note that is the transposed version of self, down by the specified interval or
+        number of quartertone steps"""
+        return self.transpose(-_as_quartertone_steps(other))
+
+    def transpose(self, quartertone_steps: int) -> "Note":
+        """Return a Note that is self shifted by a signed number of quartertone steps.
+
+        The octave wraps in both directions (e.g. "C4" - 1 -> "Bs3"). Name of the new note is
+        looked up by its absolute step, and its frequency comes from the tuning table of the A4
+        reference, so no name is parsed and no power is computed.
+        """
+        return cached_note(step_to_name(self.step + quartertone_steps), self.a4_frequency)
 
     @staticmethod
     def from_name(name: str, a4_frequency: Frequency) -> "Note":
         """Create and return an object of type Note from the given name"""
-        letter, accidental, octave = _decompose_name(name)
-        frequency = _compute_frequency(letter, accidental, octave, a4_frequency)
-        return Note(name, letter, accidental, octave, frequency, a4_frequency)
+        return _trusted_note(name, parse_note_name(name), a4_frequency)
 
     def frequency_difference(self, other: Frequency) -> float:
         """Return the frequency distance between self and other Note.
@@ -251,20 +163,112 @@ class Note:
         return self.frequency.value - other.value
 
 
+_FREQUENCY_TYPES = (Frequency, float, int)
+
+
+def _as_quartertone_steps(other: Any) -> int:
+    if isinstance(other, MusicalInterval):
+        return MusicalInterval.as_quartertone_steps(other)
+    if isinstance(other, (int, np.integer)) and not isinstance(other, bool):
+        return int(other)
+    raise NotImplementedError(f"Type {type(other)} is not supported")
+
+
+_NOTE_INIT_FIELDS = ("name", "letter", "accidental", "octave", "frequency", "a4_frequency")
+
+
+def _trusted_note(name: str, parsed: ParsedName, a4_frequency: Frequency) -> Note:
+    """Create a Note from an already parsed name, skipping validation unless policy is strict"""
+    values = (
+        name,
+        parsed.letter,
+        parsed.accidental,
+        parsed.octave,
+        _step_frequency(parsed.step, a4_frequency),
+        a4_frequency,
+    )
+    if is_strict():
+        return Note(*values)
+    note = object.__new__(Note)
+    for field_name, value in zip(_NOTE_INIT_FIELDS, values):
+        object.__setattr__(note, field_name, value)
+    object.__setattr__(note, "step", parsed.step)
+    return note
+
+
+@lru_cache(maxsize=64)
+def _shared_a4_frequency(a4_frequency_value: float) -> Frequency:
+    return Frequency(a4_frequency_value)
+
+
+@lru_cache(maxsize=NOTE_CACHE_MAXSIZE)
+def _cached_note(name: str, a4_frequency_value: float) -> Note:
+    # notes of the same A4 reference share one (immutable) Frequency object for it
+    return Note.from_name(name, _shared_a4_frequency(a4_frequency_value))
+
+
+def cached_note(name: str, a4_frequency: Frequency) -> Note:
+    """Return a shared Note instance for the given name and A4 frequency
+
+    Notes are interned in a bounded LRU cache keyed by (name, a4_frequency), so repeated requests
+    for the same note do not parse the name and compute the frequency again.
+    See note_cache_info() and clear_note_cache().
+    """
+    return _cached_note(name, float(a4_frequency.value))
+
+
+def note_cache_info():
+    """Return hits, misses, maxsize and current size of the cached_note() cache"""
+    return _cached_note.cache_info()  # pylint: disable=no-value-for-parameter
+
+
+def clear_note_cache():
+    """Empty the cached_note() cache and reset its statistics"""
+    _cached_note.cache_clear()
+
+
+def transpose_notes(
+    notes: Sequence[Note], quartertone_steps: Union[int, Sequence[int]]
+) -> List[Note]:
+    """Return the notes, each shifted by a signed number of quartertone steps
+
+    quartertone_steps is either a single int for all notes, or one int per note.
+    All new steps are computed (and validated) at once, before any Note is looked up.
+    """
+    offsets = np.asarray(quartertone_steps, dtype=np.int64)
+    if offsets.ndim != 0 and offsets.shape != (len(notes),):
+        raise ValueError("quartertone_steps must be an int, or one int per note")
+    steps = np.array([note.step for note in notes], dtype=np.int64) + offsets
+    if np.any((steps < 0) | (steps >= STEP_COUNT)):
+        raise ValueError(f"Transposed notes must be in range of steps [0, {STEP_COUNT})")
+    return [
+        cached_note(STEP_NAMES[step], note.a4_frequency)
+        for note, step in zip(notes, steps.tolist())
+    ]
+
+
 def standard_notes(mode: str, octave: Octave, a4_frequency: Frequency) -> List[Note]:
     """Return a list of standard notes"""
     if mode not in STANDARD_NOTES:
         raise ValueError(f"mode is not supported: {mode}")
-    return [Note.from_name(f"{name}{octave.number}", a4_frequency) for name in STANDARD_NOTES[mode]]
+    return [cached_note(f"{name}{octave.number}", a4_frequency) for name in STANDARD_NOTES[mode]]
+
+
+def standard_notes_sweep(
+    mode: str, octave: Octave, a4_frequencies: Sequence[float]
+) -> Tuple[List[str], np.ndarray]:
+    """Return names of the standard notes and their (A4 references x notes) frequency matrix
+
+    Vectorized equivalent of calling standard_notes() once per A4 reference.
+    """
+    if mode not in STANDARD_NOTES:
+        raise ValueError(f"mode is not supported: {mode}")
+    names = [f"{name}{octave.number}" for name in STANDARD_NOTES[mode]]
+    steps = [parse_note_name(name).step for name in names]
+    return names, frequency_sweep(a4_frequencies, steps)
 
 
 def frequency_to_note(frequency: Frequency, a4_frequency: Frequency) -> Note:
     """Return Note from specified frequency"""
-    # pylint: disable=invalid-name
-    quartertone_steps_from_A4 = 24 * np.log2(frequency.value / a4_frequency.value)
-    A_index = _index_in_standard_notes_list("A")
-    note_index_float = A_index + quartertone_steps_from_A4
-    note_index = int(np.round(note_index_float)) % 24
-    letter_accidental = STANDARD_NOTES["quartertone"][note_index]
-    octave = int(4 + np.round(note_index_float) // 24)
-    return Note.from_name(f"{letter_accidental}{octave}", a4_frequency)
+    step = int(tuning_table(a4_frequency).nearest_steps(frequency.value))
+    return cached_note(step_to_name(step), a4_frequency)
@@ -2,7 +2,8 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict
+from functools import lru_cache
+from typing import Any
 
 NUMBER_TO_NAME_MAP = {
     -1: "subsubcontra",
@@ -19,7 +20,7 @@ NUMBER_TO_NAME_MAP = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Octave:
     """An octave (perfect octave, the diapason) is the interval between one musical
     pitch and another with double its frequency"""
@@ -51,15 +52,18 @@ class Octave:
         return self.name == other.name and self.number == other.number
 
     def __eq__(self, other: Any) -> bool:
-        type_dispatch: Dict[type, Callable] = {
-            str: self._eq_to_name,
-            int: self._eq_to_number,
-            Octave: self._eq_to_octave,
-        }
         other_type = type(other)
-        if other_type not in type_dispatch:
-            raise NotImplementedError(f"Type {other_type} is not supported for comparison")
-        return type_dispatch[other_type](other)
+        if other_type is Octave:
+            return self._eq_to_octave(other)
+        if other_type is int:
+            return self._eq_to_number(other)
+        if other_type is str:
+            return self._eq_to_name(other)
+        raise NotImplementedError(f"Type {other_type} is not supported for comparison")
+
+    def __hash__(self) -> int:
+        # consistent with __eq__ against Octave and int
+        return hash(self.number)
 
     def __add__(self, other: Any):
         """Adding a number to an octave counts as incrementing it to higher octaves.
@@ -69,6 +73,7 @@ class Octave:
         raise NotImplementedError(f"Type {type(other)} is not supported for add")
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def from_name(name: str) -> "Octave":
         """Return an Octave object from name"""
         if name not in NUMBER_TO_NAME_MAP.values():
@@ -77,6 +82,7 @@ class Octave:
         return octave.value
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def from_number(number: int) -> "Octave":
         """Return an Octave object from name"""
         if number not in NUMBER_TO_NAME_MAP:
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Symbol:
     """A representation for musical symbols"""
 
@@ -23,3 +23,7 @@ class Symbol:
         if isinstance(other, Symbol):
             return self._eq_to_symbol(other)
         raise NotImplementedError(f"Type {type(other)} is not supported for comparison")
+
+    def __hash__(self) -> int:
+        # consistent with __eq__, which compares the simplified form (also against str)
+        return hash(self.simplified)
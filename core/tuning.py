@@ -0,0 +1,130 @@
+"""Precomputed frequencies of all quartertone notes for an A4 reference"""
+
+import csv
+from functools import lru_cache
+from typing import Any, Sequence, TextIO, Tuple, Union
+
+import numpy as np
+
+from core.frequency import Frequency
+from core.note_names import (
+    A4_STEP,
+    QUARTERTONES_PER_OCTAVE,
+    STEP_COUNT,
+    absolute_step,
+    parse_note_name,
+)
+
+# Frequency ratio of every absolute step to A4, i.e. the tuning table of A4 = 1 Hz
+_RATIOS_TO_A4 = np.exp2((np.arange(STEP_COUNT) - A4_STEP) / QUARTERTONES_PER_OCTAVE)
+_RATIOS_TO_A4.flags.writeable = False
+
+# Upper bound on the number of tuning tables (i.e. distinct A4 references) kept by tuning_table()
+TUNING_TABLE_CACHE_MAXSIZE = 64
+
+
+class TuningTable:
+    """The frequency of every standard quartertone note, over the whole octave range, for one A4.
+
+    Frequencies are stored in one read-only array indexed by absolute step (see core.note_names),
+    so the table is safe to share between threads. Look-ups accept:
+    * a note name: table["Dk4"]
+    * a (quartertone index, octave number) pair: table[3, 4]
+    * an absolute step, or an array of them: table[123], table[np.array([0, 138])]
+    Steps out of [0, STEP_COUNT) raise ValueError: negative steps do not wrap around.
+    """
+
+    __slots__ = ("a4_frequency", "frequencies")
+
+    def __init__(self, a4_frequency: Frequency):
+        self.a4_frequency = a4_frequency
+        frequencies = a4_frequency.value * _RATIOS_TO_A4
+        frequencies.flags.writeable = False
+        self.frequencies: np.ndarray = frequencies
+
+    def __len__(self) -> int:
+        return len(self.frequencies)
+
+    def __repr__(self) -> str:
+        return f"TuningTable({len(self)} notes, A4: {self.a4_frequency} Hz)"
+
+    def __getitem__(self, key: Union[str, Tuple[int, int], int, np.ndarray]) -> Any:
+        if isinstance(key, str):
+            return self.frequencies[parse_note_name(key).step]
+        if isinstance(key, tuple):
+            return self.frequencies[self.step_of(*key)]
+        steps = np.asarray(key)
+        if np.issubdtype(steps.dtype, np.integer) and np.any((steps < 0) | (steps >= STEP_COUNT)):
+            raise ValueError(f"Steps must be in range [0, {STEP_COUNT})")
+        return self.frequencies[key]
+
+    @staticmethod
+    def step_of(quartertone_index: int, octave_number: int) -> int:
+        """Return the absolute step of (quartertone index, octave number), validating both"""
+        if not 0 <= quartertone_index < QUARTERTONES_PER_OCTAVE:
+            raise ValueError(f"Quartertone index {quartertone_index} is out of range")
+        step = absolute_step(quartertone_index, octave_number)
+        if not 0 <= step < STEP_COUNT:
+            raise ValueError(f"Octave {octave_number} is out of range")
+        return step
+
+    def frequency(self, step: int) -> Frequency:
+        """Return the frequency of the note at an absolute step"""
+        if not 0 <= step < STEP_COUNT:
+            raise ValueError(f"Step {step} is out of range [0, {STEP_COUNT})")
+        return Frequency(float(self.frequencies[step]))
+
+    def nearest_steps(self, frequencies: Union[float, Sequence[float], np.ndarray]) -> np.ndarray:
+        """Return the absolute step of the closest quartertone note to each frequency (Hz)"""
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        if np.any(frequencies <= 0):
+            raise ValueError("Frequencies must be non-zero and positive")
+        steps_from_a4 = QUARTERTONES_PER_OCTAVE * np.log2(frequencies / self.a4_frequency.value)
+        steps = A4_STEP + np.round(steps_from_a4).astype(np.int64)
+        if np.any((steps < 0) | (steps >= STEP_COUNT)):
+            raise ValueError("Frequency is out of the range of the tuning table")
+        return steps
+
+
+@lru_cache(maxsize=TUNING_TABLE_CACHE_MAXSIZE)
+def _tuning_table(a4_frequency_value: float) -> TuningTable:
+    return TuningTable(Frequency(a4_frequency_value))
+
+
+def tuning_table(a4_frequency: Frequency) -> TuningTable:
+    """Return the shared TuningTable of an A4 reference (computed once, then cached)"""
+    return _tuning_table(float(a4_frequency.value))
+
+
+def frequency_sweep(
+    a4_frequencies: Union[Sequence[float], np.ndarray], steps: Union[Sequence[int], np.ndarray]
+) -> np.ndarray:
+    """Return the (A4 references x notes) matrix of frequencies of notes at absolute steps
+
+    All references are computed in one broadcast operation, e.g. for historical and ensemble
+    pitches: frequency_sweep([415, 430, 440, 442, 466], steps)
+    """
+    a4_frequencies = np.asarray(a4_frequencies, dtype=np.float64)
+    steps = np.asarray(steps, dtype=np.int64)
+    if a4_frequencies.ndim != 1 or steps.ndim != 1:
+        raise ValueError("a4_frequencies and steps must be 1D")
+    if np.any(a4_frequencies <= 0):
+        raise ValueError("A4 frequencies must be non-zero and positive")
+    if np.any((steps < 0) | (steps >= STEP_COUNT)):
+        raise ValueError(f"Steps must be in range [0, {STEP_COUNT})")
+    return np.multiply.outer(a4_frequencies, _RATIOS_TO_A4[steps])
+
+
+def write_sweep_csv(
+    stream: TextIO,
+    a4_frequencies: Union[Sequence[float], np.ndarray],
+    labels: Sequence[str],
+    sweep: np.ndarray,
+):
+    """Write a frequency sweep as CSV: one row per A4 reference, one column per note"""
+    if sweep.shape != (len(a4_frequencies), len(labels)):
+        raise ValueError(f"Sweep shape {sweep.shape} does not match A4 frequencies and labels")
+    writer = csv.writer(stream)
+    writer.writerow(["a4_frequency", *labels])
+    for a4_frequency, row in zip(a4_frequencies, sweep):
+        writer.writerow([a4_frequency, *row.tolist()])
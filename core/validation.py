@@ -0,0 +1,51 @@
+"""Validation policy for objects created by the library's own (trusted) producers
+
+User input is always validated. Objects that the library builds from values that are correct by
+construction (e.g. Note.from_name) are only validated again under the STRICT policy.
+The policy is selected per process, either from the environment variable below or at runtime.
+
+$ MUSIC_VALIDATION_POLICY=strict python3 -m entry_points.tar_entry -p
+"""
+
+import os
+from enum import Enum
+
+VALIDATION_POLICY_ENVIRONMENT_VARIABLE = "MUSIC_VALIDATION_POLICY"
+
+
+class ValidationPolicy(Enum):
+    """How much validation trusted producers pay for"""
+
+    STRICT = "strict"  # validate every object, regardless of who creates it
+    TRUSTED = "trusted"  # skip re-validating objects that are correct by construction
+
+
+def _policy_from_environment() -> ValidationPolicy:
+    value = os.environ.get(VALIDATION_POLICY_ENVIRONMENT_VARIABLE, ValidationPolicy.TRUSTED.value)
+    try:
+        return ValidationPolicy(value.lower())
+    except ValueError:
+        raise ValueError(
+            f"Invalid {VALIDATION_POLICY_ENVIRONMENT_VARIABLE}: {value}, "
+            f"valid values are {[policy.value for policy in ValidationPolicy]}"
+        ) from None
+
+
+_POLICY = {"current": _policy_from_environment()}
+
+
+def get_validation_policy() -> ValidationPolicy:
+    """Return the validation policy of the current process"""
+    return _POLICY["current"]
+
+
+def set_validation_policy(policy: ValidationPolicy):
+    """Set the validation policy of the current process"""
+    if not isinstance(policy, ValidationPolicy):
+        raise ValueError(f"Invalid validation policy: {policy}")
+    _POLICY["current"] = policy
+
+
+def is_strict() -> bool:
+    """Return True if trusted producers must validate the objects they create"""
+    return _POLICY["current"] is ValidationPolicy.STRICT
@@ -2,7 +2,7 @@
 
 # pylint: disable=no-member
 from functools import partial
-from typing import Dict, Tuple
+from typing import Any, Mapping, Tuple
 
 import cv2
 import numpy as np
@@ -75,7 +75,7 @@ def _key_white(image: np.ndarray, x: int, label: str):
     _white_text(image, label, (text_x, text_y))
 
 
-def _image_size(keys: dict) -> Tuple[int, int]:
+def _image_size(keys: Mapping[Any, Note]) -> Tuple[int, int]:
     num_black_keys = len([1 for note in keys.values() if note.accidental == "#"])
     num_white_keys = len(keys) - num_black_keys
     piano_width = num_white_keys * _WHITE_KEY_WIDTH
@@ -91,7 +91,7 @@ def _key_label(note: Note) -> str:
     return f"{note.name} - {note.frequency.value:.2f} Hz"
 
 
-def draw_piano(keys: Dict[str, Note]) -> np.ndarray:
+def draw_piano(keys: Mapping[Any, Note]) -> np.ndarray:
     """Create and return an image to draw the piano"""
     width, height = _image_size(keys)
     piano = np.ones((height, width, 3), dtype=np.uint8) * np.uint8(255)
@@ -0,0 +1,88 @@
+"""Entry point for sweeping note frequencies over several A4 references"""
+
+import argparse
+import os
+import sys
+from typing import Sequence
+
+import numpy as np
+
+from core.notes import STANDARD_NOTES, standard_notes_sweep
+from core.octaves import Octave
+from core.tuning import write_sweep_csv
+from instruments.tar_instrument import tar_string_sweep
+
+
+def _parse_arguments(argv: Sequence[str]):
+    parser = argparse.ArgumentParser(description="A4 sweep entry point")
+    parser.add_argument(
+        "-a4",
+        "--a4-frequencies",
+        nargs="+",
+        type=float,
+        default=[415, 430, 440, 442, 466],
+        help="Frequencies for the reference note A4",
+    )
+    parser.add_argument(
+        "-m",
+        "--note-mode",
+        type=str,
+        default="semitone",
+        choices=list(STANDARD_NOTES.keys()),
+        help="Sweep the standard notes of an octave in this mode",
+    )
+    parser.add_argument(
+        "-o",
+        "--octave",
+        type=int,
+        default=4,
+        help="Octave of the standard notes",
+    )
+    parser.add_argument(
+        "--tar-base-note",
+        type=str,
+        required=False,
+        help="Sweep the frets of a tar string with this open-hand note, instead of standard notes",
+    )
+    parser.add_argument(
+        "--fret-count",
+        type=int,
+        choices=[25, 27, 28],
+        default=27,
+        help="Number of frets on the neck (with --tar-base-note)",
+    )
+    parser.add_argument(
+        "-f",
+        "--file-path",
+        type=str,
+        required=False,
+        help="Save to a .csv or .npy file, otherwise CSV is printed out to terminal",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]):
+    # pylint: disable=missing-function-docstring
+    args = _parse_arguments(argv)
+    if args.tar_base_note is None:
+        labels, sweep = standard_notes_sweep(
+            args.note_mode, Octave.from_number(args.octave), args.a4_frequencies
+        )
+    else:
+        fret_numbers, names, sweep = tar_string_sweep(
+            args.tar_base_note, args.fret_count, args.a4_frequencies
+        )
+        labels = [f"{fret_number}:{name}" for fret_number, name in zip(fret_numbers, names)]
+
+    if args.file_path is None:
+        write_sweep_csv(sys.stdout, args.a4_frequencies, labels, sweep)
+    elif args.file_path.endswith(".npy"):
+        np.save(args.file_path, sweep)
+    else:
+        with open(args.file_path, "w", encoding="utf-8", newline="") as csv_file:
+            write_sweep_csv(csv_file, args.a4_frequencies, labels, sweep)
+    return os.EX_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
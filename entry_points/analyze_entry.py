@@ -0,0 +1,104 @@
+"""Entry point for the pitch analysis of a corpus of WAV files"""
+
+import argparse
+import csv
+import os
+import sys
+from typing import Sequence, TextIO
+
+import numpy as np
+
+from audio.corpus import AnalysisOptions, CorpusSummary, analyze_corpus, find_wav_files
+from core.frequency import Frequency
+from core.note_names import MIN_OCTAVE, STANDARD_NOTES
+
+
+def _parse_arguments(argv: Sequence[str]):
+    parser = argparse.ArgumentParser(description="Corpus analysis entry point")
+    parser.add_argument(
+        "-d",
+        "--directory",
+        type=str,
+        required=True,
+        help="Folder of WAV files (searched recursively)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--a4-frequency",
+        type=float,
+        default=440,
+        help="Frequency for the reference note A4",
+    )
+    parser.add_argument(
+        "--frame-length",
+        type=int,
+        default=2048,
+        help="Number of samples per pitch frame",
+    )
+    parser.add_argument(
+        "--hop-length",
+        type=int,
+        default=512,
+        help="Number of samples between the starts of consecutive frames",
+    )
+    parser.add_argument(
+        "-c",
+        "--checkpoint",
+        type=str,
+        required=False,
+        help="Checkpoint file (JSON lines): analyzed files are recorded, and skipped on resume",
+    )
+    parser.add_argument(
+        "-f",
+        "--file-path",
+        type=str,
+        required=False,
+        help="Save the corpus histogram to a .csv or .npy file, otherwise CSV is printed out",
+    )
+    return parser.parse_args(argv)
+
+
+def _write_histogram_csv(stream: TextIO, histogram: np.ndarray):
+    writer = csv.writer(stream)
+    writer.writerow(["octave", *STANDARD_NOTES["quartertone"]])
+    for octave_offset, row in enumerate(histogram.tolist()):
+        writer.writerow([MIN_OCTAVE + octave_offset, *row])
+
+
+def _save(summary: CorpusSummary, file_path: str):
+    if file_path.endswith(".npy"):
+        np.save(file_path, summary.histogram)
+    else:
+        with open(file_path, "w", encoding="utf-8", newline="") as csv_file:
+            _write_histogram_csv(csv_file, summary.histogram)
+
+
+def main(argv: Sequence[str]):
+    # pylint: disable=missing-function-docstring
+    args = _parse_arguments(argv)
+    options = AnalysisOptions(frame_length=args.frame_length, hop_length=args.hop_length)
+    summary = analyze_corpus(
+        find_wav_files(args.directory),
+        Frequency(args.a4_frequency),
+        jobs=args.jobs,
+        options=options,
+        checkpoint_path=args.checkpoint,
+    )
+    if args.file_path is None:
+        _write_histogram_csv(sys.stdout, summary.histogram)
+    else:
+        _save(summary, args.file_path)
+    print(f"{len(summary.file_histograms)} files analyzed", file=sys.stderr)
+    for file_path, error in summary.errors.items():
+        print(f"failed: {file_path}: {error}", file=sys.stderr)
+    return os.EX_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,84 @@
+"""Entry point for tables of fret positions over many scale lengths and base notes"""
+
+import argparse
+import os
+import sys
+from typing import Sequence
+
+import numpy as np
+
+from instruments.fret_positions import (
+    fret_position_table,
+    save_fret_positions_npy,
+    write_fret_positions_csv,
+)
+
+
+def _parse_arguments(argv: Sequence[str]):
+    parser = argparse.ArgumentParser(description="Fret positions entry point")
+    parser.add_argument(
+        "--scale-lengths",
+        nargs="+",
+        type=float,
+        default=[660],
+        help="Scale lengths (nut to saddle) in mm",
+    )
+    parser.add_argument(
+        "--scale-length-range",
+        nargs=3,
+        type=float,
+        metavar=("START", "STOP", "STEP"),
+        required=False,
+        help="Scale lengths from START to STOP (excluded) every STEP mm, overrides --scale-lengths",
+    )
+    parser.add_argument(
+        "--base-notes",
+        nargs="+",
+        type=str,
+        default=["C4", "G3", "C3"],
+        help="Open-hand notes of the strings",
+    )
+    parser.add_argument(
+        "--fret-count",
+        type=int,
+        choices=[25, 27, 28],
+        default=27,
+        help="Number of frets on the neck",
+    )
+    parser.add_argument(
+        "--decimals",
+        type=int,
+        default=2,
+        help="Decimals of the positions in CSV",
+    )
+    parser.add_argument(
+        "-f",
+        "--file-path",
+        type=str,
+        required=False,
+        help="Save to a .csv or .npy file, otherwise CSV is printed out to terminal",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]):
+    # pylint: disable=missing-function-docstring
+    args = _parse_arguments(argv)
+    if args.scale_length_range is None:
+        scale_lengths = np.asarray(args.scale_lengths)
+    else:
+        scale_lengths = np.arange(*args.scale_length_range)
+    table = fret_position_table(scale_lengths, args.base_notes, args.fret_count)
+
+    if args.file_path is None:
+        write_fret_positions_csv(sys.stdout, table, args.decimals)
+    elif args.file_path.endswith(".npy"):
+        save_fret_positions_npy(args.file_path, table)
+    else:
+        with open(args.file_path, "w", encoding="utf-8", newline="") as csv_file:
+            write_fret_positions_csv(csv_file, table, args.decimals)
+    return os.EX_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -3,12 +3,13 @@
 import argparse
 import os
 import sys
-from typing import Sequence
+from typing import Any, Mapping, Sequence
 
 from core.frequency import Frequency
+from core.notes import Note
 from drawing.common import save_image, show_image
 from drawing.piano_drawing import draw_piano
-from instruments.piano_instrument import generate_piano_keys
+from instruments.piano_instrument import PIANO_PRESETS, generate_piano_keys, piano_preset_keys
 
 
 def _parse_arguments(argv: Sequence[str]):
@@ -38,6 +39,14 @@ def _parse_arguments(argv: Sequence[str]):
         default=[0, 8],
         help="Octave range",
     )
+    parser.add_argument(
+        "-p",
+        "--preset",
+        type=int,
+        choices=list(PIANO_PRESETS),
+        required=False,
+        help="Number of keys of a standard piano, instead of --octave-range",
+    )
     parser.add_argument(
         "-a4",
         "--a4-frequency",
@@ -51,7 +60,12 @@ def _parse_arguments(argv: Sequence[str]):
 def main(argv: Sequence[str]):
     # pylint: disable=missing-function-docstring
     args = _parse_arguments(argv)
-    piano_keys = generate_piano_keys(args.octave_range, Frequency(args.a4_frequency))
+    a4_frequency = Frequency(args.a4_frequency)
+    piano_keys: Mapping[Any, Note]
+    if args.preset is None:
+        piano_keys = generate_piano_keys(args.octave_range, a4_frequency)
+    else:
+        piano_keys = piano_preset_keys(args.preset, a4_frequency)
     image = draw_piano(piano_keys)
     if args.save_to_file:
         save_image(image, args.file_path)
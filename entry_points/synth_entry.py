@@ -0,0 +1,107 @@
+"""Entry point for rendering a tar string or standard notes to a WAV file"""
+
+import argparse
+import os
+import sys
+from typing import Sequence
+
+from audio.plucked import fret_sweep
+from audio.synthesis import BlockRenderer, Synthesizer, render_to_wav
+from core.frequency import Frequency
+from core.notes import STANDARD_NOTES, Note, standard_notes
+from core.octaves import Octave
+from instruments.tar_instrument import tar_string
+
+
+def _parse_arguments(argv: Sequence[str]):
+    parser = argparse.ArgumentParser(description="Synthesizer entry point")
+    parser.add_argument(
+        "-f",
+        "--file-path",
+        type=str,
+        required=True,
+        help="WAV file to write",
+    )
+    parser.add_argument(
+        "--tar-base-note",
+        type=str,
+        nargs="+",
+        required=False,
+        help="Play the frets of tar strings with these open-hand notes, instead of standard notes",
+    )
+    parser.add_argument(
+        "--plucked",
+        action="store_true",
+        help="Pluck the frets (Karplus-Strong), all strings at the same time, instead of additive",
+    )
+    parser.add_argument(
+        "--fret-count",
+        type=int,
+        choices=[25, 27, 28],
+        default=27,
+        help="Number of frets on the neck (with --tar-base-note)",
+    )
+    parser.add_argument(
+        "-m",
+        "--note-mode",
+        type=str,
+        default="quartertone",
+        choices=list(STANDARD_NOTES.keys()),
+        help="Play the standard notes of an octave in this mode",
+    )
+    parser.add_argument(
+        "-o",
+        "--octave",
+        type=int,
+        default=4,
+        help="Octave of the standard notes",
+    )
+    parser.add_argument(
+        "-d",
+        "--duration",
+        type=float,
+        default=0.5,
+        help="Duration of every note, or interval between plucks (seconds)",
+    )
+    parser.add_argument(
+        "--a4-frequency",
+        type=float,
+        default=440,
+        help="Frequency for the reference note A4",
+    )
+    parser.add_argument(
+        "--sample-rate",
+        type=int,
+        default=44100,
+        help="Sample rate of the WAV file",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]):
+    # pylint: disable=missing-function-docstring
+    args = _parse_arguments(argv)
+    a4_frequency = Frequency(args.a4_frequency)
+    if args.tar_base_note is None:
+        notes = standard_notes(args.note_mode, Octave.from_number(args.octave), a4_frequency)
+        strings = [dict(enumerate(notes))]
+    else:
+        strings = [
+            tar_string(Note.from_name(base_note, a4_frequency), args.fret_count)
+            for base_note in args.tar_base_note
+        ]
+    renderer: BlockRenderer
+    if args.plucked:
+        renderer = fret_sweep(
+            strings, args.duration, ring_duration=3 * args.duration, sample_rate=args.sample_rate
+        )
+    else:
+        notes = [note for string in strings for note in string.values()]
+        renderer = Synthesizer(notes, args.duration, args.sample_rate)
+    stats = render_to_wav(args.file_path, renderer)
+    print(stats, file=sys.stderr)
+    return os.EX_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,88 @@
+"""Entry point for transcribing a WAV file into quartertone note events"""
+
+import argparse
+import os
+import sys
+from typing import Sequence
+
+from audio.pitch import PitchSettings
+from audio.transcription import ThroughputStats, transcribe
+from audio.wav_reader import DEFAULT_CHUNK_FRAMES, read_wav_chunks, wav_info
+from core.frequency import Frequency
+
+
+def _parse_arguments(argv: Sequence[str]):
+    parser = argparse.ArgumentParser(description="Transcription entry point")
+    parser.add_argument(
+        "-f",
+        "--file-path",
+        type=str,
+        required=True,
+        help="WAV file to transcribe",
+    )
+    parser.add_argument(
+        "--a4-frequency",
+        type=float,
+        default=440,
+        help="Frequency for the reference note A4",
+    )
+    parser.add_argument(
+        "--frame-length",
+        type=int,
+        default=2048,
+        help="Number of samples per pitch frame",
+    )
+    parser.add_argument(
+        "--hop-length",
+        type=int,
+        default=512,
+        help="Number of samples between the starts of consecutive frames",
+    )
+    parser.add_argument(
+        "--min-frequency",
+        type=float,
+        default=60.0,
+        help="Lowest detected pitch (Hz)",
+    )
+    parser.add_argument(
+        "--max-frequency",
+        type=float,
+        default=2000.0,
+        help="Highest detected pitch (Hz)",
+    )
+    parser.add_argument(
+        "--min-note-frames",
+        type=int,
+        default=3,
+        help="Notes shorter than this number of frames are dropped",
+    )
+    parser.add_argument(
+        "--chunk-frames",
+        type=int,
+        default=DEFAULT_CHUNK_FRAMES,
+        help="Number of samples read from the file at once",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]):
+    # pylint: disable=missing-function-docstring
+    args = _parse_arguments(argv)
+    settings = PitchSettings(
+        wav_info(args.file_path).sample_rate,
+        frame_length=args.frame_length,
+        hop_length=args.hop_length,
+        min_frequency=args.min_frequency,
+        max_frequency=args.max_frequency,
+    )
+    stats = ThroughputStats()
+    chunks = read_wav_chunks(args.file_path, args.chunk_frames)
+    events = transcribe(chunks, settings, Frequency(args.a4_frequency), args.min_note_frames, stats)
+    for event in events:
+        print(f"{event.onset:.3f}\t{event.duration:.3f}\t{event.note.name}")
+    print(stats, file=sys.stderr)
+    return os.EX_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
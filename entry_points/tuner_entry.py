@@ -0,0 +1,106 @@
+"""Entry point for the real-time tuner"""
+
+import argparse
+import os
+import sys
+import wave
+from typing import Sequence
+
+from audio.pitch import PitchSettings
+from audio.tuner import Tuner
+from core.frequency import Frequency
+
+
+def _parse_arguments(argv: Sequence[str]):
+    parser = argparse.ArgumentParser(description="Tuner entry point")
+    parser.add_argument(
+        "-f",
+        "--file-path",
+        type=str,
+        required=False,
+        help="WAV file standing in for a live source, otherwise 16-bit mono PCM is read from stdin",
+    )
+    parser.add_argument(
+        "--sample-rate",
+        type=int,
+        default=44100,
+        help="Sample rate of the PCM read from stdin (ignored with -f)",
+    )
+    parser.add_argument(
+        "--a4-frequency",
+        type=float,
+        default=440,
+        help="Frequency for the reference note A4",
+    )
+    parser.add_argument(
+        "--frame-length",
+        type=int,
+        default=2048,
+        help="Number of samples per analyzed frame",
+    )
+    parser.add_argument(
+        "--hop-length",
+        type=int,
+        default=512,
+        help="Number of samples between readings",
+    )
+    parser.add_argument(
+        "--min-frequency",
+        type=float,
+        default=60.0,
+        help="Lowest detected pitch (Hz)",
+    )
+    parser.add_argument(
+        "--max-frequency",
+        type=float,
+        default=2000.0,
+        help="Highest detected pitch (Hz)",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=10.0,
+        help="Latency budget of the analysis of a hop, reported at the end",
+    )
+    return parser.parse_args(argv)
+
+
+def _settings(args: argparse.Namespace, sample_rate: int) -> PitchSettings:
+    return PitchSettings(
+        sample_rate,
+        frame_length=args.frame_length,
+        hop_length=args.hop_length,
+        min_frequency=args.min_frequency,
+        max_frequency=args.max_frequency,
+    )
+
+
+def _report(tuner: Tuner, budget_ms: float):
+    for stage, histogram in tuner.latency.items():
+        print(f"{stage}\t{histogram}", file=sys.stderr)
+    within = tuner.latency["analysis"].fraction_within(budget_ms)
+    print(f"analysis within {budget_ms} ms: {100 * within:.1f}%", file=sys.stderr)
+
+
+def main(argv: Sequence[str]):
+    # pylint: disable=missing-function-docstring
+    args = _parse_arguments(argv)
+    a4_frequency = Frequency(args.a4_frequency)
+    if args.file_path is None:
+        tuner = Tuner(_settings(args, args.sample_rate), a4_frequency)
+        for reading in tuner.run(lambda frame_count: sys.stdin.buffer.read(2 * frame_count), 2):
+            print(reading, flush=True)
+    else:
+        with wave.open(args.file_path, "rb") as wav_file:
+            tuner = Tuner(_settings(args, wav_file.getframerate()), a4_frequency)
+            readings = tuner.run(
+                wav_file.readframes, wav_file.getsampwidth(), wav_file.getnchannels()
+            )
+            for reading in readings:
+                print(reading)
+    _report(tuner, args.budget_ms)
+    return os.EX_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,137 @@
+"""Lowest-cost fingerings of melodies on a fretboard, by a Viterbi search over their positions"""
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.note_names import STEP_COUNT
+from instruments.fretboard import Fretboard
+from instruments.fretboard_index import note_step
+
+# Fret index (column of the fretboard matrices) of a note that cannot be played on a string
+UNPLAYABLE = -1
+
+Melody = Union[Sequence[Union[str, int]], np.ndarray]
+
+
+@dataclass(frozen=True, slots=True)
+class FingeringCosts:
+    """Weights of the cost of moving from one (string, fret) position to the next
+
+    - movement_per_mm: per mm that the hand moves along the neck (fret positions, see Fretboard)
+    - string_change: per string crossed
+    - position_shift: once per move of more than hand_span_mm, i.e. out of the reach of the hand
+    """
+
+    movement_per_mm: float = 0.02
+    string_change: float = 1.0
+    position_shift: float = 2.0
+    hand_span_mm: float = 60.0
+
+
+@dataclass(frozen=True, slots=True)
+class Fingering:
+    """The (string index, fret number) position of every note of a melody, and its total cost"""
+
+    string_indices: np.ndarray
+    fret_numbers: np.ndarray
+    cost: float
+
+    def __len__(self) -> int:
+        return len(self.string_indices)
+
+
+class FingeringOptimizer:
+    """Find the lowest-cost fingering of melodies on a fretboard.
+
+    The candidates of a note are its positions on every string (at most one per string), so a
+    melody is a (notes x strings) lattice. The Viterbi search walks it note by note, with the
+    (strings x strings) transition costs of all notes of all melodies of a batch computed in one
+    broadcast operation beforehand. Melodies of a batch are padded to the longest with a free state.
+    """
+
+    def __init__(self, fretboard: Fretboard, costs: FingeringCosts = FingeringCosts()):
+        string_count = fretboard.shape[0]
+        self.fretboard = fretboard
+        self.costs = costs
+        # fret index of every (step, string), or UNPLAYABLE
+        self._fret_lookup = np.full((STEP_COUNT, string_count), UNPLAYABLE, dtype=np.int64)
+        string_indices = np.arange(string_count)[:, np.newaxis]
+        self._fret_lookup[fretboard.steps, string_indices] = np.arange(fretboard.shape[1])
+        string_distances = np.abs(
+            np.subtract.outer(np.arange(string_count), np.arange(string_count))
+        )
+        self._string_costs = costs.string_change * string_distances
+
+    def _melody_steps(self, melody: Melody) -> np.ndarray:
+        if len(melody) == 0:
+            raise ValueError("Cannot find the fingering of an empty melody")
+        if isinstance(melody, np.ndarray):
+            steps = np.asarray(melody, dtype=np.int64)
+            if np.any((steps < 0) | (steps >= STEP_COUNT)):
+                raise ValueError(f"Steps must be in range [0, {STEP_COUNT})")
+        else:
+            steps = np.array([note_step(note) for note in melody], dtype=np.int64)
+        unplayable = np.flatnonzero(np.all(self._fret_lookup[steps] == UNPLAYABLE, axis=1))
+        if len(unplayable) > 0:
+            raise ValueError(f"Note {unplayable[0]} of the melody is not on the fretboard")
+        return steps
+
+    def _transition_costs(self, positions: np.ndarray) -> np.ndarray:
+        """(melodies x notes - 1 x previous string x current string) costs of moving between the
+        candidate positions (mm) of consecutive notes"""
+        movements = np.abs(positions[:, 1:, np.newaxis, :] - positions[:, :-1, :, np.newaxis])
+        shifts = movements > self.costs.hand_span_mm
+        return (
+            self.costs.movement_per_mm * movements
+            + self.costs.position_shift * shifts
+            + self._string_costs
+        )
+
+    def solve(self, melody: Melody) -> Fingering:
+        """Return the lowest-cost fingering of a melody of note names or absolute steps"""
+        return self.solve_batch([melody])[0]
+
+    def _lattice(self, melodies: Sequence[Melody]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the (melodies x notes) mask of the notes (i.e. not padding), and the (melodies x
+        notes x strings) fret indices (UNPLAYABLE if none) and positions (mm) of the candidates"""
+        all_steps = [self._melody_steps(melody) for melody in melodies]
+        lengths = np.array([len(steps) for steps in all_steps])
+        active = np.arange(lengths.max()) < lengths[:, np.newaxis]
+        padded_steps = np.zeros(active.shape, dtype=np.int64)
+        padded_steps[active] = np.concatenate(all_steps)
+        frets = self._fret_lookup[padded_steps]
+        frets[~active] = UNPLAYABLE
+        frets[~active, 0] = 0  # the only, free, candidate of padding
+        string_indices = np.arange(frets.shape[2])
+        positions = self.fretboard.positions_mm[string_indices, np.maximum(frets, 0)]
+        return active, frets, positions
+
+    def solve_batch(self, melodies: Sequence[Melody]) -> List[Fingering]:
+        """Return the lowest-cost fingering of every melody, all searched at once"""
+        if len(melodies) == 0:
+            return []
+        active, frets, positions = self._lattice(melodies)
+        node_costs = np.where(frets == UNPLAYABLE, np.inf, 0.0)
+        transitions = self._transition_costs(positions)
+        transitions *= active[:, 1:, np.newaxis, np.newaxis]
+
+        scores = node_costs[:, 0]
+        backpointers = np.zeros(frets.shape, dtype=np.int64)
+        for note in range(1, frets.shape[1]):
+            candidates = scores[:, :, np.newaxis] + transitions[:, note - 1]
+            backpointers[:, note] = np.argmin(candidates, axis=1)
+            scores = np.min(candidates, axis=1) + node_costs[:, note]
+
+        melody_indices = np.arange(len(melodies))
+        path = np.zeros(frets.shape[:2], dtype=np.int64)
+        path[:, -1] = np.argmin(scores, axis=1)
+        for note in range(frets.shape[1] - 1, 0, -1):
+            path[:, note - 1] = backpointers[melody_indices, note, path[:, note]]
+        fret_numbers = self.fretboard.fret_numbers[np.take_along_axis(frets, path[..., None], 2)]
+        costs = scores[melody_indices, path[:, -1]].tolist()
+        return [
+            Fingering(path[i, :length], fret_numbers[i, :length, 0], costs[i])
+            for i, length in enumerate(active.sum(axis=1).tolist())
+        ]
@@ -0,0 +1,92 @@
+"""Fret positions (distances from the nut) of tar necks, for many scale lengths and strings at once
+
+Headless counterpart of the length labels of drawing.tar_drawing, without OpenCV.
+"""
+
+from dataclasses import dataclass
+from typing import Sequence, TextIO, Tuple, Union
+
+import numpy as np
+
+from core.note_names import QUARTERTONES_PER_OCTAVE, STEP_COUNT, parse_note_name
+from instruments.tar_instrument import FRET_STEPS, fret_numbers
+
+# Number of scale lengths written at once by save_fret_positions_npy()
+NPY_CHUNK_SIZE = 4096
+
+
+def fret_length_ratios(fret_count: int) -> np.ndarray:
+    """Return the distance of every fret from the nut, for a string of length 1, i.e.
+    1 - (open-hand frequency / fret frequency) = 1 - 2 ** (-fret steps / 24)"""
+    return 1 - 2.0 ** (-FRET_STEPS[fret_numbers(fret_count)] / QUARTERTONES_PER_OCTAVE)
+
+
+@dataclass(frozen=True, slots=True)
+class FretPositionTable:
+    """Distances (mm) from the nut of every fret, for every scale length and every base note
+
+    positions_mm is a read-only (scale lengths x base notes x frets) array. A fret divides the
+    string by the same ratio whatever the open-hand note and the A4 reference, so it is a view of
+    one (scale lengths x frets) product, broadcast over the base notes; base notes only set the
+    note range that the frets must fit in.
+    """
+
+    scale_lengths_mm: np.ndarray
+    base_note_names: Tuple[str, ...]
+    fret_numbers: np.ndarray
+    positions_mm: np.ndarray
+
+    @property
+    def configuration_count(self) -> int:
+        """Number of (scale length, base note) configurations"""
+        return len(self.scale_lengths_mm) * len(self.base_note_names)
+
+
+def fret_position_table(
+    scale_lengths_mm: Union[Sequence[float], np.ndarray],
+    base_note_names: Sequence[str],
+    fret_count: int,
+) -> FretPositionTable:
+    """Return the fret positions of every (scale length, base note) configuration in one call,
+    e.g. fret_position_table(np.arange(600, 700, 0.5), ["C4", "G3", "C3"], 27)"""
+    scale_lengths_mm = np.array(scale_lengths_mm, dtype=np.float64)  # a copy, frozen below
+    if scale_lengths_mm.ndim != 1 or np.any(scale_lengths_mm <= 0):
+        raise ValueError("Scale lengths must be a 1D sequence of positive lengths")
+    if len(base_note_names) == 0:
+        raise ValueError("At least one base note is needed")
+    numbers = fret_numbers(fret_count)
+    base_steps = np.array([parse_note_name(name).step for name in base_note_names], dtype=np.int64)
+    if np.any(base_steps + FRET_STEPS[numbers[-1]] >= STEP_COUNT):
+        raise ValueError("Frets of some base notes exceed the range of notes")
+    positions = np.multiply.outer(scale_lengths_mm, fret_length_ratios(fret_count))
+    positions_mm = np.broadcast_to(
+        positions[:, np.newaxis, :], (len(scale_lengths_mm), len(base_steps), len(numbers))
+    )
+    scale_lengths_mm.flags.writeable = False
+    return FretPositionTable(scale_lengths_mm, tuple(base_note_names), numbers, positions_mm)
+
+
+def write_fret_positions_csv(stream: TextIO, table: FretPositionTable, decimals: int = 2):
+    """Write a fret position table as CSV: one row per (scale length, base note), one column per
+    fret. The positions of a scale length are formatted once, for all of its base notes."""
+    header = ["scale_length_mm", "base_note", *(str(n) for n in table.fret_numbers)]
+    stream.write(",".join(header) + "\n")
+    row_format = ",".join([f"%.{decimals}f"] * len(table.fret_numbers))
+    for scale_length, positions in zip(
+        table.scale_lengths_mm.tolist(), table.positions_mm[:, 0, :].tolist()
+    ):
+        prefix = f"{scale_length:.{decimals}f},"
+        suffix = "," + row_format % tuple(positions) + "\n"
+        stream.write("".join(prefix + name + suffix for name in table.base_note_names))
+
+
+def save_fret_positions_npy(file_path: str, table: FretPositionTable):
+    """Save the (scale lengths x base notes x frets) positions to a .npy file, NPY_CHUNK_SIZE scale
+    lengths at a time, without holding the whole (broadcast) array in memory"""
+    output = np.lib.format.open_memmap(
+        file_path, mode="w+", dtype=np.float64, shape=table.positions_mm.shape
+    )
+    for start in range(0, len(table.scale_lengths_mm), NPY_CHUNK_SIZE):
+        output[start : start + NPY_CHUNK_SIZE] = table.positions_mm[start : start + NPY_CHUNK_SIZE]
+    output.flush()
+    del output
@@ -0,0 +1,109 @@
+"""Multi-string fretted instruments (tar, setar, oud-like), computed as strings x frets matrices"""
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.frequency import Frequency
+from core.note_mapping import LazyNoteMapping
+from core.note_names import STEP_COUNT, STEP_NAMES
+from core.notes import Note, cached_note
+from core.tuning import tuning_table
+from instruments.tar_instrument import FRET_STEPS, fret_numbers
+
+
+@dataclass(frozen=True, slots=True)
+class FretboardPreset:
+    """Open-hand notes of the strings (first to last), number of frets and scale length"""
+
+    base_note_names: Tuple[str, ...]
+    fret_count: int
+    scale_length_mm: float
+
+
+PRESETS = {
+    "tar": FretboardPreset(("C4", "C4", "G3", "G3", "C4", "C3"), 28, 660.0),
+    "setar": FretboardPreset(("C4", "C4", "G3", "C3"), 25, 680.0),
+    # the fret layout of the tar on the courses of an oud (which is fretless)
+    "oud": FretboardPreset(("C4", "G3", "D3", "A2", "F2", "C2"), 27, 600.0),
+}
+
+
+class Fretboard:
+    """The notes of every fret of every string of an instrument.
+
+    All strings share the fret layout of the tar (see instruments.tar_instrument), and the whole
+    (strings x frets) matrices of steps, frequencies and fret positions are computed at once.
+    Notes are only created when accessed, see string() and note().
+
+    positions_mm is the distance of every fret from the nut, for a string of scale_length_mm (one
+    value, or one per string), i.e. scale_length_mm * (1 - open-hand frequency / fret frequency).
+    """
+
+    def __init__(
+        self,
+        base_notes: Sequence[Note],
+        fret_count: int,
+        scale_length_mm: Union[float, Sequence[float]] = 660.0,
+    ):
+        if len(base_notes) == 0:
+            raise ValueError("A fretboard needs at least one string")
+        a4_frequency = base_notes[0].a4_frequency
+        if any(note.a4_frequency != a4_frequency for note in base_notes):
+            raise ValueError("All strings must share the same A4 frequency")
+        scale_lengths = np.broadcast_to(
+            np.asarray(scale_length_mm, dtype=np.float64), (len(base_notes),)
+        )
+        if np.any(scale_lengths <= 0):
+            raise ValueError("Scale lengths must be positive")
+        self.a4_frequency = a4_frequency
+        self.fret_numbers = fret_numbers(fret_count)
+        base_steps = np.array([note.step for note in base_notes], dtype=np.int64)
+        fret_steps = FRET_STEPS[self.fret_numbers]
+        self.steps = base_steps[:, np.newaxis] + fret_steps
+        if np.any(self.steps >= STEP_COUNT):
+            raise ValueError("Frets of the strings exceed the range of notes")
+        self.frequencies = tuning_table(a4_frequency).frequencies[self.steps]
+        # base frequency / fret frequency, i.e. 2 ** (-fret steps / 24), for every string
+        length_ratios = self.frequencies[:, :1] / self.frequencies
+        self.positions_mm = scale_lengths[:, np.newaxis] * (1 - length_ratios)
+        for array in (self.steps, self.frequencies, self.positions_mm):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_preset(cls, name: str, a4_frequency: Frequency) -> "Fretboard":
+        """Return the fretboard of a preset of PRESETS (e.g. "tar")"""
+        if name not in PRESETS:
+            raise ValueError(f"Unknown preset {name}, valid presets are {list(PRESETS)}")
+        preset = PRESETS[name]
+        base_notes = [cached_note(name, a4_frequency) for name in preset.base_note_names]
+        return cls(base_notes, preset.fret_count, preset.scale_length_mm)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(number of strings, number of frets including the open-hand)"""
+        return self.steps.shape
+
+    def __repr__(self) -> str:
+        string_count, fret_count = self.shape
+        return f"Fretboard({string_count} strings x {fret_count} frets, A4: {self.a4_frequency} Hz)"
+
+    def _fret_position(self, fret_number: int) -> int:
+        positions = np.flatnonzero(self.fret_numbers == fret_number)
+        if len(positions) == 0:
+            raise ValueError(f"No fret number {fret_number} on this fretboard")
+        return int(positions[0])
+
+    def note(self, string_index: int, fret_number: int) -> Note:
+        """Return the note of a fret (0 for the open-hand) of a string (0 for the first)"""
+        step = self.steps[string_index, self._fret_position(fret_number)]
+        return cached_note(STEP_NAMES[step], self.a4_frequency)
+
+    def string(self, string_index: int) -> LazyNoteMapping:
+        """Return the (fret number -> Note) mapping of a string, like tar_string()"""
+        return LazyNoteMapping(self.fret_numbers, self.steps[string_index], self.a4_frequency)
+
+    def strings(self) -> List[LazyNoteMapping]:
+        """Return the (fret number -> Note) mappings of all strings"""
+        return [self.string(string_index) for string_index in range(self.shape[0])]
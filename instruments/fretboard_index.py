@@ -0,0 +1,72 @@
+"""Inverted index from notes to all the (string, fret) positions of a fretboard"""
+
+from typing import Dict, Tuple, Union
+
+import numpy as np
+
+from core.note_names import STEP_COUNT, parse_note_name
+from instruments.fretboard import Fretboard
+
+# (string index, fret number), string 0 being the first string and fret 0 the open-hand
+Position = Tuple[int, int]
+
+
+def note_step(note: Union[str, int]) -> int:
+    """Return the absolute step of a note given by name (e.g. "Dk4") or by step (validated)"""
+    if isinstance(note, str):
+        return parse_note_name(note).step
+    if not 0 <= note < STEP_COUNT:
+        raise ValueError(f"Step {note} is out of range [0, {STEP_COUNT})")
+    return int(note)
+
+
+class FretboardIndex:
+    """Every (string, fret) position of every note of a fretboard, by note name or absolute step.
+
+    Built once per fretboard: all positions are sorted by step (then string, then fret), and the
+    offsets of the run of every step in that order are stored, as in a CSR matrix. A note lookup
+    is then a dict access, and a range of notes is one slice of the sorted arrays.
+    """
+
+    def __init__(self, fretboard: Fretboard):
+        fret_count = fretboard.shape[1]
+        flat_steps = fretboard.steps.ravel()
+        order = np.argsort(flat_steps, kind="stable")
+        string_indices, fret_positions = np.divmod(order, fret_count)
+        self.fretboard = fretboard
+        self.steps = flat_steps[order]
+        self.string_indices = string_indices
+        self.fret_numbers = fretboard.fret_numbers[fret_positions]
+        for array in (self.steps, self.string_indices, self.fret_numbers):
+            array.flags.writeable = False
+        # positions of step s are [offsets[s], offsets[s + 1]) of the sorted arrays
+        self._offsets = np.searchsorted(self.steps, np.arange(STEP_COUNT + 1))
+        pairs = list(zip(self.string_indices.tolist(), self.fret_numbers.tolist()))
+        self._positions: Dict[int, Tuple[Position, ...]] = {
+            step: tuple(pairs[start:end])
+            for step, start, end in zip(
+                range(STEP_COUNT), self._offsets[:-1].tolist(), self._offsets[1:].tolist()
+            )
+            if end > start
+        }
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def positions(self, note: Union[str, int]) -> Tuple[Position, ...]:
+        """Return the (string index, fret number) positions of a note, by name (e.g. "Dk4") or
+        absolute step, sorted by string then fret (empty if the note is not on the fretboard)"""
+        return self._positions.get(note_step(note), ())
+
+    def range_positions(
+        self, lowest: Union[str, int], highest: Union[str, int]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the (steps, string indices, fret numbers) of all positions of the notes from
+        lowest to highest (both included), sorted by step, as read-only views"""
+        start = self._offsets[note_step(lowest)]
+        end = self._offsets[note_step(highest) + 1]
+        return (
+            self.steps[start:end],
+            self.string_indices[start:end],
+            self.fret_numbers[start:end],
+        )
@@ -2,30 +2,67 @@
 
 from typing import Dict, Tuple
 
+import numpy as np
+
 from core.frequency import Frequency
-from core.notes import Note
+from core.note_mapping import LazyNoteMapping
+from core.note_names import STEP_COUNT, STEP_NAMES, absolute_step, parse_note_name
+from core.notes import Note, cached_note
 from core.octaves import Octave
 
+# Piano keys are semitones apart, i.e. every other quartertone step (C, C#, D, ...)
+QUARTERTONES_PER_KEY = 2
+
+# Absolute steps of the keys of a piano spanning the whole range of notes (see core.note_names)
+KEY_STEPS = np.arange(0, STEP_COUNT, QUARTERTONES_PER_KEY)
+KEY_STEPS.flags.writeable = False
+
+# Lowest and highest keys of standard pianos, by number of keys
+PIANO_PRESETS = {
+    88: ("A0", "C8"),
+    97: ("C0", "C8"),
+    108: ("C0", "B8"),
+}
+
+
+def _key_index(name: str) -> int:
+    step = parse_note_name(name).step
+    if step % QUARTERTONES_PER_KEY != 0:
+        raise ValueError(f"There is no piano key for the quartertone note {name}")
+    return step // QUARTERTONES_PER_KEY
+
+
+def piano_keys(lowest: str, highest: str, a4_frequency: Frequency) -> LazyNoteMapping:
+    """Return the (key number -> Note) mapping of the keys from lowest to highest (both included),
+    numbered from 1, e.g. piano_keys("A0", "C8", a4_frequency) for an 88-key piano.
+
+    Keys are a slice of KEY_STEPS, and Notes are only created when accessed."""
+    start, end = _key_index(lowest), _key_index(highest) + 1
+    if start >= end:
+        raise ValueError(f"Highest key {highest} must be higher than lowest key {lowest}")
+    return LazyNoteMapping(np.arange(1, end - start + 1), KEY_STEPS[start:end], a4_frequency)
+
+
+def piano_preset_keys(key_count: int, a4_frequency: Frequency) -> LazyNoteMapping:
+    """Return the (key number -> Note) mapping of a standard piano of PIANO_PRESETS"""
+    if key_count not in PIANO_PRESETS:
+        raise ValueError(f"Valid key counts are {list(PIANO_PRESETS)}, provided: {key_count}")
+    return piano_keys(*PIANO_PRESETS[key_count], a4_frequency)
+
 
 def generate_piano_keys(octave_range: Tuple[int, int], a4_frequency: Frequency) -> Dict[str, Note]:
     """Generate all notes for piano keys in give octave ranges
 
     NOTE: start of octave_range is inclusive and end of it is exclusive
+    NOTE: for standard pianos (i.e. 88-97-108 keys) see piano_preset_keys()
     """
-    # pylint: disable=fixme
-    # TODO: this implementation does not generate any standard piano (i.e. 88-97-108 keys)
     if octave_range[0] >= octave_range[1]:
         raise ValueError("Upper range must be greater than lower range")
 
     Octave.validate(octave_range[0])
     Octave.validate(octave_range[1])
 
-    keys = {}
-    for octave_number in range(*octave_range):
-        for letter in ["C", "D", "E", "F", "G", "A", "B"]:
-            for accidental_symbol in ["", "#"]:
-                if f"{letter}{accidental_symbol}" in ["E#", "B#"]:
-                    continue
-                name = f"{letter}{accidental_symbol}{octave_number}"
-                keys[name] = Note.from_name(name, a4_frequency)
-    return keys
+    start = absolute_step(0, octave_range[0]) // QUARTERTONES_PER_KEY
+    end = absolute_step(0, octave_range[1]) // QUARTERTONES_PER_KEY
+    names = [STEP_NAMES[step] for step in KEY_STEPS[start:end].tolist()]
+    return {name: cached_note(name, a4_frequency) for name in names}
@@ -1,9 +1,13 @@
 """Representation of the Tar"""
 
-from typing import Dict, Sequence
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
 
 from core.intervals import MusicalInterval
-from core.notes import Note
+from core.note_names import STEP_COUNT, STEP_NAMES, parse_note_name, step_to_name
+from core.notes import Note, cached_note
+from core.tuning import frequency_sweep
 
 # The music interval from each fret to previous, lower pitched, fret.
 # Fret=0 (base-note/open-hand) has no previous to have differential interval.
@@ -39,16 +43,33 @@ FRET_DIFFERENTIAL_INTERVAL = {
 }
 
 
-def _fret_indices(fret_count: int) -> Sequence[int]:
-    if fret_count == 25:
-        fret_indices = [n for n in range(0, 28) if n not in [8, 19]]
-    elif fret_count == 27:
-        fret_indices = list(range(0, 28))
-    elif fret_count == 28:
-        fret_indices = list(range(0, 29))
-    else:
+# Quartertone steps from the open-hand (fret 0) to each fret, cumulative of the above
+FRET_STEPS = np.cumsum(
+    [0]
+    + [
+        MusicalInterval.as_quartertone_steps(FRET_DIFFERENTIAL_INTERVAL[fret_number])
+        for fret_number in range(1, 29)
+    ]
+)
+FRET_STEPS.flags.writeable = False
+
+
+# Fret numbers present on a neck, for each valid fret count (fret 0 is the open-hand)
+_FRET_NUMBERS = {
+    25: np.array([n for n in range(0, 28) if n not in [8, 19]]),
+    27: np.arange(0, 28),
+    28: np.arange(0, 29),
+}
+for _numbers in _FRET_NUMBERS.values():
+    _numbers.flags.writeable = False
+
+
+def fret_numbers(fret_count: int) -> np.ndarray:
+    """Return the (read-only, shared) array of the fret numbers on a neck of fret_count frets,
+    starting with 0 (the open-hand). A 25-fret neck has no frets 8 and 19."""
+    if fret_count not in _FRET_NUMBERS:
         raise ValueError(f"Valid values for fret count are [25, 27, 28], provided: {fret_count}")
-    return fret_indices
+    return _FRET_NUMBERS[fret_count]
 
 
 def tar_string(base_note: Note, fret_count: int) -> Dict[int, Note]:
@@ -57,13 +78,35 @@ def tar_string(base_note: Note, fret_count: int) -> Dict[int, Note]:
     NOTE: Fret zero is the open-hand and does not count in the total fret counts.
           Returning dict has (fret_count + 1) entries.
     NOTE: Depending on the fret_count, the fret numbers does not include the whole range.
-          See: _fret_indices()."""
-    notes = {0: base_note}
-    for i in range(1, 29):
-        notes[i] = notes[i - 1] + FRET_DIFFERENTIAL_INTERVAL[i]
-
-    return {
-        fret_number: note
-        for fret_number, note in notes.items()
-        if fret_number in _fret_indices(fret_count)
+          See: fret_numbers()."""
+    numbers, steps = tar_string_steps(base_note.step, fret_count)
+    notes = {
+        fret_number: cached_note(STEP_NAMES[step], base_note.a4_frequency)
+        for fret_number, step in zip(numbers[1:].tolist(), steps[1:].tolist())
     }
+    return {0: base_note, **notes}
+
+
+def tar_string_steps(base_step: int, fret_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (fret numbers, absolute steps) of a string whose open-hand note is at base_step
+
+    See core.note_names for absolute steps, and tar_string() for the fret numbers.
+    """
+    numbers = fret_numbers(fret_count)
+    steps = base_step + FRET_STEPS[numbers]
+    if steps[-1] >= STEP_COUNT:
+        raise ValueError(f"Frets of a string on step {base_step} exceed the range of notes")
+    return numbers, steps
+
+
+def tar_string_sweep(
+    base_note_name: str, fret_count: int, a4_frequencies: Sequence[float]
+) -> Tuple[np.ndarray, List[str], np.ndarray]:
+    """Return fret numbers, note names and the (A4 references x frets) frequency matrix of a string
+
+    Vectorized equivalent of calling tar_string() once per A4 reference: the open-hand keeps the
+    spelling of base_note_name (e.g. "Eb4"), and frets are named in standard form.
+    """
+    numbers, steps = tar_string_steps(parse_note_name(base_note_name).step, fret_count)
+    names = [base_note_name, *(step_to_name(step) for step in steps[1:].tolist())]
+    return numbers, names, frequency_sweep(a4_frequencies, steps)
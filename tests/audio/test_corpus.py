@@ -0,0 +1,164 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import json
+import os
+from typing import Tuple
+
+import numpy as np
+import pytest
+
+from audio import corpus
+from audio.corpus import (
+    OCTAVE_COUNT,
+    AnalysisOptions,
+    Checkpoint,
+    analyze_corpus,
+    find_wav_files,
+    pitch_histogram,
+)
+from core.frequency import Frequency
+from core.note_names import QUARTERTONE_INDEX, parse_note_name
+from core.notes import Note
+from core.tuning import tuning_table
+
+A4_FREQUENCY = Frequency(440)
+SAMPLE_RATE = 16000
+OPTIONS = AnalysisOptions(frame_length=1024, hop_length=512)
+
+
+def _frequency(note_name: str) -> float:
+    return Note.from_name(note_name, A4_FREQUENCY).frequency.value
+
+
+def _histogram_cell(note_name: str) -> Tuple[int, int]:
+    parsed = parse_note_name(note_name)
+    return parsed.octave.number + 1, parsed.quartertone_index
+
+
+@pytest.fixture(name="corpus_files")
+def fixture_corpus_files(tone, write_wav):
+    paths = [
+        write_wav(tone(_frequency("A4")), SAMPLE_RATE, "a4.wav"),
+        write_wav(tone(_frequency("Dk3")), SAMPLE_RATE, "dk3.wav"),
+        write_wav(
+            np.concatenate([tone(_frequency("A4")), tone(_frequency("C5"))]),
+            SAMPLE_RATE,
+            "a4_c5.wav",
+        ),
+    ]
+    return os.path.dirname(paths[0]), paths
+
+
+def test_find_wav_files(corpus_files, tmp_path: str):
+    directory, paths = corpus_files
+    os.makedirs(os.path.join(tmp_path, "sub"))
+    nested = os.path.join(tmp_path, "sub", "b.WAV")
+    os.rename(paths[0], nested)
+    with open(os.path.join(tmp_path, "notes.txt"), "w", encoding="utf-8") as text_file:
+        text_file.write("not audio")
+    assert find_wav_files(directory) == sorted([nested, *paths[1:]])
+
+
+def test_pitch_histogram(corpus_files):
+    _, paths = corpus_files
+    histogram = pitch_histogram(paths[2], tuning_table(A4_FREQUENCY), OPTIONS)
+    assert histogram.shape == (OCTAVE_COUNT, 24)
+    a4, c5 = histogram[_histogram_cell("A4")], histogram[_histogram_cell("C5")]
+    assert a4 > 0 and c5 > 0
+    assert histogram.sum() - a4 - c5 <= 2  # frames across the two notes
+    assert histogram[5, QUARTERTONE_INDEX["A"]] == a4
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_analyze_corpus(corpus_files, jobs: int):
+    _, paths = corpus_files
+    summary = analyze_corpus(paths, A4_FREQUENCY, jobs=jobs, options=OPTIONS)
+    assert set(summary.file_histograms) == set(paths)
+    np.testing.assert_array_equal(summary.histogram, sum(summary.file_histograms.values()))
+    assert summary.histogram[_histogram_cell("Dk3")] > 0
+    assert not summary.errors
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_analyze_corpus_reports_unreadable_files(corpus_files, tmp_path: str, jobs: int):
+    _, paths = corpus_files
+    broken = os.path.join(tmp_path, "broken.wav")
+    with open(broken, "wb") as wav_file:
+        wav_file.write(b"not a wav file")
+    summary = analyze_corpus([broken, paths[0]], A4_FREQUENCY, jobs=jobs, options=OPTIONS)
+    assert list(summary.file_histograms) == [paths[0]]
+    assert list(summary.errors) == [broken]
+
+
+def test_analyze_corpus_invalid_jobs(corpus_files):
+    _, paths = corpus_files
+    with pytest.raises(ValueError):
+        analyze_corpus(paths, A4_FREQUENCY, jobs=0)
+
+
+def test_worker_tuning_table_is_shared_and_read_only():
+    corpus._initialize_worker(440.0)  # pylint: disable=protected-access
+    table = corpus._WORKER_STATE["table"]  # pylint: disable=protected-access
+    assert table is tuning_table(A4_FREQUENCY)
+    assert not table.frequencies.flags.writeable
+
+
+def test_analyze_corpus_resumes_from_checkpoint(corpus_files, tmp_path: str, mocker):
+    _, paths = corpus_files
+    checkpoint_path = os.path.join(tmp_path, "checkpoint.jsonl")
+    first = analyze_corpus(paths[:2], A4_FREQUENCY, 1, OPTIONS, checkpoint_path)
+    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint_file:
+        checkpoint_file.write('{"file": "interrupted')  # a line cut short
+
+    spy = mocker.spy(corpus, "pitch_histogram")
+    resumed = analyze_corpus(paths, A4_FREQUENCY, 1, OPTIONS, checkpoint_path)
+    assert [call.args[0] for call in spy.call_args_list] == [paths[2]]
+    assert set(resumed.file_histograms) == set(paths)
+    full = analyze_corpus(paths, A4_FREQUENCY, 1, OPTIONS)
+    np.testing.assert_array_equal(resumed.histogram, full.histogram)
+    for path in paths[:2]:
+        np.testing.assert_array_equal(resumed.file_histograms[path], first.file_histograms[path])
+    # the record appended after the cut line is not glued to it
+    checkpoint = Checkpoint(checkpoint_path, A4_FREQUENCY, OPTIONS)
+    assert [file_path for file_path, _ in checkpoint.load()] == paths
+
+
+def test_checkpoint_truncates_torn_last_line(tmp_path: str):
+    checkpoint_path = os.path.join(tmp_path, "checkpoint.jsonl")
+    checkpoint = Checkpoint(checkpoint_path, A4_FREQUENCY, OPTIONS)
+    checkpoint.append("a.wav", np.zeros((OCTAVE_COUNT, 24)))
+    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint_file:
+        checkpoint_file.write('{"file": "corrupted\n{"file": "b.w')
+    assert [file_path for file_path, _ in checkpoint.load()] == ["a.wav"]
+    checkpoint.append("b.wav", np.zeros((OCTAVE_COUNT, 24)))
+    assert [file_path for file_path, _ in checkpoint.load()] == ["a.wav", "b.wav"]
+    open(checkpoint_path, "w", encoding="utf-8").close()  # pylint: disable=consider-using-with
+    assert not list(checkpoint.load())
+
+
+def test_checkpoint_of_another_a4_frequency(tmp_path: str):
+    checkpoint_path = os.path.join(tmp_path, "checkpoint.jsonl")
+    histogram = np.zeros((OCTAVE_COUNT, 24))
+    Checkpoint(checkpoint_path, Frequency(415), OPTIONS).append("a.wav", histogram)
+    with open(checkpoint_path, "r", encoding="utf-8") as checkpoint_file:
+        assert json.loads(checkpoint_file.readline())["a4_frequency"] == 415
+    with pytest.raises(ValueError):
+        list(Checkpoint(checkpoint_path, A4_FREQUENCY, OPTIONS).load())
+
+
+@pytest.mark.parametrize(
+    "options", [AnalysisOptions(frame_length=2048), AnalysisOptions(hop_length=256)]
+)
+def test_checkpoint_of_other_options(tmp_path: str, options: AnalysisOptions):
+    checkpoint_path = os.path.join(tmp_path, "checkpoint.jsonl")
+    histogram = np.zeros((OCTAVE_COUNT, 24))
+    Checkpoint(checkpoint_path, A4_FREQUENCY, OPTIONS).append("a.wav", histogram)
+    with open(checkpoint_path, "r", encoding="utf-8") as checkpoint_file:
+        assert json.loads(checkpoint_file.readline())["options"]["hop_length"] == 512
+    assert len(list(Checkpoint(checkpoint_path, A4_FREQUENCY, OPTIONS).load())) == 1
+    with pytest.raises(ValueError):
+        list(Checkpoint(checkpoint_path, A4_FREQUENCY, options).load())
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,84 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import numpy as np
+import pytest
+
+from audio.cqt import ConstantQ, cqt_kernel, quartertone_roll
+from core.frequency import Frequency
+from core.note_names import QUARTERTONES_PER_OCTAVE
+from core.tuning import tuning_table
+
+SAMPLE_RATE = 22050
+A4_FREQUENCY = Frequency(440)
+
+
+def _transform(transform: ConstantQ, signal: np.ndarray, block_size: int) -> np.ndarray:
+    chunks = (signal[start : start + block_size] for start in range(0, len(signal), block_size))
+    return np.concatenate(list(transform.transform(chunks)), axis=1)
+
+
+def test_cqt_kernel_is_cached():
+    kernel = cqt_kernel(SAMPLE_RATE, A4_FREQUENCY, 1, 7)
+    assert cqt_kernel(SAMPLE_RATE, Frequency(440.0), 1, 7) is kernel
+    assert cqt_kernel(SAMPLE_RATE, Frequency(432), 1, 7) is not kernel
+    assert len(kernel.steps) == 7 * QUARTERTONES_PER_OCTAVE
+    np.testing.assert_array_equal(
+        kernel.frequencies, tuning_table(A4_FREQUENCY).frequencies[kernel.steps]
+    )
+    assert kernel.matrix.shape == (QUARTERTONES_PER_OCTAVE, kernel.fft_length // 2 + 1)
+    assert kernel.matrix.nnz < kernel.matrix.shape[0] * kernel.matrix.shape[1] / 4
+
+
+@pytest.mark.parametrize("a4_value", [440.0, 432.0])
+@pytest.mark.parametrize("note_name", ["C1", "Ek2", "A4", "G#5", "Bs7"])
+def test_constant_q_peak_at_note(tone, a4_value: float, note_name: str):
+    frequency = tuning_table(Frequency(a4_value))[note_name]
+    transform = ConstantQ(SAMPLE_RATE, Frequency(a4_value))
+    magnitudes = _transform(transform, tone(frequency, 1.0, SAMPLE_RATE), 4096)
+    middle = magnitudes[:, magnitudes.shape[1] // 2]
+    peak = int(np.argmax(middle))
+    assert transform.steps[peak] == tuning_table(Frequency(a4_value)).nearest_steps(frequency)
+    assert middle[peak] == pytest.approx(0.5, abs=0.01)
+    # neighbours a quartertone away get about half, and everything further away much less
+    assert np.all(
+        np.delete(middle, range(max(peak - 1, 0), peak + 2)[: len(middle) - peak + 1]) < 0.1
+    )
+
+
+@pytest.mark.parametrize("block_size", [100, 1000, 100000])
+def test_constant_q_is_independent_of_block_size(block_size: int):
+    signal = np.random.default_rng(0).normal(size=SAMPLE_RATE) * 0.1
+    expected = _transform(ConstantQ(SAMPLE_RATE, A4_FREQUENCY), signal, len(signal))
+    magnitudes = _transform(ConstantQ(SAMPLE_RATE, A4_FREQUENCY), signal, block_size)
+    np.testing.assert_allclose(magnitudes, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("sample_count", [0, 1, 512, 513, 10000])
+def test_constant_q_frame_count(sample_count: int):
+    transform = ConstantQ(SAMPLE_RATE, A4_FREQUENCY, min_octave=2, max_octave=5, hop_length=256)
+    magnitudes = _transform(transform, np.ones(sample_count), 1000)
+    assert magnitudes.shape == (4 * QUARTERTONES_PER_OCTAVE, -(-sample_count // 256))
+    assert transform.frame_count == magnitudes.shape[1]
+
+
+def test_constant_q_invalid():
+    with pytest.raises(ValueError):
+        ConstantQ(SAMPLE_RATE, A4_FREQUENCY, min_octave=5, max_octave=4)
+    with pytest.raises(ValueError):
+        ConstantQ(SAMPLE_RATE, A4_FREQUENCY, max_octave=10)
+    with pytest.raises(ValueError):
+        ConstantQ(SAMPLE_RATE, A4_FREQUENCY, max_octave=9)  # above Nyquist
+    with pytest.raises(ValueError):
+        ConstantQ(SAMPLE_RATE, A4_FREQUENCY, hop_length=100)
+
+
+def test_quartertone_roll(tone, write_wav):
+    samples = tone(tuning_table(A4_FREQUENCY)["Dk4"], 0.5, SAMPLE_RATE)
+    file_path = write_wav(samples, SAMPLE_RATE)
+    roll = quartertone_roll(file_path, A4_FREQUENCY, min_octave=3, max_octave=5)
+    assert roll.shape == (3 * QUARTERTONES_PER_OCTAVE, -(-len(samples) // 512))
+    assert np.argmax(roll[:, roll.shape[1] // 2]) == QUARTERTONES_PER_OCTAVE + 3
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
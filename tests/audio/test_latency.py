@@ -0,0 +1,56 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import pytest
+
+from audio.latency import LatencyHistogram
+
+
+def test_latency_histogram_invalid_edges():
+    with pytest.raises(ValueError):
+        LatencyHistogram([1.0, 1.0])
+
+
+def test_latency_histogram_empty():
+    histogram = LatencyHistogram()
+    assert histogram.count == 0
+    assert histogram.mean_ms == 0.0
+    assert histogram.percentile(99) == 0.0
+    assert histogram.fraction_within(10) == 1.0
+
+
+def test_latency_histogram_record():
+    histogram = LatencyHistogram([1.0, 2.0, 5.0, 10.0])
+    for seconds in [0.0005, 0.001, 0.0015, 0.003, 0.004, 0.008, 0.012]:
+        histogram.record(seconds)
+    assert histogram.counts.tolist() == [2, 1, 2, 1, 1]
+    assert histogram.count == 7
+    assert histogram.max_ms == pytest.approx(12.0)
+    assert histogram.mean_ms == pytest.approx(30.0 / 7)
+    assert histogram.percentile(50) == 5.0
+    assert histogram.percentile(100) == pytest.approx(12.0)
+    assert histogram.percentile(0) == 1.0
+    assert histogram.fraction_within(10.0) == pytest.approx(6 / 7)
+    assert histogram.fraction_within(7.0) == pytest.approx(5 / 7)
+    assert histogram.fraction_within(0.5) == 0.0
+
+
+def test_latency_histogram_percentile_bounded_by_max():
+    histogram = LatencyHistogram([1.0, 10.0])
+    histogram.record(0.002)
+    assert histogram.percentile(50) == pytest.approx(2.0)
+
+
+def test_latency_histogram_percentile_invalid():
+    with pytest.raises(ValueError):
+        LatencyHistogram().percentile(101)
+
+
+def test_latency_histogram_summary():
+    histogram = LatencyHistogram()
+    histogram.record(0.001)
+    assert set(histogram.as_dict()) == {"count", "mean_ms", "p50_ms", "p99_ms", "max_ms"}
+    assert str(histogram).startswith("n=1 mean=1.000 ms")
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
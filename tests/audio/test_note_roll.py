@@ -0,0 +1,120 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import numpy as np
+import pytest
+
+from audio.note_roll import (
+    bin_note_matrix,
+    note_peaks,
+    note_roll,
+    power_spectrogram,
+    power_spectrogram_chunks,
+    roll_segments,
+    roll_to_events,
+)
+from audio.sparse import CsrMatrix
+from core.frequency import Frequency
+from core.note_names import STEP_COUNT
+from core.notes import Note
+from core.tuning import tuning_table
+
+SAMPLE_RATE = 16000
+FFT_LENGTH = 4096
+HOP_LENGTH = 512
+A4_FREQUENCY = Frequency(440)
+
+
+def _frequencies(note_names) -> list:
+    return [tuning_table(A4_FREQUENCY)[name] for name in note_names]
+
+
+def test_bin_note_matrix():
+    matrix = bin_note_matrix(FFT_LENGTH, SAMPLE_RATE, A4_FREQUENCY)
+    assert bin_note_matrix(FFT_LENGTH, SAMPLE_RATE, Frequency(440.0)) is matrix
+    assert matrix.shape == (STEP_COUNT, FFT_LENGTH // 2 + 1)
+    dense = matrix.to_dense()
+    # every bin in the range of the tuning table belongs to exactly one note
+    in_range = np.fft.rfftfreq(FFT_LENGTH, 1 / SAMPLE_RATE) >= tuning_table(A4_FREQUENCY)[0]
+    np.testing.assert_array_equal(dense.sum(axis=0), in_range)
+    a4_bin = round(440 * FFT_LENGTH / SAMPLE_RATE)
+    assert dense[tuning_table(A4_FREQUENCY).nearest_steps(440.0), a4_bin] == 1
+    # same (row by row, column sorted) layout as the CSR form of the dense matrix
+    canonical = CsrMatrix.from_dense(dense)
+    np.testing.assert_array_equal(matrix.indptr, canonical.indptr)
+    np.testing.assert_array_equal(matrix.indices, canonical.indices)
+    with pytest.raises(ValueError):
+        bin_note_matrix(0, SAMPLE_RATE, A4_FREQUENCY)
+
+
+def test_power_spectrogram(tone):
+    spectrogram = power_spectrogram(
+        tone(_frequencies(["A4"]), 1.0, SAMPLE_RATE), FFT_LENGTH, HOP_LENGTH
+    )
+    assert spectrogram.shape == (FFT_LENGTH // 2 + 1, 1 + (SAMPLE_RATE - FFT_LENGTH) // HOP_LENGTH)
+    assert spectrogram.max() == pytest.approx(0.25, rel=0.2)
+
+
+@pytest.mark.parametrize("chunk_size", [1000, 5000, 100000])
+def test_power_spectrogram_chunks(chunk_size: int):
+    samples = np.random.default_rng(0).normal(size=SAMPLE_RATE)
+    chunks = [samples[start : start + chunk_size] for start in range(0, len(samples), chunk_size)]
+    streamed = np.concatenate(
+        list(power_spectrogram_chunks(chunks, FFT_LENGTH, HOP_LENGTH)), axis=1
+    )
+    np.testing.assert_allclose(streamed, power_spectrogram(samples, FFT_LENGTH, HOP_LENGTH))
+
+
+@pytest.mark.parametrize("note_names", [["A4"], ["C4", "Ek4", "G4"], ["Dk5", "F#6"]])
+def test_note_roll_peaks(tone, note_names):
+    samples = tone(_frequencies(note_names), 1.0, SAMPLE_RATE, 0.3)
+    spectrogram = power_spectrogram(samples, FFT_LENGTH, HOP_LENGTH)
+    roll = note_peaks(note_roll(spectrogram, SAMPLE_RATE, A4_FREQUENCY))
+    assert roll.shape == (STEP_COUNT, spectrogram.shape[1])
+    loudest = np.sort(np.argsort(roll[:, 0])[-len(note_names) :])
+    expected = tuning_table(A4_FREQUENCY).nearest_steps(_frequencies(note_names))
+    np.testing.assert_array_equal(loudest, np.sort(expected))
+
+
+def test_note_roll_invalid():
+    with pytest.raises(ValueError):
+        note_roll(np.ones(10), SAMPLE_RATE, A4_FREQUENCY)
+
+
+def test_roll_segments():
+    roll = np.zeros((4, 10))
+    roll[1, 2:6] = 1.0
+    roll[3, 0:2] = 1.0  # too short
+    roll[3, 5:10] = 2.0
+    roll[0, 3:7] = 0.5  # below threshold
+    steps, starts, frame_counts = roll_segments(roll, threshold=1.0, min_note_frames=3)
+    np.testing.assert_array_equal(steps, [1, 3])
+    np.testing.assert_array_equal(starts, [2, 5])
+    np.testing.assert_array_equal(frame_counts, [4, 5])
+
+
+def test_roll_to_events(tone):
+    samples = np.concatenate(
+        [
+            tone(_frequencies(["A4"]), 0.5, SAMPLE_RATE, 0.3),
+            tone(_frequencies(["C5", "E5"]), 0.5, SAMPLE_RATE, 0.3),
+        ]
+    )
+    spectrogram = power_spectrogram(samples, FFT_LENGTH, HOP_LENGTH)
+    roll = note_peaks(note_roll(spectrogram, SAMPLE_RATE, A4_FREQUENCY))
+    hop_seconds = HOP_LENGTH / SAMPLE_RATE
+    events = roll_to_events(roll, A4_FREQUENCY, hop_seconds, threshold=0.01)
+    assert [event.note for event in events] == [
+        Note.from_name(name, A4_FREQUENCY) for name in ["A4", "C5", "E5"]
+    ]
+    assert events[0].onset == 0.0
+    assert (
+        events[1].onset
+        == events[2].onset
+        == pytest.approx(0.5 - FFT_LENGTH / SAMPLE_RATE / 2, abs=0.1)
+    )
+    with pytest.raises(ValueError):
+        roll_to_events(roll[:-1], A4_FREQUENCY, hop_seconds, threshold=0.01)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,111 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+from audio import pitch
+from audio.pitch import FramePitchEstimator, PitchSettings, estimate_pitch, frame_signal
+
+SAMPLE_RATE = 44100
+# harmonic tones: the first three partials, with decreasing amplitudes
+HARMONICS = np.arange(1, 4)
+HARMONIC_AMPLITUDES = [0.5, 0.3, 0.2]
+
+
+@pytest.mark.parametrize(
+    "invalid_settings",
+    [
+        {"sample_rate": 0},
+        {"hop_length": 0},
+        {"hop_length": 4096},
+        {"min_frequency": 0.0},
+        {"max_frequency": 30000.0},
+        {"min_frequency": 20.0},
+    ],
+)
+def test_pitch_settings_invalid(invalid_settings: Dict[str, Any]):
+    settings: Dict[str, Any] = {"sample_rate": SAMPLE_RATE, **invalid_settings}
+    with pytest.raises(ValueError):
+        PitchSettings(**settings)
+
+
+def test_frame_signal():
+    frames = frame_signal(np.arange(10.0), 4, 3)
+    np.testing.assert_array_equal(frames, [[0, 1, 2, 3], [3, 4, 5, 6], [6, 7, 8, 9]])
+    assert frame_signal(np.arange(3.0), 4, 3).shape == (0, 4)
+
+
+@pytest.mark.parametrize("frequency", [65.4, 110.0, 261.63, 440.0, 987.77, 1760.0])
+def test_estimate_pitch_harmonic_tone(tone, frequency: float):
+    settings = PitchSettings(SAMPLE_RATE)
+    frames = frame_signal(
+        tone(frequency * HARMONICS, 0.5, SAMPLE_RATE, HARMONIC_AMPLITUDES),
+        settings.frame_length,
+        settings.hop_length,
+    )
+    frequencies, confidence = estimate_pitch(frames, settings)
+    cents = 1200 * np.log2(frequencies / frequency)
+    assert np.all(np.abs(cents) < 10)
+    assert np.all(confidence > 0.9)
+
+
+def test_estimate_pitch_silence_and_noise_are_unvoiced():
+    settings = PitchSettings(SAMPLE_RATE)
+    noise = np.random.default_rng(0).normal(0, 0.3, SAMPLE_RATE // 2)
+    for samples in [np.zeros(SAMPLE_RATE // 2), noise]:
+        frames = frame_signal(samples, settings.frame_length, settings.hop_length)
+        frequencies, _ = estimate_pitch(frames, settings)
+        assert np.all(np.isnan(frequencies))
+
+
+def test_estimate_pitch_empty():
+    settings = PitchSettings(SAMPLE_RATE)
+    frequencies, confidence = estimate_pitch(np.empty((0, settings.frame_length)), settings)
+    assert frequencies.shape == confidence.shape == (0,)
+
+
+def test_frame_pitch_estimator_matches_estimate_pitch(tone):
+    settings = PitchSettings(SAMPLE_RATE, hop_length=1024)
+    rng = np.random.default_rng(0)
+    samples = np.concatenate(
+        [
+            tone(220.0 * HARMONICS, 0.2, SAMPLE_RATE, HARMONIC_AMPLITUDES),
+            np.zeros(4096),
+            rng.normal(0, 0.3, 4096),
+            tone(1318.5 * HARMONICS, 0.2, SAMPLE_RATE, HARMONIC_AMPLITUDES),
+        ]
+    )
+    frames = frame_signal(samples, settings.frame_length, settings.hop_length)
+    expected_frequencies, expected_confidence = estimate_pitch(frames, settings)
+    estimator = FramePitchEstimator(settings)
+    for frame, expected_frequency, expected in zip(
+        frames, expected_frequencies, expected_confidence
+    ):
+        estimator.window(frame)
+        frequency, confidence = estimator.estimate()
+        np.testing.assert_allclose(frequency, expected_frequency, rtol=1e-9)
+        assert confidence == pytest.approx(expected, abs=1e-9)
+
+
+def test_frame_pitch_estimator_no_peak_past_main_lobe():
+    settings = PitchSettings(SAMPLE_RATE)
+    estimator = FramePitchEstimator(settings)
+    min_lag, max_lag = estimator._lag_range  # pylint: disable=protected-access
+    normalized = np.full(settings.frame_length, -0.5)
+    normalized[0] = 1.0
+    lag = estimator._period_lag(normalized)  # pylint: disable=protected-access
+    assert lag == min_lag
+    period_lags = pitch._period_lags  # pylint: disable=protected-access
+    assert period_lags(normalized[np.newaxis], min_lag, max_lag).tolist() == [lag]
+
+
+def test_frame_pitch_estimator_invalid_frame():
+    estimator = FramePitchEstimator(PitchSettings(SAMPLE_RATE))
+    with pytest.raises(ValueError):
+        estimator.window(np.zeros(100))
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,124 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import os
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+from audio.pitch import PitchSettings, estimate_pitch, frame_signal
+from audio.plucked import Pluck, PluckedStrings, fret_sweep
+from audio.synthesis import render_to_wav
+from audio.wav_reader import wav_info
+from core.frequency import Frequency
+from core.notes import Note
+from instruments.tar_instrument import tar_string
+
+SAMPLE_RATE = 16000
+A4_FREQUENCY = Frequency(440)
+
+
+def _cents_error(signal: np.ndarray, frequency: float) -> np.ndarray:
+    settings = PitchSettings(SAMPLE_RATE, frame_length=2048, hop_length=512, min_frequency=50)
+    frequencies, _ = estimate_pitch(frame_signal(signal, 2048, 512), settings)
+    return 1200 * np.log2(frequencies / frequency)
+
+
+@pytest.mark.parametrize("frequency", [98.0, 261.63, 277.18, 1046.5, 1975.5])
+def test_plucked_string_pitch(frequency: float):
+    strings = PluckedStrings([frequency], [0.0], 0.5, SAMPLE_RATE)
+    signal = np.concatenate(list(strings.blocks(1000)))
+    assert len(signal) == SAMPLE_RATE // 2
+    cents_errors = _cents_error(signal, frequency)
+    assert not np.isnan(cents_errors[0])
+    assert np.nanmax(np.abs(cents_errors)) < 5
+
+
+def test_plucked_string_decays():
+    strings = PluckedStrings([220.0], [0.0], 2.0, SAMPLE_RATE, Pluck(decay_seconds=1.0))
+    signal = np.concatenate(list(strings.blocks()))
+
+    def _level(time: float) -> float:
+        window = signal[int(time * SAMPLE_RATE) : int((time + 0.1) * SAMPLE_RATE)]
+        return 20 * np.log10(np.sqrt(np.mean(window**2)))
+
+    # after the upper harmonics (which decay faster) are gone
+    assert _level(1.5) - _level(0.5) == pytest.approx(-60, abs=6)
+
+
+@pytest.mark.parametrize("block_size", [7, 1000, 100000])
+def test_plucked_strings_blocks_are_independent_of_block_size(block_size: int):
+    def _render(size: int) -> np.ndarray:
+        strings = PluckedStrings([196.0, 523.25], [0.0, 0.1], 0.3, SAMPLE_RATE, Pluck(seed=3))
+        return np.concatenate(list(strings.blocks(size)))
+
+    np.testing.assert_allclose(_render(block_size), _render(4096), atol=1e-12)
+
+
+def test_plucked_strings_onsets_and_ends():
+    strings = PluckedStrings([440.0, 440.0], [0.1, 0.5], 0.2, SAMPLE_RATE)
+    signal = np.concatenate(list(strings.blocks()))
+    assert len(signal) == int(0.7 * SAMPLE_RATE)
+    assert not np.any(signal[: int(0.1 * SAMPLE_RATE)])
+    assert not np.any(signal[int(0.3 * SAMPLE_RATE) : int(0.5 * SAMPLE_RATE)])
+    assert np.any(signal[int(0.5 * SAMPLE_RATE) :])
+
+
+def test_plucked_strings_silent_block_between_voices():
+    strings = PluckedStrings([440.0, 440.0], [0.0, 0.5], 0.1, SAMPLE_RATE)
+    strings.render(0, int(0.1 * SAMPLE_RATE))
+    silent = strings.render(int(0.2 * SAMPLE_RATE), int(0.3 * SAMPLE_RATE))
+    np.testing.assert_array_equal(silent, np.zeros(int(0.1 * SAMPLE_RATE)))
+    assert np.any(strings.render(int(0.5 * SAMPLE_RATE), int(0.6 * SAMPLE_RATE)))
+
+
+def test_plucked_strings_invalid_block_size():
+    strings = PluckedStrings([440.0], [0.0], 0.1, SAMPLE_RATE)
+    with pytest.raises(ValueError):
+        next(strings.blocks(0))
+
+
+@pytest.mark.parametrize(
+    "invalid_arguments",
+    [
+        {"frequencies": [440.0, 220.0]},
+        {"frequencies": [0.0]},
+        {"frequencies": [5000.0]},
+        {"onsets": [-1.0]},
+        {"duration": 0.0},
+    ],
+)
+def test_plucked_strings_invalid(invalid_arguments: Dict[str, Any]):
+    arguments: Dict[str, Any] = {
+        "frequencies": [440.0],
+        "onsets": [0.0],
+        "duration": 1.0,
+        "sample_rate": SAMPLE_RATE,
+        **invalid_arguments,
+    }
+    with pytest.raises(ValueError):
+        PluckedStrings(**arguments)
+
+
+def test_fret_sweep_of_several_strings(tmp_path: str):
+    strings = [tar_string(Note.from_name(name, A4_FREQUENCY), 25) for name in ["C4", "G3"]]
+    sweep = fret_sweep(strings, note_interval=0.1, ring_duration=0.3, sample_rate=SAMPLE_RATE)
+    assert sweep.length == int((25 * 0.1 + 0.3) * SAMPLE_RATE)
+    file_path = os.path.join(tmp_path, "sweep.wav")
+    stats = render_to_wav(file_path, sweep)
+    assert wav_info(file_path).frame_count == sweep.length == stats.frame_count
+
+
+def test_fret_sweep_pitch_of_each_fret():
+    string = tar_string(Note.from_name("C3", A4_FREQUENCY), 27)
+    sweep = fret_sweep([string], note_interval=0.25, ring_duration=0.25, sample_rate=SAMPLE_RATE)
+    signal = np.concatenate(list(sweep.blocks()))
+    fret_samples = SAMPLE_RATE // 4
+    for position, note in enumerate(string.values()):
+        fret_signal = signal[position * fret_samples : (position + 1) * fret_samples]
+        cents_errors = _cents_error(fret_signal, note.frequency.value)
+        assert np.nanmax(np.abs(cents_errors)) < 10
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,45 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import numpy as np
+import pytest
+
+from audio.ring_buffer import RingBuffer
+
+
+def test_ring_buffer_invalid_capacity():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
+
+
+@pytest.mark.parametrize("write_size", [1, 3, 5, 8, 13])
+def test_ring_buffer_latest(write_size: int):
+    buffer = RingBuffer(8)
+    stream = np.arange(100.0)
+    for start in range(0, len(stream), write_size):
+        buffer.write(stream[start : start + write_size])
+        end = min(start + write_size, len(stream))
+        assert len(buffer) == min(end, 8)
+        np.testing.assert_array_equal(buffer.latest(len(buffer)), stream[max(end - 8, 0) : end])
+        np.testing.assert_array_equal(buffer.latest(1), [stream[end - 1]])
+
+
+def test_ring_buffer_latest_is_read_only_view():
+    buffer = RingBuffer(4)
+    buffer.write(np.arange(6.0))
+    latest = buffer.latest(4)
+    np.testing.assert_array_equal(latest, [2, 3, 4, 5])
+    assert not latest.flags.owndata
+    with pytest.raises(ValueError):
+        latest[0] = 0
+
+
+@pytest.mark.parametrize("size", [0, 4])
+def test_ring_buffer_latest_invalid_size(size: int):
+    buffer = RingBuffer(4)
+    buffer.write(np.arange(3.0))
+    with pytest.raises(ValueError):
+        buffer.latest(size)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
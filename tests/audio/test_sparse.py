@@ -0,0 +1,70 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import numpy as np
+import pytest
+
+from audio.sparse import CsrMatrix
+
+
+def _random_sparse(rows: int, columns: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    dense = rng.normal(size=(rows, columns)) * (rng.uniform(size=(rows, columns)) < 0.3)
+    dense[1] = 0.0  # an empty row
+    dense[-1] = 0.0  # an empty last row
+    return dense
+
+
+def test_csr_matrix_from_dense():
+    dense = _random_sparse(6, 9)
+    matrix = CsrMatrix.from_dense(dense)
+    assert matrix.shape == (6, 9)
+    assert matrix.nnz == np.count_nonzero(dense)
+    assert repr(matrix) == f"CsrMatrix(6x9, {matrix.nnz} values)"
+    np.testing.assert_array_equal(matrix.to_dense(), dense)
+    assert not matrix.data.flags.writeable
+
+
+def test_csr_matrix_keeps_read_only_copies():
+    data, indices, indptr = np.array([1.0, 2.0]), np.array([2, 0]), np.array([0, 1, 2])
+    matrix = CsrMatrix(data, indices, indptr, (2, 3))
+    assert all(array.flags.writeable for array in (data, indices, indptr))
+    assert not any(array.flags.writeable for array in (matrix.data, matrix.indices, matrix.indptr))
+    data[0] = 5.0
+    np.testing.assert_array_equal(matrix.to_dense(), [[0.0, 0.0, 1.0], [2.0, 0.0, 0.0]])
+
+
+def test_csr_matrix_from_dense_threshold():
+    matrix = CsrMatrix.from_dense(np.array([[0.1, -2.0, 0.5], [-0.4, 0.0, 3.0]]), threshold=0.45)
+    np.testing.assert_array_equal(matrix.to_dense(), [[0.0, -2.0, 0.5], [0.0, 0.0, 3.0]])
+    np.testing.assert_array_equal(matrix.indptr, [0, 2, 3])
+
+
+@pytest.mark.parametrize("shape", [(9,), (9, 1), (9, 5)])
+def test_csr_matrix_matmul(shape):
+    dense = _random_sparse(6, 9)
+    other = np.random.default_rng(1).normal(size=shape) + 1j
+    product = CsrMatrix.from_dense(dense) @ other
+    assert product.shape == (6,) + shape[1:]
+    assert product.dtype == np.complex128
+    np.testing.assert_allclose(product, dense @ other)
+
+
+def test_csr_matrix_matmul_zero_matrix():
+    product = CsrMatrix.from_dense(np.zeros((3, 4))) @ np.ones((4, 2))
+    np.testing.assert_array_equal(product, np.zeros((3, 2)))
+
+
+def test_csr_matrix_invalid():
+    matrix = CsrMatrix.from_dense(np.eye(3))
+    with pytest.raises(ValueError):
+        _ = matrix @ np.ones(4)
+    with pytest.raises(ValueError):
+        CsrMatrix.from_dense(np.ones(3))
+    with pytest.raises(ValueError):
+        CsrMatrix(np.ones(2), np.array([0, 1]), np.array([0, 2]), (2, 2))
+    with pytest.raises(ValueError):
+        CsrMatrix(np.ones(2), np.array([0, 2]), np.array([0, 1, 2]), (2, 2))
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,94 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import os
+
+import numpy as np
+import pytest
+
+from audio.synthesis import (
+    WAVETABLE_SIZE,
+    Synthesizer,
+    Timbre,
+    render_to_wav,
+    synthesize,
+    wavetable,
+)
+from audio.wav_reader import read_wav_chunks, wav_info
+from core.frequency import Frequency
+from core.notes import Note
+
+A4_FREQUENCY = Frequency(440)
+SAMPLE_RATE = 8000
+
+
+def _note(name: str) -> Note:
+    return Note.from_name(name, A4_FREQUENCY)
+
+
+def test_wavetable():
+    table = wavetable(440.0, SAMPLE_RATE, Timbre())
+    assert table.shape == (WAVETABLE_SIZE + 1,)
+    assert table[0] == pytest.approx(table[-1])
+    assert np.max(np.abs(table)) == pytest.approx(1.0)
+    assert not table.flags.writeable
+    assert wavetable(440, SAMPLE_RATE, Timbre()) is table
+
+
+def test_wavetable_is_band_limited():
+    timbre = Timbre(harmonic_amplitudes=(1.0, 1.0, 1.0))
+    # at 2100 Hz, only the fundamental is below Nyquist (4000 Hz)
+    table = wavetable(2100.0, SAMPLE_RATE, timbre)
+    phases = 2 * np.pi * np.arange(WAVETABLE_SIZE + 1) / WAVETABLE_SIZE
+    np.testing.assert_allclose(table, np.sin(phases), atol=1e-12)
+
+
+def test_synthesize_frequency():
+    signal = synthesize([_note("A4")], 1.0, SAMPLE_RATE, Timbre(harmonic_amplitudes=(1.0,)))
+    assert len(signal) == SAMPLE_RATE
+    spectrum = np.abs(np.fft.rfft(signal))
+    assert np.argmax(spectrum) == 440  # 1 Hz resolution
+    assert np.max(np.abs(signal)) <= 0.5
+
+
+def test_synthesize_sequence_and_rests():
+    signal = synthesize([_note("C4"), None, _note("G4")], [0.5, 0.25, 0.5], SAMPLE_RATE)
+    assert len(signal) == 10000
+    assert not np.any(signal[4000:6000])
+    assert np.any(signal[:4000]) and np.any(signal[6000:])
+    # the envelope goes to zero at the boundaries of notes (no clicks)
+    assert signal[0] == 0.0
+    assert abs(signal[3999]) < 0.05
+
+
+@pytest.mark.parametrize("block_size", [1, 999, 4096, 100000])
+def test_synthesizer_blocks_equal_whole_render(block_size: int):
+    notes = [_note("C4"), _note("Dk4"), None, _note("E4")]
+    synthesizer = Synthesizer(notes, [0.3, 0.2, 0.1, 0.4], SAMPLE_RATE)
+    blocks = list(synthesizer.blocks(block_size))
+    assert all(len(block) == block_size for block in blocks[:-1])
+    np.testing.assert_array_equal(np.concatenate(blocks), synthesizer.render(0, synthesizer.length))
+
+
+def test_synthesizer_invalid():
+    with pytest.raises(ValueError):
+        Synthesizer([_note("C4")], -1.0)
+    with pytest.raises(ValueError):
+        Synthesizer([_note("C4")], 1.0, sample_rate=0)
+    with pytest.raises(ValueError):
+        next(Synthesizer([_note("C4")], 1.0).blocks(0))
+
+
+def test_render_to_wav(tmp_path: str):
+    file_path = os.path.join(tmp_path, "render.wav")
+    synthesizer = Synthesizer([_note("A3"), _note("A4")], 0.5, SAMPLE_RATE)
+    stats = render_to_wav(file_path, synthesizer, block_size=1000)
+    assert stats.frame_count == SAMPLE_RATE
+    assert stats.audio_seconds == 1.0
+    assert stats.realtime_factor > 0
+    assert wav_info(file_path).frame_count == SAMPLE_RATE
+    written = np.concatenate(list(read_wav_chunks(file_path)))
+    np.testing.assert_allclose(written, synthesizer.render(0, SAMPLE_RATE), atol=1e-4)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,102 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+from typing import List
+
+import numpy as np
+import pytest
+
+from audio.pitch import PitchSettings
+from audio.transcription import (
+    UNVOICED,
+    NoteSegmenter,
+    ThroughputStats,
+    frequencies_to_steps,
+    transcribe,
+)
+from audio.wav_reader import read_wav_chunks
+from core.frequency import Frequency
+from core.notes import Note
+from core.tuning import tuning_table
+
+A4_FREQUENCY = Frequency(440)
+SAMPLE_RATE = 22050
+
+
+def _frequency(note_name: str) -> float:
+    return Note.from_name(note_name, A4_FREQUENCY).frequency.value
+
+
+@pytest.fixture(name="melody")
+def fixture_melody(tone):
+    """Return a function that concatenates tones of note names, "-" being a rest"""
+
+    def _melody(note_names: List[str], note_duration: float) -> np.ndarray:
+        parts = []
+        for name in note_names:
+            if name == "-":
+                parts.append(np.zeros(int(note_duration * SAMPLE_RATE)))
+            else:
+                parts.append(tone(_frequency(name), note_duration, SAMPLE_RATE, amplitude=0.6))
+        return np.concatenate(parts)
+
+    return _melody
+
+
+def test_frequencies_to_steps():
+    table = tuning_table(A4_FREQUENCY)
+    frequencies = np.array([440.0, np.nan, 1e6, 261.6255653005986, 453.0])
+    steps = frequencies_to_steps(frequencies, table)
+    assert steps.tolist() == [138, UNVOICED, UNVOICED, 120, 139]
+
+
+@pytest.mark.parametrize("chunk_frames", [1000, 4096, 100000])
+def test_transcribe(melody, chunk_frames: int):
+    names = ["C4", "Dk4", "-", "G3", "As4"]
+    samples = melody(names, 0.25)
+    chunks = (samples[i : i + chunk_frames] for i in range(0, len(samples), chunk_frames))
+    settings = PitchSettings(SAMPLE_RATE, frame_length=1024, hop_length=256)
+    stats = ThroughputStats()
+    events = list(transcribe(chunks, settings, A4_FREQUENCY, stats=stats))
+    assert [event.note.name for event in events] == ["C4", "Dk4", "G3", "As4"]
+    onsets = [event.onset for event in events]
+    np.testing.assert_allclose(onsets, [0.0, 0.25, 0.75, 1.0], atol=1024 / SAMPLE_RATE)
+    assert all(0.2 < event.duration < 0.3 for event in events)
+    assert stats.frame_count == (len(samples) - 1024) // 256 + 1
+    assert stats.audio_seconds == pytest.approx(len(samples) / SAMPLE_RATE)
+    assert stats.frames_per_second > 0
+    assert "frames/s" in str(stats)
+
+
+def test_transcribe_drops_short_notes(melody):
+    samples = melody(["-", "A4", "-"], 0.02)
+    settings = PitchSettings(SAMPLE_RATE, frame_length=512, hop_length=128, min_frequency=100)
+    assert not list(transcribe([samples], settings, A4_FREQUENCY, min_note_frames=10))
+
+
+def test_transcribe_wav_file(melody, write_wav):
+    file_path = write_wav(melody(["E2", "B2"], 0.5), SAMPLE_RATE)
+    settings = PitchSettings(SAMPLE_RATE)
+    events = list(transcribe(read_wav_chunks(file_path, 3000), settings, A4_FREQUENCY))
+    assert [event.note.name for event in events] == ["E2", "B2"]
+
+
+def test_note_segmenter_across_pushes():
+    segmenter = NoteSegmenter(A4_FREQUENCY, hop_seconds=0.5, min_note_frames=2)
+    assert not segmenter.push(np.array([138, 138]))
+    events = segmenter.push(np.array([138, UNVOICED, 140, 140, 140]))
+    assert [(event.note.name, event.onset, event.duration) for event in events] == [
+        ("A4", 0.0, 1.5)
+    ]
+    assert segmenter.push(np.array([141]))[0].note.name == "A#4"
+    assert not segmenter.flush()
+    assert segmenter.frame_count == 8
+
+
+def test_throughput_stats_empty():
+    stats = ThroughputStats()
+    assert stats.frames_per_second == 0.0
+    assert stats.realtime_factor == 0.0
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,117 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import math
+import tracemalloc
+import wave
+
+import numpy as np
+import pytest
+
+from audio.pitch import PitchSettings
+from audio.tuner import STAGES, Tuner
+from core.frequency import Frequency
+from core.notes import Note
+from instruments.tar_instrument import tar_string
+
+A4_FREQUENCY = Frequency(440)
+SAMPLE_RATE = 16000
+
+
+def _pcm_reader(samples: np.ndarray):
+    data = np.round(samples * 32767).astype("<i2").tobytes()
+    position = 0
+
+    def _read(frame_count: int) -> bytes:
+        nonlocal position
+        chunk = data[position : position + 2 * frame_count]
+        position += len(chunk)
+        return chunk
+
+    return _read
+
+
+def test_tuner_process(tone):
+    settings = PitchSettings(SAMPLE_RATE, frame_length=1024, hop_length=256)
+    tuner = Tuner(settings, A4_FREQUENCY)
+    samples = tone(440.0 * 2 ** (10 / 1200), 0.2)
+    readings = [tuner.process(samples[i : i + 256]) for i in range(0, len(samples), 256)]
+    assert readings[:3] == [None, None, None]
+    for reading in readings[3:]:
+        assert reading is not None
+        assert reading.note == Note.from_name("A4", A4_FREQUENCY)
+        assert reading.cents == pytest.approx(10.0, abs=2.0)
+    assert readings[3].time == pytest.approx(1024 / SAMPLE_RATE)
+    assert tuner.latency["analysis"].count == len(readings) - 3
+
+
+def test_tuner_process_does_not_allocate_arrays(tone):
+    settings = PitchSettings(SAMPLE_RATE, frame_length=2048, hop_length=2048)
+    tuner = Tuner(settings, A4_FREQUENCY)
+    samples = tone(440.0, 0.5)
+    hops = [samples[i : i + 2048].copy() for i in range(0, 4 * 2048, 2048)]
+    for hop in hops[:3]:
+        tuner.process(hop)
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        tuner.process(hops[3])
+        peak = tracemalloc.get_traced_memory()[1] - start
+    finally:
+        tracemalloc.stop()
+    assert peak < 8 * 1024  # a single frame of float64 is 16 KB
+
+
+def test_tuner_unvoiced_reading():
+    tuner = Tuner(PitchSettings(SAMPLE_RATE, frame_length=1024, hop_length=256), A4_FREQUENCY)
+    reading = tuner.process(np.zeros(1024))
+    assert reading is not None
+    assert reading.note is None
+    assert math.isnan(reading.frequency) and math.isnan(reading.cents)
+    assert str(reading) == "0.064\t-"
+
+
+def test_tuner_run_source_ending_on_a_hop(tone):
+    tuner = Tuner(PitchSettings(SAMPLE_RATE, frame_length=1024, hop_length=256), A4_FREQUENCY)
+    readings = list(tuner.run(_pcm_reader(tone(440.0, 8 * 256 / SAMPLE_RATE)), 2))
+    assert len(readings) == 8 - 3
+    assert all(reading.note.name == "A4" for reading in readings)
+
+
+def test_tuner_run_tar_string_fret_by_fret(tone):
+    base_note = Note.from_name("C3", A4_FREQUENCY)
+    frets = tar_string(base_note, 27)
+    fret_duration = 0.25
+    samples = np.concatenate([tone(note.frequency.value, fret_duration) for note in frets.values()])
+    settings = PitchSettings(SAMPLE_RATE, frame_length=1024, hop_length=256)
+    tuner = Tuner(settings, A4_FREQUENCY)
+    readings = list(tuner.run(_pcm_reader(samples), sample_width=2))
+    for fret_index, note in enumerate(frets.values()):
+        # readings of frames entirely within the fret
+        fret_readings = [
+            reading
+            for reading in readings
+            if fret_index * fret_duration + 1024 / SAMPLE_RATE
+            <= reading.time
+            <= (fret_index + 1) * fret_duration
+        ]
+        assert fret_readings
+        assert all(reading.note == note for reading in fret_readings)
+        assert all(abs(reading.cents) < 5 for reading in fret_readings)
+    for stage in STAGES:
+        assert tuner.latency[stage].count > 0
+    assert tuner.latency["read"].count == math.ceil(len(samples) / 256)
+
+
+def test_tuner_run_wav_file(tone, write_wav):
+    stereo = np.stack([tone(220.0, 0.3), tone(220.0, 0.3)], axis=1)
+    file_path = write_wav(stereo, SAMPLE_RATE)
+    settings = PitchSettings(SAMPLE_RATE, frame_length=1024, hop_length=512)
+    tuner = Tuner(settings, A4_FREQUENCY)
+    with wave.open(file_path, "rb") as wav_file:
+        readings = list(tuner.run(wav_file.readframes, 2, channel_count=2))
+    assert len(readings) == (len(stereo) - 1024) // 512 + 2
+    assert all(reading.note is not None and reading.note.name == "A3" for reading in readings)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
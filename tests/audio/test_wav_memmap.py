@@ -0,0 +1,252 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import os
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+from audio import wav_memmap
+from audio.wav_memmap import WavAppender, memmap_wav
+from audio.wav_reader import read_wav_chunks, wav_info
+
+SAMPLE_RATE = 8000
+PCM_FMT = struct.pack("<HHIIHH", 1, 1, SAMPLE_RATE, 2 * SAMPLE_RATE, 2, 16)
+SUBFORMAT_GUID_SUFFIX = bytes.fromhex("000000001000800000aa00389b71")
+
+
+def _stereo(frame_count: int) -> np.ndarray:
+    time = np.arange(frame_count) / SAMPLE_RATE
+    return np.stack([np.sin(2 * np.pi * 440 * time), np.cos(2 * np.pi * 220 * time)], axis=1) / 2
+
+
+def test_memmap_wav_samples_are_views(write_wav):
+    samples = _stereo(1000)
+    wav = memmap_wav(write_wav(samples, SAMPLE_RATE))
+    assert wav.info == wav_info(write_wav(samples, SAMPLE_RATE, "copy.wav"))
+    assert isinstance(wav.samples, np.memmap)
+    assert wav.samples.shape == (1000, 2)
+    right = wav.channel(1)
+    assert np.shares_memory(right, wav.samples)
+    assert right.strides == (4,)
+    np.testing.assert_allclose(right / 32768, samples[:, 1], atol=1 / 32768)
+    with pytest.raises(ValueError):
+        wav.samples[0, 0] = 0  # read-only
+    with pytest.raises(ValueError):
+        wav.channel(2)
+
+
+@pytest.mark.parametrize("chunk_frames", [1, 300, 5000])
+def test_memmap_wav_chunks(write_wav, chunk_frames: int):
+    file_path = write_wav(_stereo(1000), SAMPLE_RATE)
+    chunks = list(memmap_wav(file_path).chunks(chunk_frames))
+    expected = list(read_wav_chunks(file_path, chunk_frames))
+    assert len(chunks) == len(expected)
+    np.testing.assert_array_equal(np.concatenate(chunks), np.concatenate(expected))
+
+
+def test_memmap_wav_to_float(write_wav):
+    samples = _stereo(1000)
+    wav = memmap_wav(write_wav(samples, SAMPLE_RATE))
+    np.testing.assert_allclose(wav.to_float(100, 200), samples[100:200], atol=1 / 32768)
+
+
+def test_memmap_wav_in_place(write_wav):
+    file_path = write_wav(_stereo(100), SAMPLE_RATE)
+    wav = memmap_wav(file_path, "r+")
+    wav.samples[:, 0] = 0
+    wav.samples.flush()
+    del wav
+    with wave.open(file_path, "rb") as wav_file:
+        pcm = np.frombuffer(wav_file.readframes(100), dtype="<i2").reshape(-1, 2)
+    assert not np.any(pcm[:, 0])
+    assert np.any(pcm[:, 1])
+
+
+def _chunk(chunk_id: bytes, data: bytes) -> bytes:
+    return chunk_id + struct.pack("<I", len(data)) + data + b"\0" * (len(data) % 2)
+
+
+def _write_riff(file_path: str, chunks: bytes):
+    with open(file_path, "wb") as wav_file:
+        wav_file.write(b"RIFF" + struct.pack("<I", 4 + len(chunks)) + b"WAVE" + chunks)
+
+
+def test_memmap_wav_empty_file(write_wav):
+    wav = memmap_wav(write_wav(np.zeros((0, 2)), SAMPLE_RATE))
+    assert wav.samples.shape == (0, 2)
+    assert not list(wav.chunks())
+
+
+def test_memmap_wav_skips_other_chunks(tmp_path: str):
+    file_path = os.path.join(tmp_path, "list.wav")
+    pcm = np.arange(-5, 5, dtype="<i2").tobytes()
+    # the LIST chunk is of odd size, so padded
+    _write_riff(
+        file_path, _chunk(b"LIST", b"abc") + _chunk(b"fmt ", PCM_FMT) + _chunk(b"data", pcm)
+    )
+    np.testing.assert_array_equal(memmap_wav(file_path).channel(0), np.arange(-5, 5))
+
+
+def _write_extensible(file_path: str, subformat_tag: int, pcm: bytes):
+    guid = struct.pack("<H", subformat_tag) + SUBFORMAT_GUID_SUFFIX
+    fmt = struct.pack("<HHIIHHHHI", 0xFFFE, 1, SAMPLE_RATE, 4 * SAMPLE_RATE, 4, 32, 22, 32, 4)
+    _write_riff(file_path, _chunk(b"fmt ", fmt + guid) + _chunk(b"data", pcm))
+
+
+def test_memmap_wav_extensible(tmp_path: str):
+    pcm_path = os.path.join(tmp_path, "pcm.wav")
+    _write_extensible(pcm_path, 1, np.arange(-5, 5, dtype="<i4").tobytes())
+    np.testing.assert_array_equal(memmap_wav(pcm_path).channel(0), np.arange(-5, 5))
+    float_path = os.path.join(tmp_path, "float.wav")
+    _write_extensible(float_path, 3, np.linspace(-1, 1, 10, dtype="<f4").tobytes())
+    with pytest.raises(ValueError, match="0x3"):
+        memmap_wav(float_path)
+
+
+def test_memmap_wav_unsupported(tmp_path: str):
+    file_path = os.path.join(tmp_path, "24bit.wav")
+    with WavAppender(file_path, SAMPLE_RATE, sample_width=3) as appender:
+        appender.append(np.zeros(10))
+    with pytest.raises(ValueError):
+        memmap_wav(file_path)
+    not_wav_path = os.path.join(tmp_path, "not.wav")
+    with open(not_wav_path, "wb") as not_wav_file:
+        not_wav_file.write(b"\0" * 64)
+    with pytest.raises(ValueError):
+        memmap_wav(not_wav_path)
+
+
+@pytest.mark.parametrize(
+    "chunks, message",
+    [
+        (_chunk(b"fmt ", PCM_FMT[:8]) + _chunk(b"data", b""), "Truncated fmt"),
+        (_chunk(b"fmt ", b"\xfe\xff" + PCM_FMT[2:] + b"\0\0") + _chunk(b"data", b""), "extensible"),
+        (
+            _chunk(b"fmt ", b"\xfe\xff" + PCM_FMT[2:] + bytes(8) + b"\1\0" + bytes(14))
+            + _chunk(b"data", b""),
+            "SubFormat",
+        ),
+        (_chunk(b"fmt ", PCM_FMT), "No data chunk"),
+        (_chunk(b"data", bytes(4)), "No fmt chunk"),
+        (_chunk(b"fmt ", PCM_FMT[:12] + b"\3\0" + PCM_FMT[14:]) + _chunk(b"data", b""), "align"),
+    ],
+)
+def test_memmap_wav_invalid_layout(tmp_path: str, chunks: bytes, message: str):
+    file_path = os.path.join(tmp_path, "invalid.wav")
+    _write_riff(file_path, chunks)
+    with pytest.raises(ValueError, match=message):
+        memmap_wav(file_path)
+
+
+def test_memmap_wav_invalid_arguments(write_wav):
+    file_path = write_wav(np.zeros(10), SAMPLE_RATE)
+    with pytest.raises(ValueError):
+        memmap_wav(file_path, "w+")  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        next(memmap_wav(file_path).chunks(0))
+
+
+@pytest.mark.parametrize("sample_width", [1, 2, 3, 4])
+def test_wav_appender(tmp_path: str, sample_width: int):
+    file_path = os.path.join(tmp_path, "out.wav")
+    samples = _stereo(1000)
+    with WavAppender(file_path, SAMPLE_RATE, 2, sample_width) as appender:
+        for start in range(0, 1000, 300):
+            appender.append(samples[start : start + 300])
+            # the file is valid after every append
+            assert wav_info(file_path).frame_count == appender.frame_count
+    with wave.open(file_path, "rb") as wav_file:
+        assert wav_file.getsampwidth() == sample_width
+        assert wav_file.getnframes() == 1000
+    mono = np.concatenate(list(read_wav_chunks(file_path)))
+    np.testing.assert_allclose(mono, samples.mean(axis=1), atol=2 / 2 ** (8 * sample_width - 1))
+
+
+def test_wav_appender_resumes(tmp_path: str):
+    file_path = os.path.join(tmp_path, "out.wav")
+    with WavAppender(file_path, SAMPLE_RATE) as appender:
+        appender.append(np.full(100, 0.25))
+    with WavAppender(file_path, SAMPLE_RATE) as appender:
+        assert appender.frame_count == 100
+        appender.append(np.full(50, -0.25))
+    channel = memmap_wav(file_path).channel(0)
+    np.testing.assert_array_equal(channel, [8192] * 100 + [-8192] * 50)
+
+
+def test_wav_appender_resumes_interrupted_write(tmp_path: str):
+    file_path = os.path.join(tmp_path, "out.wav")
+    with WavAppender(file_path, SAMPLE_RATE) as appender:
+        appender.append(np.zeros(100))
+    with open(file_path, "ab") as wav_file:
+        wav_file.write(b"\1\0" * 10 + b"\1")  # samples written, but not yet the header
+    with WavAppender(file_path, SAMPLE_RATE) as appender:
+        assert appender.frame_count == 110
+        appender.append(np.zeros(10))
+    assert wav_info(file_path).frame_count == 120
+    assert os.path.getsize(file_path) == 44 + 240
+
+
+def test_wav_appender_resumes_interrupted_write_over_the_pad_byte(tmp_path: str):
+    file_path = os.path.join(tmp_path, "out.wav")
+    with WavAppender(file_path, SAMPLE_RATE, sample_width=3) as appender:
+        appender.append(np.zeros(1))  # 3 bytes, and a pad byte
+    with open(file_path, "r+b") as wav_file:
+        wav_file.seek(44 + 3)
+        wav_file.write(b"\0\0\1")  # a sample over the pad byte, but not yet the header
+    with WavAppender(file_path, SAMPLE_RATE, sample_width=3) as appender:
+        assert appender.frame_count == 2
+
+
+def test_wav_appender_to_file_with_chunks_after_data(tmp_path: str):
+    file_path = os.path.join(tmp_path, "list.wav")
+    _write_riff(
+        file_path, _chunk(b"fmt ", PCM_FMT) + _chunk(b"data", bytes(4)) + _chunk(b"LIST", b"a")
+    )
+    assert memmap_wav(file_path).info.frame_count == 2
+    with pytest.raises(ValueError, match="chunks after"):
+        WavAppender(file_path, SAMPLE_RATE)
+
+
+def test_wav_appender_size_limit(tmp_path: str, monkeypatch):
+    monkeypatch.setattr(wav_memmap, "_MAX_CHUNK_SIZE", 44 + 2 * 28 - 8)
+    with WavAppender(os.path.join(tmp_path, "out.wav"), SAMPLE_RATE) as appender:
+        appender.append(np.zeros(28))
+        with pytest.raises(ValueError, match="4 GiB"):
+            appender.append(np.zeros(1))
+
+
+@pytest.mark.parametrize("frame_counts", [[7], [7, 7], [7, 4], [1, 1, 1]])
+def test_wav_appender_pads_odd_data_chunks(tmp_path: str, frame_counts):
+    file_path = os.path.join(tmp_path, "out.wav")
+    for frame_count in frame_counts:  # one appender per block: resumes from the padded file
+        with WavAppender(file_path, SAMPLE_RATE, sample_width=1) as appender:
+            appender.append(np.full(frame_count, 0.5))
+    total = sum(frame_counts)
+    assert os.path.getsize(file_path) == 44 + total + total % 2
+    with open(file_path, "rb") as wav_file:
+        riff_size = struct.unpack("<4sI", wav_file.read(8))[1]
+    assert riff_size == os.path.getsize(file_path) - 8
+    with wave.open(file_path, "rb") as wav_file:
+        assert wav_file.getnframes() == total
+    assert memmap_wav(file_path).samples.shape == (total, 1)
+    with WavAppender(file_path, SAMPLE_RATE, sample_width=1) as appender:
+        assert appender.frame_count == total
+
+
+def test_wav_appender_invalid(tmp_path: str, write_wav):
+    file_path = write_wav(np.zeros(10), SAMPLE_RATE)
+    with pytest.raises(ValueError):
+        WavAppender(file_path, SAMPLE_RATE, channel_count=2)
+    with pytest.raises(ValueError):
+        WavAppender(file_path, 2 * SAMPLE_RATE)
+    with pytest.raises(ValueError):
+        WavAppender(os.path.join(tmp_path, "out.wav"), SAMPLE_RATE, sample_width=5)
+    with WavAppender(file_path, SAMPLE_RATE) as appender:
+        with pytest.raises(ValueError):
+            appender.append(np.zeros((10, 2)))
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
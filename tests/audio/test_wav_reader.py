@@ -0,0 +1,77 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import os
+import wave
+
+import numpy as np
+import pytest
+
+from audio.wav_reader import pcm_to_float, read_wav_chunks, wav_info
+
+
+def test_wav_info(write_wav):
+    file_path = write_wav(np.zeros((1000, 2)), 8000)
+    info = wav_info(file_path)
+    assert (info.sample_rate, info.channel_count, info.sample_width) == (8000, 2, 2)
+    assert info.frame_count == 1000
+    assert info.duration == 0.125
+
+
+@pytest.mark.parametrize("chunk_frames", [1, 7, 100, 1000, 5000])
+def test_read_wav_chunks(write_wav, chunk_frames: int):
+    samples = np.sin(np.linspace(0, 20, 1000)) / 2
+    file_path = write_wav(samples, 8000)
+    chunks = list(read_wav_chunks(file_path, chunk_frames))
+    assert all(len(chunk) == chunk_frames for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= chunk_frames
+    np.testing.assert_allclose(np.concatenate(chunks), samples, atol=1 / 32768)
+
+
+def test_read_wav_chunks_mixes_down_to_mono(write_wav):
+    left = np.full(100, 0.5)
+    file_path = write_wav(np.stack([left, -left / 2], axis=1), 8000)
+    mono = np.concatenate(list(read_wav_chunks(file_path)))
+    np.testing.assert_allclose(mono, 0.125, atol=1 / 32768)
+
+
+def test_read_wav_chunks_empty_file(write_wav):
+    file_path = write_wav(np.zeros(0), 8000)
+    assert not list(read_wav_chunks(file_path))
+
+
+def test_read_wav_chunks_invalid_chunk_size(write_wav):
+    file_path = write_wav(np.zeros(10), 8000)
+    with pytest.raises(ValueError):
+        next(read_wav_chunks(file_path, 0))
+
+
+@pytest.mark.parametrize(
+    "sample_width, data, expected",
+    [
+        (1, bytes([0, 128, 192]), [-1.0, 0.0, 0.5]),
+        (2, np.array([-32768, 0, 16384], dtype="<i2").tobytes(), [-1.0, 0.0, 0.5]),
+        (3, bytes([0, 0, 0x80, 0, 0, 0, 0, 0, 0x40]), [-1.0, 0.0, 0.5]),
+        (4, np.array([-(2**31), 0, 2**30], dtype="<i4").tobytes(), [-1.0, 0.0, 0.5]),
+    ],
+)
+def test_pcm_to_float(sample_width: int, data: bytes, expected: list):
+    np.testing.assert_allclose(pcm_to_float(data, sample_width, 1)[:, 0], expected)
+
+
+def test_pcm_to_float_unsupported_width():
+    with pytest.raises(ValueError):
+        pcm_to_float(bytes(5), 5, 1)
+
+
+def test_read_wav_chunks_24_bit(tmp_path: str):
+    file_path = os.path.join(tmp_path, "audio.wav")
+    with wave.Wave_write(file_path) as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(3)
+        wav_file.setframerate(8000)
+        wav_file.writeframes(bytes([0, 0, 0x40, 0, 0, 0xC0]))
+    np.testing.assert_allclose(next(read_wav_chunks(file_path)), [0.5, -0.5])
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,59 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import os
+
+import numpy as np
+import pytest
+
+from audio.wav_reader import pcm_to_float, read_wav_chunks, wav_info
+from audio.wav_writer import WavWriter, float_to_pcm
+
+
+@pytest.mark.parametrize("sample_width", [1, 2, 3, 4])
+def test_float_to_pcm_round_trip(sample_width: int):
+    samples = np.array([[-1.0], [-0.5], [0.0], [0.25], [0.999]])
+    data = float_to_pcm(samples, sample_width)
+    assert len(data) == len(samples) * sample_width
+    tolerance = 4.0 / 2 ** (8 * sample_width)
+    np.testing.assert_allclose(pcm_to_float(data, sample_width, 1), samples, atol=tolerance)
+
+
+def test_float_to_pcm_clips():
+    data = float_to_pcm(np.array([-2.0, 2.0]), 2)
+    np.testing.assert_array_equal(np.frombuffer(data, dtype="<i2"), [-32767, 32767])
+
+
+def test_float_to_pcm_unsupported_width():
+    with pytest.raises(ValueError):
+        float_to_pcm(np.zeros(1), 5)
+
+
+def test_wav_writer_blocks(tmp_path: str):
+    file_path = os.path.join(tmp_path, "out.wav")
+    signal = np.sin(np.linspace(0, 100, 10000)) / 2
+    with WavWriter(file_path, 8000) as writer:
+        for start in range(0, len(signal), 3000):
+            writer.write(signal[start : start + 3000])
+        assert writer.frame_count == len(signal)
+    info = wav_info(file_path)
+    assert (info.sample_rate, info.channel_count, info.frame_count) == (8000, 1, len(signal))
+    np.testing.assert_allclose(np.concatenate(list(read_wav_chunks(file_path))), signal, atol=1e-4)
+
+
+def test_wav_writer_stereo(tmp_path: str):
+    file_path = os.path.join(tmp_path, "out.wav")
+    with WavWriter(file_path, 8000, channel_count=2, sample_width=3) as writer:
+        writer.write(np.tile([0.5, -0.5], (100, 1)))
+        with pytest.raises(ValueError):
+            writer.write(np.zeros(10))
+    info = wav_info(file_path)
+    assert (info.channel_count, info.sample_width, info.frame_count) == (2, 3, 100)
+
+
+def test_wav_writer_unsupported_width(tmp_path: str):
+    with pytest.raises(ValueError):
+        WavWriter(os.path.join(tmp_path, "out.wav"), 8000, sample_width=5)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -2,10 +2,55 @@
 
 With the entry points we execute with -m and things are OK.
 But pytest fails at adding the root to python path, so we enforce it via this file.
+
+Tests run with the strict validation policy (see core.validation), unless set otherwise.
 """
 
 import os
 import sys
+import wave
+from typing import Sequence, Union
+
+import numpy as np
+import pytest
 
 project_root_path = os.path.dirname(os.path.dirname(__file__))
 sys.path.insert(0, project_root_path)
+os.environ.setdefault("MUSIC_VALIDATION_POLICY", "strict")
+
+
+@pytest.fixture(name="write_wav")
+def fixture_write_wav(tmp_path):
+    """Return a function that writes (samples x channels) floats in [-1, 1] to a 16-bit WAV file"""
+
+    def _write_wav(samples: np.ndarray, sample_rate: int, file_name: str = "audio.wav") -> str:
+        file_path = os.path.join(tmp_path, file_name)
+        samples = np.asarray(samples)
+        samples = samples[:, np.newaxis] if samples.ndim == 1 else samples
+        pcm = np.round(np.clip(samples, -1.0, 1.0 - 1 / 32768) * 32768).astype("<i2")
+        with wave.Wave_write(file_path) as wav_file:
+            wav_file.setnchannels(samples.shape[1])
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(pcm.tobytes())
+        return file_path
+
+    return _write_wav
+
+
+@pytest.fixture(name="tone")
+def fixture_tone():
+    """Return a function that generates the sum of sines of one or more frequencies (Hz), e.g. a
+    chord, or partials with one amplitude each. By default: amplitude 0.5, sampled at 16 kHz."""
+
+    def _tone(
+        frequencies: Union[float, Sequence[float]],
+        duration: float = 0.5,
+        sample_rate: int = 16000,
+        amplitude: Union[float, Sequence[float]] = 0.5,
+    ) -> np.ndarray:
+        time = np.arange(int(duration * sample_rate)) / sample_rate
+        phases = 2 * np.pi * np.multiply.outer(np.atleast_1d(frequencies), time)
+        return np.sum(np.atleast_1d(amplitude)[:, np.newaxis] * np.sin(phases), axis=0)
+
+    return _tone
@@ -76,5 +76,13 @@ def test_accidental_note_enum():
     assert sharp.frequency_ratio == MusicalInterval.SEMITONE.value
 
 
+def test_accidental_frozen_hashable():
+    sharp = AccidentalNote.SHARP.value
+    with pytest.raises(AttributeError):
+        sharp.name = "flat"  # type: ignore[misc]
+    assert not hasattr(sharp, "__dict__")
+    assert len({sharp, Accidental.from_symbol("#"), Accidental.from_symbol("b")}) == 2
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__]))
@@ -55,5 +55,14 @@ def test_frequency_mul():
     assert freq1.__mul__(freq2) is NotImplemented
 
 
+def test_frequency_frozen_not_hashable():
+    freq = Frequency(50.0)
+    with pytest.raises(AttributeError):
+        freq.value = 60.0  # type: ignore[misc]
+    assert not hasattr(freq, "__dict__")
+    with pytest.raises(TypeError):
+        hash(freq)
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__]))
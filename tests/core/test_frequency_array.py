@@ -0,0 +1,93 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+from typing import Any
+
+import numpy as np
+import pytest
+
+from core.frequency import Frequency
+from core.frequency_array import FrequencyArray
+
+
+def test_frequency_array_creation():
+    frequencies = FrequencyArray([110.0, 220.0, 440.0])
+    assert len(frequencies) == 3
+    assert frequencies.shape == (3,)
+    assert frequencies.values.dtype == np.float64
+    assert repr(frequencies) == "FrequencyArray([110.0, 220.0, 440.0] Hz)"
+
+
+@pytest.mark.parametrize("values", [[1.0, 0.0], [-1.0], [np.nan, 1.0]])
+def test_frequency_array_creation_fail(values: Any):
+    with pytest.raises(ValueError):
+        FrequencyArray(values)
+
+
+def test_frequency_array_conversion():
+    frequencies = [Frequency(110.0), Frequency(220.0)]
+    frequency_array = FrequencyArray.from_frequencies(frequencies)
+    assert frequency_array.to_frequencies() == frequencies
+    assert frequency_array[1] == Frequency(220.0)
+    assert isinstance(frequency_array[:1], FrequencyArray)
+    np.testing.assert_array_equal(np.asarray(frequency_array), [110.0, 220.0])
+
+
+def test_frequency_array_arithmetic_returns_arrays():
+    frequencies = FrequencyArray([100.0, 200.0])
+    for result in [
+        frequencies + 1.0,
+        frequencies * 2,
+        frequencies - Frequency(50.0),
+        Frequency(50.0) + frequencies,
+        frequencies / frequencies,
+        np.log2(frequencies),
+    ]:
+        assert type(result) is np.ndarray  # pylint: disable=unidiomatic-typecheck
+    np.testing.assert_allclose(frequencies + Frequency(1.0), [101.0, 201.0])
+    np.testing.assert_allclose(frequencies - 150.0, [-50.0, 50.0])
+    np.testing.assert_allclose(2 * frequencies, [200.0, 400.0])
+
+
+def test_frequency_array_ufunc_out():
+    frequencies = FrequencyArray([100.0, 200.0])
+    out = np.empty(2)
+    np.multiply(frequencies, 3, out=out)
+    np.testing.assert_allclose(out, [300.0, 600.0])
+
+
+def test_frequency_array_equality_with_tolerance():
+    frequencies = FrequencyArray([50.0, 50.000000001, 50.1])
+    np.testing.assert_array_equal(frequencies == 50.0, [True, True, False])
+    np.testing.assert_array_equal(frequencies != Frequency(50.0), [False, False, True])
+    np.testing.assert_array_equal(Frequency(50.0) == frequencies, [True, True, False])
+    np.testing.assert_array_equal(frequencies == FrequencyArray([50.0] * 3), [True, True, False])
+
+
+def test_frequency_array_ordering():
+    frequencies = FrequencyArray([49.9, 50.000000001, 50.1])
+    np.testing.assert_array_equal(frequencies < 50.0, [True, False, False])
+    np.testing.assert_array_equal(frequencies <= 50.0, [True, True, False])
+    np.testing.assert_array_equal(frequencies > Frequency(50.0), [False, True, True])
+    np.testing.assert_array_equal(frequencies >= Frequency(50.0), [False, True, True])
+
+
+def test_frequency_array_matches_scalar_frequency():
+    values = [27.5, 261.6255653005986, 440.0, 4186.009044809578]
+    frequencies = [Frequency(value) for value in values]
+    frequency_array = FrequencyArray(values)
+    for other in [Frequency(440.0), Frequency(261.6255653)]:
+        np.testing.assert_array_equal(
+            frequency_array == other, [frequency == other for frequency in frequencies]
+        )
+        np.testing.assert_array_equal(
+            frequency_array <= other, [frequency <= other for frequency in frequencies]
+        )
+
+
+def test_frequency_array_not_hashable():
+    with pytest.raises(TypeError):
+        hash(FrequencyArray([1.0]))
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,103 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import itertools
+
+import numpy as np
+import pytest
+
+from core.frequency import Frequency
+from core.harmonics import (
+    OUT_OF_RANGE,
+    find_collisions,
+    harmonic_series,
+    nearest_notes,
+)
+from core.notes import Note
+from core.tuning import tuning_table
+from instruments.tar_instrument import tar_string
+
+A4_FREQUENCY = Frequency(440)
+
+
+def _brute_force_collisions(partials: np.ndarray, tolerance_cents: float):
+    pitches = 1200 * np.log2(partials.ravel())
+    notes = np.repeat(np.arange(partials.shape[0]), partials.shape[1])
+    return {
+        (first, second)
+        for first, second in itertools.combinations(range(len(pitches)), 2)
+        if notes[first] != notes[second]
+        and abs(pitches[second] - pitches[first]) <= tolerance_cents
+    }
+
+
+def test_harmonic_series():
+    partials = harmonic_series([100.0, 150.0], 4)
+    np.testing.assert_array_equal(partials, [[100, 200, 300, 400], [150, 300, 450, 600]])
+
+
+def test_harmonic_series_of_notes():
+    string = tar_string(Note.from_name("C4", A4_FREQUENCY), 27)
+    partials = harmonic_series(string.values(), 6)
+    assert partials.shape == (28, 6)
+    np.testing.assert_allclose(partials[0], 261.6255653 * np.arange(1, 7))
+    np.testing.assert_array_equal(partials, harmonic_series(list(string.values()), 6))
+
+
+def test_harmonic_series_of_iterables():
+    np.testing.assert_array_equal(harmonic_series(iter([100.0]), 2), [[100, 200]])
+    assert harmonic_series({}.values(), 3).shape == (0, 3)
+
+
+@pytest.mark.parametrize("fundamentals, partial_count", [([100.0], 0), ([0.0], 4), ([[1.0]], 4)])
+def test_harmonic_series_invalid(fundamentals, partial_count: int):
+    with pytest.raises(ValueError):
+        harmonic_series(fundamentals, partial_count)
+
+
+def test_nearest_notes():
+    table = tuning_table(A4_FREQUENCY)
+    partials = harmonic_series([table["C4"]], 5)
+    steps, cents = nearest_notes(partials, table)
+    assert [table.frequency(step) for step in steps[0]] == [
+        Frequency(table[name]) for name in ["C4", "C5", "G5", "C6", "E6"]
+    ]
+    # the just fifth and major third are 2 cents sharp and 14 cents flat of equal temperament
+    np.testing.assert_allclose(cents[0], [0, 0, 1.955, 0, -13.686], atol=1e-3)
+
+
+def test_nearest_notes_out_of_range():
+    table = tuning_table(A4_FREQUENCY)
+    steps, cents = nearest_notes(np.array([1.0, 440.0, 1e6]), table)
+    assert steps.tolist() == [OUT_OF_RANGE, 138, OUT_OF_RANGE]
+    assert np.isnan(cents[[0, 2]]).all()
+
+
+@pytest.mark.parametrize("tolerance_cents", [0.0, 2.0, 5.0, 30.0])
+def test_find_collisions_matches_brute_force(tolerance_cents: float):
+    string = tar_string(Note.from_name("C4", A4_FREQUENCY), 27)
+    partials = harmonic_series(string.values(), 6)
+    collisions = find_collisions(partials, tolerance_cents)
+    flat = collisions.note_indices * partials.shape[1] + collisions.partial_numbers - 1
+    assert {tuple(sorted(pair)) for pair in flat.tolist()} == _brute_force_collisions(
+        partials, tolerance_cents
+    )
+    assert len(collisions) == len(_brute_force_collisions(partials, tolerance_cents))
+    assert np.all((collisions.cents >= 0) & (collisions.cents <= tolerance_cents))
+
+
+def test_find_collisions_octave():
+    collisions = find_collisions(harmonic_series([100.0, 201.0, 350.0], 2), tolerance_cents=10.0)
+    assert collisions.note_indices.tolist() == [[0, 1]]
+    assert collisions.partial_numbers.tolist() == [[2, 1]]
+    np.testing.assert_allclose(collisions.cents, 1200 * np.log2(201 / 200))
+
+
+def test_find_collisions_invalid():
+    with pytest.raises(ValueError):
+        find_collisions(np.ones((2, 2)), -1.0)
+    with pytest.raises(ValueError):
+        find_collisions(np.ones(4), 1.0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
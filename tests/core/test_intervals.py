@@ -2,8 +2,10 @@
 # pylint: disable=missing-function-docstring
 from math import isclose
 
+import numpy as np
 import pytest
 
+from core.intervals import cents
 from core.notes import MusicalInterval
 
 
@@ -21,5 +23,11 @@ def test_musical_interval_as_quartertone_steps():
     assert MusicalInterval.as_quartertone_steps(MusicalInterval.QUARTERTONE) == 1
 
 
+def test_cents():
+    assert cents(880, 440) == pytest.approx(1200)
+    assert cents(440, 440 * MusicalInterval.QUARTERTONE.value) == pytest.approx(-50)
+    assert np.allclose(cents([440, 220], [220, 440]), [1200, -1200])
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__]))
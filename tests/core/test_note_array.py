@@ -0,0 +1,125 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+from typing import Any
+
+import numpy as np
+import pytest
+
+from core.frequency import Frequency
+from core.note_array import NoteArray
+from core.notes import Note, frequency_to_note, standard_notes
+from core.octaves import Octave
+
+A4_FREQUENCY = Frequency(440)
+
+
+def test_note_array_from_names():
+    names = ["A4", "C4", "Dk4", "A4", "Bs9", "C-1"]
+    notes = NoteArray.from_names(names, A4_FREQUENCY)
+    assert len(notes) == len(names)
+    assert notes.names == names
+    for name, frequency in zip(names, notes.frequency):
+        assert Note.from_name(name, A4_FREQUENCY) == float(frequency)
+
+
+def test_note_array_from_names_standardizes():
+    notes = NoteArray.from_names(["Eb4", "B#3", "Fk2"], A4_FREQUENCY)
+    assert notes.names == ["D#4", "C4", "Es2"]
+
+
+@pytest.mark.parametrize("name", ["H2", "G#10", "D##4"])
+def test_note_array_from_names_invalid(name: str):
+    with pytest.raises(ValueError):
+        NoteArray.from_names(["A4", name], A4_FREQUENCY)
+
+
+@pytest.mark.parametrize("a4_frequency", [Frequency(100), Frequency(440)])
+def test_note_array_from_frequencies(a4_frequency: Frequency):
+    notes = standard_notes("quartertone", Octave.from_number(3), a4_frequency)
+    frequencies = np.array([note.frequency.value for note in notes]) * 1.005
+    actual = NoteArray.from_frequencies(frequencies, a4_frequency)
+    expected = [frequency_to_note(Frequency(f), a4_frequency) for f in frequencies]
+    assert actual.names == [note.name for note in expected]
+
+
+def test_note_array_from_frequencies_invalid():
+    with pytest.raises(ValueError):
+        NoteArray.from_frequencies([440.0, 0.0], A4_FREQUENCY)
+
+
+def test_note_array_notes_round_trip():
+    notes = standard_notes("quartertone", Octave.from_number(4), A4_FREQUENCY)
+    actual = NoteArray.from_notes(notes).to_notes()
+    assert actual == notes
+
+
+def test_note_array_from_notes_invalid():
+    with pytest.raises(ValueError):
+        NoteArray.from_notes([])
+    with pytest.raises(ValueError):
+        NoteArray.from_notes(
+            [Note.from_name("A4", A4_FREQUENCY), Note.from_name("A4", Frequency(415))]
+        )
+
+
+@pytest.mark.parametrize(
+    "steps, expected_names",
+    [
+        (1, ["As4", "Cs5", "Dk-1"]),
+        (-1, ["Ak4", "Bs4", "Cs-1"]),
+        (24, ["A5", "C6", "C#0"]),
+        (np.array([2, -2, 0]), ["A#4", "B4", "C#-1"]),
+    ],
+)
+def test_note_array_transpose(steps: Any, expected_names: list):
+    notes = NoteArray.from_names(["A4", "C5", "C#-1"], A4_FREQUENCY)
+    assert notes.transpose(steps).names == expected_names
+
+
+def test_note_array_transpose_out_of_range():
+    notes = NoteArray.from_names(["C-1"], A4_FREQUENCY)
+    with pytest.raises(ValueError):
+        notes.transpose(-1)
+
+
+def test_note_array_comparison():
+    notes = NoteArray.from_names(["C4", "A4", "B4"], A4_FREQUENCY)
+    others = NoteArray.from_names(["B#3", "Ak4", "C5"], A4_FREQUENCY)
+    assert (notes == others).tolist() == [True, False, False]
+    assert (notes != others).tolist() == [False, True, True]
+    assert (notes < others).tolist() == [False, False, True]
+    assert (notes >= others).tolist() == [True, True, False]
+    assert (notes > Note.from_name("A4", A4_FREQUENCY)).tolist() == [False, False, True]
+    assert (notes <= Note.from_name("A4", A4_FREQUENCY)).tolist() == [True, True, False]
+
+
+def test_note_array_comparison_invalid():
+    notes = NoteArray.from_names(["C4"], A4_FREQUENCY)
+    with pytest.raises(ValueError):
+        _ = notes == NoteArray.from_names(["C4"], Frequency(415))
+    with pytest.raises(ValueError):
+        _ = notes < Note.from_name("C4", Frequency(432))
+    with pytest.raises(NotImplementedError):
+        _ = notes == 440.0
+
+
+@pytest.mark.parametrize("index, octave", [([0, 1], [4]), ([[0]], [[4]]), ([24], [4]), ([0], [11])])
+def test_note_array_invalid(index: list, octave: list):
+    with pytest.raises(ValueError):
+        NoteArray(np.array(index), np.array(octave), A4_FREQUENCY)
+
+
+def test_note_array_repr_and_steps_from_a4():
+    notes = NoteArray.from_names(["G4", "A4", "Ak4"], A4_FREQUENCY)
+    assert repr(notes) == "NoteArray(3 notes, A4: 440 Hz)"
+    assert notes.steps_from_a4.tolist() == [-4, 0, -1]
+
+
+def test_note_array_getitem():
+    notes = NoteArray.from_names(["C4", "A4", "B4"], A4_FREQUENCY)
+    assert notes[1].names == ["A4"]
+    assert notes[notes.frequency > 400].names == ["A4", "B4"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,64 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import numpy as np
+import pytest
+
+from core.frequency import Frequency
+from core.intervals import cents
+from core.note_index import NoteSearchIndex
+from core.notes import Note, frequency_to_note, standard_notes
+from core.octaves import Octave
+from instruments.piano_instrument import generate_piano_keys
+from instruments.tar_instrument import tar_string
+
+A4_FREQUENCY = Frequency(440)
+
+
+def test_note_search_index_matches_quartertone_grid():
+    notes = [
+        note
+        for octave in range(1, 7)
+        for note in standard_notes("quartertone", Octave.from_number(octave), A4_FREQUENCY)
+    ]
+    index = NoteSearchIndex(notes[::-1])
+    frequencies = np.geomspace(70, 2000, 1000)
+    actual, deviations = index.nearest_notes(frequencies)
+    for frequency, note, deviation in zip(frequencies, actual, deviations):
+        assert note == frequency_to_note(Frequency(frequency), A4_FREQUENCY)
+        assert abs(deviation) <= 25 + 1e-9
+        assert np.isclose(deviation, cents(frequency, note.frequency.value))
+
+
+def test_note_search_index_tar_string():
+    string = tar_string(Note.from_name("C4", A4_FREQUENCY), 27)
+    index = NoteSearchIndex(list(string.values()))
+    note, deviation = index.nearest(Frequency(440 * 2 ** (10 / 1200)))
+    assert note.name == "A4"
+    assert np.isclose(deviation, 10)
+    # Gs4 is not a fret, G#4 (fret 12) is the closest one
+    note, deviation = index.nearest(Note.from_name("Gs4", A4_FREQUENCY).frequency)
+    assert note.name == "G#4"
+    assert np.isclose(deviation, -50)
+
+
+def test_note_search_index_piano_keys_out_of_range():
+    keys = generate_piano_keys((4, 5), A4_FREQUENCY)
+    index = NoteSearchIndex(list(keys.values()))
+    indices, deviations = index.query([10.0, 10000.0])
+    assert [index.notes[i].name for i in indices] == ["C4", "B4"]
+    assert deviations[0] < -1200
+    assert deviations[1] > 1200
+
+
+def test_note_search_index_invalid():
+    with pytest.raises(ValueError):
+        NoteSearchIndex([])
+    index = NoteSearchIndex([Note.from_name("A4", A4_FREQUENCY)])
+    with pytest.raises(ValueError):
+        index.query([440.0, 0.0])
+    assert len(index) == 1
+    assert index.nearest(Frequency(100)) == (index.notes[0], pytest.approx(cents(100, 440)))
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,60 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import numpy as np
+import pytest
+
+from core.frequency import Frequency
+from core.note_mapping import LazyNoteMapping
+from core.notes import Note, note_cache_info
+
+A4_FREQUENCY = Frequency(440)
+
+
+def test_lazy_note_mapping():
+    mapping = LazyNoteMapping([0, 1, 5], [138, 140, 120], A4_FREQUENCY)
+    assert len(mapping) == 3
+    assert list(mapping) == [0, 1, 5]
+    assert mapping[5] == Note.from_name("C4", A4_FREQUENCY)
+    assert [note.name for note in mapping.values()] == ["A4", "A#4", "C4"]
+    assert mapping == {
+        0: Note.from_name("A4", A4_FREQUENCY),
+        1: Note.from_name("A#4", A4_FREQUENCY),
+        5: Note.from_name("C4", A4_FREQUENCY),
+    }
+    assert 2 not in mapping
+    with pytest.raises(KeyError):
+        _ = mapping[2]
+    assert repr(mapping) == "LazyNoteMapping(3 notes, A4: 440 Hz)"
+
+
+def test_lazy_note_mapping_arrays_are_read_only_copies():
+    keys, steps = np.arange(3), np.array([138, 140, 120])
+    mapping = LazyNoteMapping(keys, steps, A4_FREQUENCY)
+    np.testing.assert_array_equal(mapping.keys_array, keys)
+    np.testing.assert_array_equal(mapping.steps, steps)
+    assert not mapping.keys_array.flags.writeable and not mapping.steps.flags.writeable
+    assert keys.flags.writeable and steps.flags.writeable
+    steps[0] = 0
+    assert mapping[0].name == "A4"
+
+
+def test_lazy_note_mapping_creates_notes_on_access():
+    mapping = LazyNoteMapping(range(100), range(100, 200), Frequency(441.5))
+    misses = note_cache_info().misses
+    assert mapping.steps[10] == 110
+    assert note_cache_info().misses == misses
+    _ = mapping[10]
+    assert note_cache_info().misses == misses + 1
+    assert mapping[10] is mapping[10]
+
+
+@pytest.mark.parametrize(
+    "keys, steps", [([0, 1], [0]), ([0, 0], [1, 2]), ([0], [-1]), ([0], [264])]
+)
+def test_lazy_note_mapping_invalid(keys, steps):
+    with pytest.raises(ValueError):
+        LazyNoteMapping(keys, steps, A4_FREQUENCY)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,63 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+from typing import Tuple
+
+import pytest
+
+from core.accidentals import Accidental
+from core.note_names import (
+    A4_STEP,
+    STANDARD_NOTES,
+    STEP_COUNT,
+    absolute_step,
+    index_and_octave,
+    parse_note_name,
+    step_to_name,
+)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("C-1", ("C", "", -1, 0, 0)),
+        ("Dk4", ("D", "k", 4, 3, 123)),
+        ("A4", ("A", "", 4, 18, A4_STEP)),
+        ("Eb4", ("E", "b", 4, 6, 126)),
+        ("B#3", ("B", "#", 3, 0, 120)),  # standard equivalent is C4
+        ("Bs9", ("B", "s", 9, 23, STEP_COUNT - 1)),
+    ],
+)
+def test_parse_note_name(name: str, expected: Tuple[str, str, int, int, int]):
+    letter, symbol, octave, quartertone_index, step = expected
+    parsed = parse_note_name(name)
+    assert parsed.letter == letter
+    assert parsed.accidental == Accidental.from_symbol(symbol)
+    assert parsed.octave == octave
+    assert parsed.quartertone_index == quartertone_index
+    assert parsed.step == step
+
+
+@pytest.mark.parametrize("name", ["H2", "G#10", "D##4", "8A", "B#9", "C-2", "a4", "A 4", ""])
+def test_parse_note_name_invalid(name: str):
+    with pytest.raises(ValueError):
+        parse_note_name(name)
+
+
+def test_step_to_name():
+    for step in range(STEP_COUNT):
+        assert parse_note_name(step_to_name(step)).step == step
+    assert step_to_name(A4_STEP) == "A4"
+    with pytest.raises(ValueError):
+        step_to_name(-1)
+    with pytest.raises(ValueError):
+        step_to_name(STEP_COUNT)
+
+
+def test_absolute_step_round_trip():
+    for octave in range(-1, 10):
+        for index in range(len(STANDARD_NOTES["quartertone"])):
+            assert index_and_octave(absolute_step(index, octave)) == (index, octave)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
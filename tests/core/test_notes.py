@@ -1,5 +1,6 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=missing-function-docstring
+import bisect
 import csv
 import os
 import string
@@ -17,8 +18,13 @@ from core.notes import (
     _decompose_name,
     _standardize_note,
     _validate_letter,
+    cached_note,
+    clear_note_cache,
     frequency_to_note,
+    note_cache_info,
     standard_notes,
+    standard_notes_sweep,
+    transpose_notes,
 )
 from core.octaves import Octave
 
@@ -70,7 +76,7 @@ def test_decompose_name_valid(
     assert octave == expected_octave, f"Incorrect octave decomposition for {actual_name}"
 
 
-@pytest.mark.parametrize("name", ["H2", "G#10", "D##4", "D^3", "8A", "Csharp4"])
+@pytest.mark.parametrize("name", ["H2", "G#10", "D##4", "D^3", "8A", "Csharp4", "B#9", "A", ""])
 def test_decompose_name_invalid(name: str):
     with pytest.raises(ValueError):
         _decompose_name(name)
@@ -135,6 +141,59 @@ def test_note_eq():
     assert note1 != Frequency(493.88)
 
 
+def test_note_eq_enharmonic_and_a4():
+    assert Note.from_name("Eb4", A4_FREQUENCY) == Note.from_name("D#4", A4_FREQUENCY)
+    assert Note.from_name("B#3", A4_FREQUENCY) == Note.from_name("C4", A4_FREQUENCY)
+    assert Note.from_name("A4", A4_FREQUENCY) != Note.from_name("A4", Frequency(415))
+    assert Note.from_name("A4", A4_FREQUENCY) == Frequency(440.0000000001)
+
+
+def test_note_ordering_of_different_a4_frequencies():
+    a4_at_440 = Note.from_name("A4", A4_FREQUENCY)
+    a3_at_880 = Note.from_name("A3", Frequency(880))
+    assert a4_at_440 != a3_at_880
+    assert (a3_at_880 < a4_at_440, a4_at_440 < a3_at_880) == (True, False)
+    assert (a4_at_440 > a3_at_880, a3_at_880 > a4_at_440) == (True, False)
+    a4_at_415 = Note.from_name("A4", Frequency(415))
+    assert a4_at_415 < a4_at_440 <= Note.from_name("A4", A4_FREQUENCY)
+    assert sorted([a4_at_440, a3_at_880, a4_at_415]) == [a3_at_880, a4_at_415, a4_at_440]
+
+
+def test_note_hash():
+    notes = [Note.from_name(name, A4_FREQUENCY) for name in ["Eb4", "D#4", "E4", "B#3", "C4"]]
+    assert len(set(notes)) == 3
+    assert hash(notes[0]) == hash(notes[1])
+    assert {notes[0]: "x"}[notes[1]] == "x"
+    assert Note.from_name("A4", Frequency(415)) not in set(notes)
+
+
+def test_note_ordering():
+    names = ["A4", "C4", "Dk4", "Bs3", "B#3", "G#2", "Cs-1"]
+    notes = [Note.from_name(name, A4_FREQUENCY) for name in names]
+    actual = [note.name for note in sorted(notes)]
+    assert actual[:3] == ["Cs-1", "G#2", "Bs3"]
+    assert set(actual[3:5]) == {"C4", "B#3"}
+    assert actual[5:] == ["Dk4", "A4"]
+    assert [note.name for note in sorted(notes, key=lambda note: note.step)][:3] == actual[:3]
+    note = Note.from_name("A4", A4_FREQUENCY)
+    assert note < Note.from_name("As4", A4_FREQUENCY)
+    assert note <= Note.from_name("A4", A4_FREQUENCY)
+    assert note > Note.from_name("A4", Frequency(415))
+    assert note < 441
+    assert note >= Frequency(440)
+
+
+def test_note_ordering_bisect():
+    notes = standard_notes("quartertone", Octave.from_number(4), A4_FREQUENCY)
+    position = bisect.bisect_left(notes, Note.from_name("Eb4", A4_FREQUENCY))
+    assert notes[position].name == "D#4"
+
+
+def test_note_ordering_unsupported():
+    with pytest.raises(TypeError):
+        _ = Note.from_name("A4", A4_FREQUENCY) < "B4"
+
+
 @pytest.mark.parametrize("note_unsupported_type", [{}, "A4"])
 def test_note_eq_unsupported(note_unsupported_type: Any):
     note = Note(
@@ -176,11 +235,90 @@ def test_note_add(
     assert actual_note + added_value == expected_note
 
 
-@pytest.mark.parametrize("value_unsupported_type", [Frequency(100), 1, 0.0])
+@pytest.mark.parametrize("value_unsupported_type", [Frequency(100), 0.0, "1", True])
 def test_note_add_not_implemented(value_unsupported_type: Any):
     note = Note.from_name("A0", A4_FREQUENCY)
     with pytest.raises(NotImplementedError):
         _ = note + value_unsupported_type
+    with pytest.raises(NotImplementedError):
+        _ = note - value_unsupported_type
+
+
+@pytest.mark.parametrize(
+    "note_name, quartertone_steps, expected_note_name",
+    [
+        ("A4", 0, "A4"),
+        ("A4", 1, "As4"),
+        ("A4", 6, "C5"),
+        ("A4", 24, "A5"),
+        ("A4", 48, "A6"),
+        ("C4", -1, "Bs3"),
+        ("C4", -2, "B3"),
+        ("A4", -24, "A3"),
+        ("Eb4", 2, "E4"),
+        ("C-1", 263, "Bs9"),
+        ("Bs9", -263, "C-1"),
+    ],
+)
+def test_note_transpose(note_name: str, quartertone_steps: int, expected_note_name: str):
+    note = Note.from_name(note_name, A4_FREQUENCY)
+    expected_note = Note.from_name(expected_note_name, A4_FREQUENCY)
+    assert note.transpose(quartertone_steps) == expected_note
+    assert note + quartertone_steps == expected_note
+    assert note - (-quartertone_steps) == expected_note
+    assert expected_note - quartertone_steps == note
+    assert note.transpose(quartertone_steps).a4_frequency == A4_FREQUENCY
+
+
+@pytest.mark.parametrize("interval", list(MusicalInterval))
+def test_note_sub_interval_inverts_add(interval: MusicalInterval):
+    note = Note.from_name("C4", A4_FREQUENCY)
+    assert (note + interval) - interval == note
+    assert note - interval == note + (-MusicalInterval.as_quartertone_steps(interval))
+
+
+@pytest.mark.parametrize("note_name, quartertone_steps", [("C-1", -1), ("Bs9", 1), ("A4", 200)])
+def test_note_transpose_out_of_range(note_name: str, quartertone_steps: int):
+    note = Note.from_name(note_name, A4_FREQUENCY)
+    with pytest.raises(ValueError):
+        note.transpose(quartertone_steps)
+
+
+def test_note_transpose_frequency_ratio():
+    note = Note.from_name("D4", A4_FREQUENCY)
+    for quartertone_steps in range(-48, 49):
+        transposed = note + quartertone_steps
+        ratio = transposed.frequency.value / note.frequency.value
+        assert isclose(ratio, 2 ** (quartertone_steps / 24))
+
+
+def test_transpose_notes():
+    notes = [Note.from_name(name, A4_FREQUENCY) for name in ["C4", "Dk4", "B3"]]
+    assert transpose_notes(notes, 24) == [note + 24 for note in notes]
+    assert transpose_notes(notes, [-1, 0, 1]) == [note + k for note, k in zip(notes, [-1, 0, 1])]
+    assert not transpose_notes([], 3)
+
+
+def test_transpose_notes_keeps_a4_frequency_of_each_note():
+    notes = [Note.from_name("A4", Frequency(440)), Note.from_name("A4", Frequency(415))]
+    transposed = transpose_notes(notes, -24)
+    assert [note.frequency for note in transposed] == [Frequency(220), Frequency(207.5)]
+
+
+@pytest.mark.parametrize(
+    "quartertone_steps, message",
+    [
+        ([1, 2], "one int per note"),
+        ([1], "one int per note"),
+        ([[1, 2, 3]], "one int per note"),
+        (300, "range"),
+        (-300, "range"),
+    ],
+)
+def test_transpose_notes_invalid(quartertone_steps: Any, message: str):
+    notes = [Note.from_name(name, A4_FREQUENCY) for name in ["C4", "Dk4", "B3"]]
+    with pytest.raises(ValueError, match=message):
+        transpose_notes(notes, quartertone_steps)
 
 
 @pytest.mark.parametrize("a4_frequency", [Frequency(10), Frequency(100), Frequency(440)])
@@ -222,6 +360,46 @@ def test_standard_notes(mode: str, octave: Octave):
         assert f"{note.letter}{str(note.accidental)}" in names
 
 
+def test_cached_note():
+    clear_note_cache()
+    note1 = cached_note("Dk4", A4_FREQUENCY)
+    note2 = cached_note("Dk4", Frequency(440))
+    assert note1 is note2
+    assert note1 == Note.from_name("Dk4", A4_FREQUENCY)
+    assert cached_note("Dk4", Frequency(415)) is not note1
+    info = note_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+    clear_note_cache()
+    assert note_cache_info().currsize == 0
+    assert cached_note("Dk4", A4_FREQUENCY) is not note1
+
+
+def test_cached_note_immutable():
+    note = cached_note("A4", A4_FREQUENCY)
+    with pytest.raises(AttributeError):
+        note.name = "B4"  # type: ignore[misc]
+
+
+def test_standard_notes_shared():
+    notes1 = standard_notes("semitone", Octave.from_number(4), A4_FREQUENCY)
+    notes2 = standard_notes("semitone", Octave.from_number(4), A4_FREQUENCY)
+    assert all(note1 is note2 for note1, note2 in zip(notes1, notes2))
+
+
+@pytest.mark.parametrize("mode", ["natural", "semitone", "quartertone"])
+def test_standard_notes_sweep(mode: str):
+    a4_frequencies = [415, 440, 466]
+    octave = Octave.from_number(3)
+    names, sweep = standard_notes_sweep(mode, octave, a4_frequencies)
+    assert sweep.shape == (len(a4_frequencies), len(STANDARD_NOTES[mode]))
+    for a4_frequency, row in zip(a4_frequencies, sweep):
+        notes = standard_notes(mode, octave, Frequency(a4_frequency))
+        assert names == [note.name for note in notes]
+        assert all(note == frequency for note, frequency in zip(notes, row.tolist()))
+    with pytest.raises(ValueError):
+        standard_notes_sweep("wrong_mode", octave, a4_frequencies)
+
+
 def test_standard_notes_invalid_mode():
     with pytest.raises(ValueError):
         standard_notes("wrong_mode", Octave.from_number(0), A4_FREQUENCY)
@@ -240,5 +418,11 @@ def test_frequency_to_note_quartertone(frequency_error: float):
         assert isclose(frequency_distance, -frequency_error, abs_tol=IS_CLOSE_ABS_TOL)
 
 
+def test_note_frozen_hashable():
+    note = Note.from_name("Dk4", A4_FREQUENCY)
+    assert not hasattr(note, "__dict__")
+    assert len({note, Note.from_name("Dk4", A4_FREQUENCY), Note.from_name("D4", A4_FREQUENCY)}) == 2
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__]))
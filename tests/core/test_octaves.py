@@ -116,5 +116,14 @@ def test_octave_register():
     assert OctaveRegister.SMALL.value.number == 3
 
 
+def test_octave_frozen_hashable():
+    octave = Octave("great", 2)
+    with pytest.raises(AttributeError):
+        octave.number = 3  # type: ignore[misc]
+    assert not hasattr(octave, "__dict__")
+    assert len({octave, Octave.from_number(2), Octave.from_number(3)}) == 2
+    assert hash(octave) == hash(2)
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__]))
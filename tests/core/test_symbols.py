@@ -27,5 +27,14 @@ def test_symbol_comparison_not_implemented():
         s == 0  # pylint: disable=pointless-statement
 
 
+def test_symbol_frozen_hashable():
+    sym = Symbol(simplified="A", unicode="\u0041")
+    with pytest.raises(AttributeError):
+        sym.simplified = "B"  # type: ignore[misc]
+    assert not hasattr(sym, "__dict__")
+    assert len({sym, Symbol(simplified="A", unicode="\u0041")}) == 1
+    assert hash(sym) == hash("A")
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,111 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import io
+import threading
+
+import numpy as np
+import pytest
+
+from core.frequency import Frequency
+from core.note_names import A4_STEP, STEP_COUNT, parse_note_name
+from core.notes import Note
+from core.tuning import TuningTable, frequency_sweep, tuning_table, write_sweep_csv
+
+A4_FREQUENCY = Frequency(440)
+
+
+@pytest.mark.parametrize("a4_frequency", [Frequency(415), Frequency(440)])
+def test_tuning_table_matches_notes(a4_frequency: Frequency):
+    table = TuningTable(a4_frequency)
+    assert len(table) == STEP_COUNT == 264
+    for name in ["C-1", "Dk4", "A4", "Eb4", "B#3", "Bs9"]:
+        assert Note.from_name(name, a4_frequency) == float(table[name])
+    assert table[A4_STEP] == a4_frequency.value
+
+
+def test_tuning_table_lookups():
+    table = tuning_table(A4_FREQUENCY)
+    assert table["Dk4"] == table[3, 4] == table[parse_note_name("Dk4").step]
+    assert table.frequency(A4_STEP) == Frequency(440)
+    steps = np.array([0, A4_STEP, STEP_COUNT - 1])
+    assert np.array_equal(table[steps], table.frequencies[steps])
+
+
+@pytest.mark.parametrize(
+    "key", ["H4", "B#9", (24, 4), (0, 10), (-1, 4), -1, STEP_COUNT, np.array([0, -1])]
+)
+def test_tuning_table_lookups_invalid(key):
+    with pytest.raises(ValueError):
+        _ = tuning_table(A4_FREQUENCY)[key]
+
+
+def test_tuning_table_repr():
+    assert repr(tuning_table(A4_FREQUENCY)) == f"TuningTable({STEP_COUNT} notes, A4: 440.0 Hz)"
+
+
+def test_tuning_table_frequency_invalid():
+    with pytest.raises(ValueError):
+        tuning_table(A4_FREQUENCY).frequency(STEP_COUNT)
+
+
+def test_tuning_table_read_only():
+    table = tuning_table(A4_FREQUENCY)
+    with pytest.raises(ValueError):
+        table.frequencies[0] = 1.0
+
+
+def test_tuning_table_shared():
+    assert tuning_table(A4_FREQUENCY) is tuning_table(Frequency(440.0))
+    assert tuning_table(A4_FREQUENCY) is not tuning_table(Frequency(415))
+
+    tables = []
+    threads = [
+        threading.Thread(target=lambda: tables.append(tuning_table(A4_FREQUENCY))) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(table is tables[0] for table in tables)
+
+
+def test_tuning_table_nearest_steps():
+    table = tuning_table(A4_FREQUENCY)
+    steps = np.arange(STEP_COUNT)
+    assert np.array_equal(table.nearest_steps(table.frequencies * 1.01), steps)
+    assert np.array_equal(table.nearest_steps(table.frequencies * 0.99), steps)
+    assert table.nearest_steps(440.0) == A4_STEP
+    with pytest.raises(ValueError):
+        table.nearest_steps(np.array([440.0, -1.0]))
+    with pytest.raises(ValueError):
+        table.nearest_steps(1.0)
+
+
+def test_frequency_sweep():
+    a4_frequencies = [415, 430, 440, 442, 466]
+    steps = np.array([0, 123, A4_STEP, STEP_COUNT - 1])
+    sweep = frequency_sweep(a4_frequencies, steps)
+    assert sweep.shape == (5, 4)
+    for row, a4_frequency in zip(sweep, a4_frequencies):
+        assert np.allclose(row, tuning_table(Frequency(a4_frequency))[steps])
+
+
+@pytest.mark.parametrize(
+    "a4_frequencies, steps",
+    [([440, 0], [0]), ([440], [STEP_COUNT]), ([[440]], [0]), ([440], [-1])],
+)
+def test_frequency_sweep_invalid(a4_frequencies, steps):
+    with pytest.raises(ValueError):
+        frequency_sweep(a4_frequencies, steps)
+
+
+def test_write_sweep_csv():
+    stream = io.StringIO()
+    write_sweep_csv(stream, [415, 440], ["A4"], frequency_sweep([415, 440], [A4_STEP]))
+    assert stream.getvalue().splitlines() == ["a4_frequency,A4", "415,415.0", "440,440.0"]
+    with pytest.raises(ValueError):
+        write_sweep_csv(stream, [440], ["A4", "B4"], frequency_sweep([440], [A4_STEP]))
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
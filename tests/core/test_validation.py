@@ -0,0 +1,77 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import pytest
+
+from core.frequency import Frequency
+from core.notes import Note
+from core.validation import (
+    ValidationPolicy,
+    _policy_from_environment,
+    get_validation_policy,
+    is_strict,
+    set_validation_policy,
+)
+
+A4_FREQUENCY = Frequency(440)
+
+
+@pytest.fixture(name="restore_policy")
+def fixture_restore_policy():
+    policy = get_validation_policy()
+    yield
+    set_validation_policy(policy)
+
+
+@pytest.mark.usefixtures("restore_policy")
+def test_set_validation_policy():
+    set_validation_policy(ValidationPolicy.TRUSTED)
+    assert get_validation_policy() is ValidationPolicy.TRUSTED
+    assert not is_strict()
+    with pytest.raises(ValueError):
+        set_validation_policy("strict")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("strict", ValidationPolicy.STRICT), ("TRUSTED", ValidationPolicy.TRUSTED)],
+)
+def test_policy_from_environment(monkeypatch, value: str, expected: ValidationPolicy):
+    monkeypatch.setenv("MUSIC_VALIDATION_POLICY", value)
+    assert _policy_from_environment() is expected
+
+
+def test_policy_from_environment_default(monkeypatch):
+    monkeypatch.delenv("MUSIC_VALIDATION_POLICY", raising=False)
+    assert _policy_from_environment() is ValidationPolicy.TRUSTED
+
+
+def test_policy_from_environment_invalid(monkeypatch):
+    monkeypatch.setenv("MUSIC_VALIDATION_POLICY", "lenient")
+    with pytest.raises(ValueError):
+        _policy_from_environment()
+
+
+@pytest.mark.usefixtures("restore_policy")
+@pytest.mark.parametrize(
+    "policy, expected_call_count", [(ValidationPolicy.STRICT, 1), (ValidationPolicy.TRUSTED, 0)]
+)
+def test_trusted_note_validation(mocker, policy: ValidationPolicy, expected_call_count: int):
+    set_validation_policy(policy)
+    post_init = mocker.spy(Note, "__post_init__")
+    note = Note.from_name("Dk4", A4_FREQUENCY)
+    assert post_init.call_count == expected_call_count
+    assert note == Note(
+        "Dk4", note.letter, note.accidental, note.octave, note.frequency, A4_FREQUENCY
+    )
+    assert note.name == "Dk4" and note.letter == "D" and note.accidental == "k"
+
+
+@pytest.mark.usefixtures("restore_policy")
+def test_user_created_note_always_validated():
+    set_validation_policy(ValidationPolicy.TRUSTED)
+    with pytest.raises(ValueError):
+        Note("A4", "A", "", 4, Frequency(430.0), A4_FREQUENCY)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -0,0 +1,48 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import csv
+import os
+import subprocess
+
+import numpy as np
+import pytest
+
+from entry_points.a4_sweep_entry import main
+
+
+def test_a4_sweep_entry_point_script_smoke_test():
+    cmd = ["python3", "-m", "entry_points.a4_sweep_entry"]
+    result = subprocess.run(cmd, capture_output=True, check=False)
+    assert result.returncode == 0
+    assert result.stdout.decode().startswith("a4_frequency,C4,C#4")
+
+
+@pytest.mark.parametrize("mode", ["natural", "semitone", "quartertone"])
+def test_a4_sweep_entry_main_print_out(capsys, mode: str):
+    result = main(["-m", mode, "-a4", "415", "440"])
+    assert result == os.EX_OK
+    rows = list(csv.reader(capsys.readouterr().out.splitlines()))
+    assert len(rows) == 3
+    assert float(rows[2][rows[0].index("A4")]) == 440.0
+
+
+@pytest.mark.parametrize("fret_count", [25, 27, 28])
+def test_a4_sweep_entry_main_tar_csv(tmp_path: str, fret_count: int):
+    output_file = os.path.join(tmp_path, "sweep.csv")
+    args = ["--tar-base-note", "C4", "--fret-count", str(fret_count), "-f", output_file]
+    assert main(args) == os.EX_OK
+    with open(output_file, "r", encoding="utf-8") as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert len(rows) == 6
+    assert len(rows[0]) == fret_count + 2
+    assert rows[0][1] == "0:C4"
+
+
+def test_a4_sweep_entry_main_npy(tmp_path: str):
+    output_file = os.path.join(tmp_path, "sweep.npy")
+    assert main(["-m", "quartertone", "-f", output_file]) == os.EX_OK
+    assert np.load(output_file).shape == (5, 24)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
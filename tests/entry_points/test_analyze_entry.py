@@ -0,0 +1,67 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import csv
+import os
+import subprocess
+
+import numpy as np
+import pytest
+
+from entry_points.analyze_entry import main
+
+SAMPLE_RATE = 16000
+
+
+@pytest.fixture(name="directory")
+def fixture_directory(tone, write_wav):
+    write_wav(tone(440.0), SAMPLE_RATE, "a4.wav")
+    return os.path.dirname(write_wav(tone(220.0), SAMPLE_RATE, "a3.wav"))
+
+
+def test_analyze_entry_point_script_smoke_test(directory: str):
+    cmd = ["python3", "-m", "entry_points.analyze_entry", "-d", directory, "-j", "2"]
+    result = subprocess.run(cmd, capture_output=True, check=False)
+    assert result.returncode == 0
+    rows = list(csv.reader(result.stdout.decode().splitlines()))
+    assert rows[0][:3] == ["octave", "C", "Cs"]
+    assert len(rows) == 12
+    assert "2 files analyzed" in result.stderr.decode()
+
+
+def test_analyze_entry_main_print_out(capsys, directory: str):
+    assert main(["-d", directory, "-j", "1"]) == os.EX_OK
+    rows = list(csv.reader(capsys.readouterr().out.splitlines()))
+    a_column = rows[0].index("A")
+    octave_rows = {row[0]: row for row in rows[1:]}
+    assert int(octave_rows["3"][a_column]) > 0
+    assert int(octave_rows["4"][a_column]) > 0
+
+
+def test_analyze_entry_main_reports_failed_files(capsys, directory: str):
+    broken = os.path.join(directory, "broken.wav")
+    with open(broken, "wb") as wav_file:
+        wav_file.write(b"not a wav file")
+    assert main(["-d", directory, "-j", "1"]) == os.EX_OK
+    err = capsys.readouterr().err
+    assert "2 files analyzed" in err
+    assert f"failed: {broken}: " in err
+
+
+@pytest.mark.parametrize("extension", [".npy", ".csv"])
+def test_analyze_entry_main_save_with_checkpoint(directory: str, tmp_path: str, extension: str):
+    output_file = os.path.join(tmp_path, f"histogram{extension}")
+    checkpoint = os.path.join(tmp_path, "checkpoint.jsonl")
+    args = ["-d", directory, "-j", "1", "-c", checkpoint, "-f", output_file]
+    assert main(args) == os.EX_OK
+    assert main(args) == os.EX_OK  # resumed, nothing left to analyze
+    with open(checkpoint, "r", encoding="utf-8") as checkpoint_file:
+        assert len(checkpoint_file.readlines()) == 2
+    if extension == ".npy":
+        assert np.load(output_file).shape == (11, 24)
+    else:
+        with open(output_file, "r", encoding="utf-8") as csv_file:
+            assert len(list(csv.reader(csv_file))) == 12
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
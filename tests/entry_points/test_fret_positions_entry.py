@@ -0,0 +1,45 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import csv
+import os
+import subprocess
+
+import numpy as np
+import pytest
+
+from entry_points.fret_positions_entry import main
+
+
+def test_fret_positions_entry_point_script_smoke_test():
+    cmd = ["python3", "-m", "entry_points.fret_positions_entry"]
+    result = subprocess.run(cmd, capture_output=True, check=False)
+    assert result.returncode == 0
+    assert result.stdout.decode().startswith("scale_length_mm,base_note,0,1")
+
+
+def test_fret_positions_entry_main_print_out(capsys):
+    assert main(["--scale-lengths", "600", "660", "--base-notes", "C4"]) == os.EX_OK
+    rows = list(csv.reader(capsys.readouterr().out.splitlines()))
+    assert len(rows) == 3
+    assert rows[1][:3] == ["600.00", "C4", "0.00"]
+
+
+def test_fret_positions_entry_main_csv(tmp_path: str):
+    output_file = os.path.join(tmp_path, "positions.csv")
+    args = ["--scale-length-range", "600", "700", "10", "--fret-count", "25", "-f", output_file]
+    assert main(args) == os.EX_OK
+    with open(output_file, "r", encoding="utf-8") as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert len(rows) == 1 + 10 * 3
+    assert len(rows[0]) == 2 + 26
+
+
+def test_fret_positions_entry_main_npy(tmp_path: str):
+    output_file = os.path.join(tmp_path, "positions.npy")
+    args = ["--scale-length-range", "600", "700", "0.5", "--base-notes", "C4", "G3", "-f"]
+    assert main(args + [output_file]) == os.EX_OK
+    assert np.load(output_file).shape == (200, 2, 28)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -20,6 +20,14 @@ def test_piano_entry_main_smoke_test():
     assert result == os.EX_OK
 
 
+@pytest.mark.parametrize("preset", ["88", "97", "108"])
+def test_piano_entry_main_preset(tmp_path: str, preset: str):
+    output_file = os.path.join(tmp_path, "piano.png")
+    result = main(["-p", preset, "-s", "-f", output_file])
+    assert result == os.EX_OK
+    assert os.path.isfile(output_file)
+
+
 def test_piano_entry_main_show(mocker):
     mocker.patch("cv2.imshow")
     mocker.patch("cv2.waitKey", return_value=ord("q"))
@@ -0,0 +1,54 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import os
+import subprocess
+
+import pytest
+
+from audio.wav_reader import wav_info
+from entry_points.synth_entry import main
+
+
+def test_synth_entry_point_script_smoke_test(tmp_path: str):
+    file_path = os.path.join(tmp_path, "out.wav")
+    cmd = ["python3", "-m", "entry_points.synth_entry", "-f", file_path]
+    result = subprocess.run(cmd, capture_output=True, check=False)
+    assert result.returncode == 0
+    assert "real-time" in result.stderr.decode()
+    assert wav_info(file_path).duration == 24 * 0.5
+
+
+@pytest.mark.parametrize("fret_count", [25, 27, 28])
+def test_synth_entry_main_tar_string(tmp_path: str, fret_count: int):
+    file_path = os.path.join(tmp_path, "out.wav")
+    args = ["-f", file_path, "--tar-base-note", "C3", "--fret-count", str(fret_count)]
+    args += ["-d", "0.1", "--sample-rate", "8000"]
+    assert main(args) == os.EX_OK
+    assert wav_info(file_path).frame_count == (fret_count + 1) * 800
+
+
+def test_synth_entry_main_plucked_strings(tmp_path: str):
+    file_path = os.path.join(tmp_path, "out.wav")
+    args = ["-f", file_path, "--tar-base-note", "C4", "G3", "--fret-count", "25", "--plucked"]
+    args += ["-d", "0.1", "--sample-rate", "8000"]
+    assert main(args) == os.EX_OK
+    assert wav_info(file_path).frame_count == (25 + 3) * 800
+
+
+def test_synth_entry_main_several_strings(tmp_path: str):
+    file_path = os.path.join(tmp_path, "out.wav")
+    args = ["-f", file_path, "--tar-base-note", "C4", "G3", "-d", "0.1", "--sample-rate", "8000"]
+    assert main(args) == os.EX_OK
+    assert wav_info(file_path).frame_count == 2 * 28 * 800
+
+
+@pytest.mark.parametrize("mode, note_count", [("natural", 7), ("semitone", 12)])
+def test_synth_entry_main_standard_notes(tmp_path: str, mode: str, note_count: int):
+    file_path = os.path.join(tmp_path, "out.wav")
+    args = ["-f", file_path, "-m", mode, "-o", "3", "-d", "0.2", "--a4-frequency", "415"]
+    assert main(args) == os.EX_OK
+    assert wav_info(file_path).frame_count == note_count * 8820
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
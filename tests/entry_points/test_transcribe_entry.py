@@ -0,0 +1,45 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import os
+import subprocess
+
+import numpy as np
+import pytest
+
+from entry_points.transcribe_entry import main
+
+SAMPLE_RATE = 16000
+
+
+def test_transcribe_entry_point_script_smoke_test(tone, write_wav):
+    file_path = write_wav(tone(440.0, 0.5), SAMPLE_RATE)
+    cmd = ["python3", "-m", "entry_points.transcribe_entry", "-f", file_path]
+    result = subprocess.run(cmd, capture_output=True, check=False)
+    assert result.returncode == 0
+    onset, _, name = result.stdout.decode().split()
+    assert (onset, name) == ("0.000", "A4")
+    assert "frames/s" in result.stderr.decode()
+
+
+def test_transcribe_entry_main_print_out(capsys, tone, write_wav):
+    file_path = write_wav(np.concatenate([tone(440.0, 0.5), tone(220.0, 0.5)]), SAMPLE_RATE)
+    args = ["-f", file_path, "--a4-frequency", "440", "--chunk-frames", "1000"]
+    assert main(args) == os.EX_OK
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split("\t")[2] for line in lines] == ["A4", "A3"]
+
+
+def test_transcribe_entry_main_a4_reference(capsys, tone, write_wav):
+    file_path = write_wav(tone(415.0, 0.5), SAMPLE_RATE)
+    assert main(["-f", file_path, "--a4-frequency", "415"]) == os.EX_OK
+    assert capsys.readouterr().out.split()[2] == "A4"
+
+
+def test_transcribe_entry_main_invalid_settings(tone, write_wav):
+    file_path = write_wav(tone(440.0, 0.1), SAMPLE_RATE)
+    with pytest.raises(ValueError):
+        main(["-f", file_path, "--frame-length", "256"])
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
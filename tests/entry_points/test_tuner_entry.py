@@ -0,0 +1,51 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import io
+import os
+import subprocess
+
+import numpy as np
+import pytest
+
+from entry_points.tuner_entry import main
+
+SAMPLE_RATE = 16000
+
+
+def test_tuner_entry_point_script_stdin(tone):
+    pcm = np.round(tone(440.0, 0.5) * 32767).astype("<i2").tobytes()
+    cmd = ["python3", "-m", "entry_points.tuner_entry", "--sample-rate", str(SAMPLE_RATE)]
+    result = subprocess.run(cmd, input=pcm, capture_output=True, check=False)
+    assert result.returncode == 0
+    lines = result.stdout.decode().splitlines()
+    assert lines
+    assert all(line.split("\t")[1] == "A4" for line in lines)
+    assert "analysis within 10.0 ms" in result.stderr.decode()
+
+
+def test_tuner_entry_main_stdin(capsys, monkeypatch, tone):
+    pcm = np.round(tone(440.0, 0.5) * 32767).astype("<i2").tobytes()
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(pcm)))
+    assert main(["--sample-rate", str(SAMPLE_RATE)]) == os.EX_OK
+    lines = capsys.readouterr().out.splitlines()
+    assert lines
+    assert all(line.split("\t")[1] == "A4" for line in lines)
+
+
+def test_tuner_entry_main_file(capsys, tone, write_wav):
+    file_path = write_wav(tone(261.63, 0.5), SAMPLE_RATE)
+    assert main(["-f", file_path, "--budget-ms", "5"]) == os.EX_OK
+    captured = capsys.readouterr()
+    assert all(line.split("\t")[1] == "C4" for line in captured.out.splitlines())
+    for stage in ["read", "window", "estimate", "snap", "analysis"]:
+        assert f"{stage}\tn=" in captured.err
+
+
+def test_tuner_entry_main_invalid_settings(tone, write_wav):
+    file_path = write_wav(tone(440.0, 0.1), SAMPLE_RATE)
+    with pytest.raises(ValueError):
+        main(["-f", file_path, "--hop-length", "4096"])
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
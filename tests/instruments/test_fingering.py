@@ -0,0 +1,105 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import itertools
+
+import numpy as np
+import pytest
+
+from core.frequency import Frequency
+from core.note_names import parse_note_name
+from instruments.fingering import FingeringCosts, FingeringOptimizer
+from instruments.fretboard import Fretboard
+from instruments.fretboard_index import FretboardIndex
+
+A4_FREQUENCY = Frequency(440)
+
+
+@pytest.fixture(name="fretboard")
+def fixture_fretboard() -> Fretboard:
+    return Fretboard.from_preset("tar", A4_FREQUENCY)
+
+
+def _path_cost(fretboard: Fretboard, costs: FingeringCosts, path) -> float:
+    total = 0.0
+    for (string_0, fret_0), (string_1, fret_1) in zip(path[:-1], path[1:]):
+        position_0 = fretboard.positions_mm[string_0, fretboard.fret_numbers.tolist().index(fret_0)]
+        position_1 = fretboard.positions_mm[string_1, fretboard.fret_numbers.tolist().index(fret_1)]
+        movement = abs(position_1 - position_0)
+        total += costs.movement_per_mm * movement + costs.string_change * abs(string_1 - string_0)
+        total += costs.position_shift * (movement > costs.hand_span_mm)
+    return total
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_fingering_is_optimal(fretboard: Fretboard, seed: int):
+    index = FretboardIndex(fretboard)
+    rng = np.random.default_rng(seed)
+    melody = rng.choice(np.unique(fretboard.steps), 5).tolist()
+    costs = FingeringCosts()
+    fingering = FingeringOptimizer(fretboard, costs).solve(melody)
+    brute_force = min(
+        _path_cost(fretboard, costs, path)
+        for path in itertools.product(*(index.positions(step) for step in melody))
+    )
+    assert len(fingering) == 5
+    assert fingering.cost == pytest.approx(brute_force)
+    path = list(zip(fingering.string_indices.tolist(), fingering.fret_numbers.tolist()))
+    assert fingering.cost == pytest.approx(_path_cost(fretboard, costs, path))
+    for (string_index, fret_number), step in zip(path, melody):
+        assert fretboard.note(string_index, fret_number).step == step
+
+
+def test_fingering_avoids_string_changes_and_shifts(fretboard: Fretboard):
+    costs = FingeringCosts()
+    fingering = FingeringOptimizer(fretboard, costs).solve(["C4", "D4", "E4", "F4", "G4"])
+    assert np.all(fingering.string_indices == fingering.string_indices[0])
+    positions = fretboard.positions_mm[
+        fingering.string_indices, np.searchsorted(fretboard.fret_numbers, fingering.fret_numbers)
+    ]
+    assert np.all(np.abs(np.diff(positions)) <= costs.hand_span_mm)
+    assert fingering.cost == pytest.approx(costs.movement_per_mm * np.ptp(positions))
+
+
+def test_fingering_single_note(fretboard: Fretboard):
+    fingering = FingeringOptimizer(fretboard).solve(["C3"])
+    assert fingering.string_indices.tolist() == [5]
+    assert fingering.fret_numbers.tolist() == [0]
+    assert fingering.cost == 0.0
+
+
+def test_fingering_batch_matches_single(fretboard: Fretboard):
+    optimizer = FingeringOptimizer(fretboard)
+    rng = np.random.default_rng(0)
+    steps = np.unique(fretboard.steps)
+    melodies = [rng.choice(steps, length) for length in [1, 7, 30, 2, 30]]
+    fingerings = optimizer.solve_batch(melodies)
+    assert [len(fingering) for fingering in fingerings] == [1, 7, 30, 2, 30]
+    for melody, fingering in zip(melodies, fingerings):
+        expected = optimizer.solve(melody)
+        assert fingering.cost == pytest.approx(expected.cost)
+        np.testing.assert_array_equal(fingering.string_indices, expected.string_indices)
+        np.testing.assert_array_equal(fingering.fret_numbers, expected.fret_numbers)
+    assert not optimizer.solve_batch([])
+
+
+def test_fingering_names_and_steps(fretboard: Fretboard):
+    optimizer = FingeringOptimizer(fretboard)
+    names = ["G3", "Ak3", "B3", "C4", "Dk4"]
+    steps = np.array([parse_note_name(name).step for name in names])
+    assert optimizer.solve(names).cost == optimizer.solve(steps).cost
+
+
+def test_fingering_invalid(fretboard: Fretboard):
+    optimizer = FingeringOptimizer(fretboard)
+    with pytest.raises(ValueError):
+        optimizer.solve([])
+    with pytest.raises(ValueError):
+        optimizer.solve(["C4", "C2"])
+    with pytest.raises(ValueError):
+        optimizer.solve(np.array([300]))
+    with pytest.raises(ValueError):
+        optimizer.solve(["C4", "H4"])
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
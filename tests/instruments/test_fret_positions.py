@@ -0,0 +1,87 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import csv
+import io
+import os
+
+import numpy as np
+import pytest
+
+from core.frequency import Frequency
+from core.notes import Note
+from instruments.fret_positions import (
+    fret_length_ratios,
+    fret_position_table,
+    save_fret_positions_npy,
+    write_fret_positions_csv,
+)
+from instruments.fretboard import Fretboard
+from instruments.tar_instrument import tar_string
+
+
+@pytest.mark.parametrize("fret_count", [25, 27, 28])
+def test_fret_length_ratios_match_note_frequencies(fret_count: int):
+    string = tar_string(Note.from_name("G3", Frequency(432)), fret_count)
+    base_frequency = string[0].frequency.value
+    expected = [1 - base_frequency / note.frequency.value for note in string.values()]
+    np.testing.assert_allclose(fret_length_ratios(fret_count), expected)
+
+
+def test_fret_position_table():
+    scale_lengths = np.arange(600, 700, 0.5)
+    table = fret_position_table(scale_lengths, ["C4", "G3", "C3"], 27)
+    assert table.positions_mm.shape == (200, 3, 28)
+    assert table.configuration_count == 600
+    assert not table.positions_mm.flags.writeable
+    assert not table.scale_lengths_mm.flags.writeable
+    assert scale_lengths.flags.writeable  # the array of the caller is left as is
+    fretboard = Fretboard([Note.from_name(name, Frequency(440)) for name in ["C4", "G3", "C3"]], 27)
+    np.testing.assert_allclose(table.positions_mm[0], fretboard.positions_mm * 600 / 660)
+    np.testing.assert_allclose(table.positions_mm[-1, 1], fretboard.positions_mm[1] * 699.5 / 660)
+
+
+@pytest.mark.parametrize(
+    "scale_lengths, base_note_names, fret_count",
+    [([0], ["C4"], 27), ([[660]], ["C4"], 27), ([660], [], 27), ([660], ["C4"], 26)],
+)
+def test_fret_position_table_invalid(scale_lengths, base_note_names, fret_count):
+    with pytest.raises(ValueError):
+        fret_position_table(scale_lengths, base_note_names, fret_count)
+
+
+def test_fret_position_table_out_of_range():
+    with pytest.raises(ValueError):
+        fret_position_table([660], ["C4", "A9"], 28)
+
+
+def test_write_fret_positions_csv():
+    table = fret_position_table([600, 660], ["C4", "G3"], 25)
+    stream = io.StringIO()
+    write_fret_positions_csv(stream, table, decimals=3)
+    rows = list(csv.reader(stream.getvalue().splitlines()))
+    assert len(rows) == 5
+    assert rows[0][:4] == ["scale_length_mm", "base_note", "0", "1"]
+    assert "8" not in rows[0]
+    assert [row[:2] for row in rows[1:]] == [
+        ["600.000", "C4"],
+        ["600.000", "G3"],
+        ["660.000", "C4"],
+        ["660.000", "G3"],
+    ]
+    np.testing.assert_allclose(
+        np.array([row[2:] for row in rows[1:]], dtype=float),
+        table.positions_mm.reshape(4, -1),
+        atol=5e-4,
+    )
+
+
+def test_save_fret_positions_npy(tmp_path: str, monkeypatch):
+    monkeypatch.setattr("instruments.fret_positions.NPY_CHUNK_SIZE", 3)
+    table = fret_position_table(np.linspace(500, 800, 10), ["C4", "G3", "C3"], 28)
+    file_path = os.path.join(tmp_path, "positions.npy")
+    save_fret_positions_npy(file_path, table)
+    np.testing.assert_array_equal(np.load(file_path), table.positions_mm)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
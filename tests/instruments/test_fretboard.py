@@ -0,0 +1,79 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import numpy as np
+import pytest
+
+from core.frequency import Frequency
+from core.notes import Note
+from instruments.fretboard import PRESETS, Fretboard
+from instruments.tar_instrument import tar_string
+
+A4_FREQUENCY = Frequency(440)
+
+
+def _notes(names):
+    return [Note.from_name(name, A4_FREQUENCY) for name in names]
+
+
+@pytest.mark.parametrize("fret_count", [25, 27, 28])
+def test_fretboard_matches_tar_string(fret_count: int):
+    base_notes = _notes(["C4", "G3", "C3"])
+    fretboard = Fretboard(base_notes, fret_count)
+    assert fretboard.shape == (3, fret_count + 1)
+    for string_index, base_note in enumerate(base_notes):
+        expected = tar_string(base_note, fret_count)
+        string = fretboard.string(string_index)
+        assert list(string) == list(expected)
+        assert string == expected
+        np.testing.assert_allclose(
+            fretboard.frequencies[string_index],
+            [note.frequency.value for note in expected.values()],
+        )
+        assert fretboard.steps[string_index].tolist() == [note.step for note in expected.values()]
+
+
+def test_fretboard_positions():
+    fretboard = Fretboard(_notes(["C4", "G3"]), 28, scale_length_mm=[600.0, 660.0])
+    np.testing.assert_array_equal(fretboard.positions_mm[:, 0], [0.0, 0.0])
+    # fret 18 of the tar is the octave, in the middle of the string
+    octave = fretboard.fret_numbers.tolist().index(18)
+    assert fretboard.note(0, 18) == Note.from_name("C5", A4_FREQUENCY)
+    np.testing.assert_allclose(fretboard.positions_mm[:, octave], [300.0, 330.0])
+    assert np.all(np.diff(fretboard.positions_mm, axis=1) > 0)
+    assert not fretboard.positions_mm.flags.writeable
+
+
+def test_fretboard_note():
+    fretboard = Fretboard(_notes(["C4", "G3"]), 25)
+    assert fretboard.note(1, 0) == Note.from_name("G3", A4_FREQUENCY)
+    assert fretboard.note(0, 1) == Note.from_name("C#4", A4_FREQUENCY)
+    with pytest.raises(ValueError):
+        fretboard.note(0, 8)  # no fret 8 on a 25-fret neck
+
+
+@pytest.mark.parametrize("name", list(PRESETS))
+def test_fretboard_presets(name: str):
+    fretboard = Fretboard.from_preset(name, A4_FREQUENCY)
+    preset = PRESETS[name]
+    assert fretboard.shape == (len(preset.base_note_names), preset.fret_count + 1)
+    assert [string[0].name for string in fretboard.strings()] == list(preset.base_note_names)
+    assert repr(fretboard).startswith(f"Fretboard({len(preset.base_note_names)} strings")
+
+
+def test_fretboard_invalid():
+    with pytest.raises(ValueError):
+        Fretboard([], 27)
+    with pytest.raises(ValueError):
+        Fretboard(_notes(["C4"]), 26)
+    with pytest.raises(ValueError):
+        Fretboard(_notes(["C4"]), 27, scale_length_mm=0.0)
+    with pytest.raises(ValueError):
+        Fretboard(_notes(["C9"]), 27)
+    with pytest.raises(ValueError):
+        Fretboard([Note.from_name("C4", A4_FREQUENCY), Note.from_name("C4", Frequency(432))], 27)
+    with pytest.raises(ValueError):
+        Fretboard.from_preset("banjo", A4_FREQUENCY)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
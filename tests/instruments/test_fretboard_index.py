@@ -0,0 +1,73 @@
+# pylint: disable=missing-module-docstring
+# pylint: disable=missing-function-docstring
+import numpy as np
+import pytest
+
+from core.frequency import Frequency
+from core.note_names import parse_note_name
+from instruments.fretboard import Fretboard
+from instruments.fretboard_index import FretboardIndex
+
+A4_FREQUENCY = Frequency(440)
+
+
+@pytest.fixture(name="fretboard")
+def fixture_fretboard() -> Fretboard:
+    return Fretboard.from_preset("tar", A4_FREQUENCY)
+
+
+def _linear_positions(fretboard: Fretboard, name: str):
+    return [
+        (string_index, fret_number)
+        for string_index, string in enumerate(fretboard.strings())
+        for fret_number, note in string.items()
+        if note.name == name
+    ]
+
+
+@pytest.mark.parametrize("name", ["C4", "G3", "Dk4", "B4", "C3", "C6", "A2"])
+def test_fretboard_index_positions_match_linear_search(fretboard: Fretboard, name: str):
+    index = FretboardIndex(fretboard)
+    expected = _linear_positions(fretboard, name)
+    assert list(index.positions(name)) == expected
+    assert index.positions(parse_note_name(name).step) == index.positions(name)
+
+
+def test_fretboard_index_positions(fretboard: Fretboard):
+    index = FretboardIndex(fretboard)
+    assert len(index) == 6 * 29
+    # open-hand of the C4 strings, fret 7 (a fourth) of the G3 strings, fret 18 (octave) of C3
+    assert index.positions("C4") == ((0, 0), (1, 0), (2, 7), (3, 7), (4, 0), (5, 18))
+    assert index.positions("Db4") == index.positions("C#4")
+    assert index.positions("B2") == ()
+    for string_index, fret_number in index.positions("Ek5"):
+        assert fretboard.note(string_index, fret_number).name == "Ek5"
+
+
+def test_fretboard_index_range_positions(fretboard: Fretboard):
+    index = FretboardIndex(fretboard)
+    steps, string_indices, fret_numbers = index.range_positions("C4", "G5")
+    low, high = parse_note_name("C4").step, parse_note_name("G5").step
+    in_range = (fretboard.steps >= low) & (fretboard.steps <= high)
+    assert len(steps) == np.count_nonzero(in_range)
+    assert np.all(np.diff(steps) >= 0)
+    assert steps[0] == low and steps[-1] == high
+    for step, string_index, fret_number in zip(steps, string_indices, fret_numbers):
+        assert fretboard.note(string_index, fret_number).step == step
+    assert not steps.flags.writeable
+    assert len(index.range_positions("G5", "C4")[0]) == 0
+    assert len(index.range_positions(0, 263)[0]) == len(index)
+
+
+def test_fretboard_index_invalid(fretboard: Fretboard):
+    index = FretboardIndex(fretboard)
+    with pytest.raises(ValueError):
+        index.positions("H4")
+    with pytest.raises(ValueError):
+        index.positions(264)
+    with pytest.raises(ValueError):
+        index.range_positions(-1, 10)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__]))
@@ -2,10 +2,18 @@
 # pylint: disable=missing-function-docstring
 from typing import Tuple
 
+import numpy as np
 import pytest
 
 from core.frequency import Frequency
-from instruments.piano_instrument import generate_piano_keys
+from core.notes import Note
+from core.tuning import tuning_table
+from instruments.piano_instrument import (
+    KEY_STEPS,
+    generate_piano_keys,
+    piano_keys,
+    piano_preset_keys,
+)
 
 
 @pytest.mark.parametrize(
@@ -35,5 +43,52 @@ def test_generate_piano_keys_invalid_range():
         generate_piano_keys((3, 2), a4_frequency=Frequency(1))  # Start is greater than end
 
 
+def test_generate_piano_keys_names():
+    keys = generate_piano_keys((3, 5), Frequency(440))
+    assert list(keys)[:5] == ["C3", "C#3", "D3", "D#3", "E3"]
+    assert list(keys)[-1] == "B4"
+    assert keys["A4"] == Note.from_name("A4", Frequency(440))
+
+
+@pytest.mark.parametrize(
+    "key_count, lowest, highest",
+    [(88, "A0", "C8"), (97, "C0", "C8"), (108, "C0", "B8")],
+)
+def test_piano_preset_keys(key_count: int, lowest: str, highest: str):
+    keys = piano_preset_keys(key_count, Frequency(440))
+    assert len(keys) == key_count
+    assert list(keys) == list(range(1, key_count + 1))
+    assert keys[1].name == lowest
+    assert keys[key_count].name == highest
+    assert np.all(np.diff(keys.steps) == 2)
+
+
+def test_piano_preset_keys_88():
+    keys = piano_preset_keys(88, Frequency(440))
+    assert keys[49] == Note.from_name("A4", Frequency(440))  # the 49th key of a piano is A4
+    assert keys[40].name == "C4"
+    np.testing.assert_allclose(
+        tuning_table(Frequency(440)).frequencies[keys.steps][[0, -1]], [27.5, 4186.009], rtol=1e-6
+    )
+
+
+def test_piano_keys_range():
+    keys = piano_keys("Db4", "F4", Frequency(432))
+    assert [note.name for note in keys.values()] == ["C#4", "D4", "D#4", "E4", "F4"]
+    assert keys[1].a4_frequency == Frequency(432)
+    assert piano_keys("C-1", "B9", Frequency(440)).steps.tolist() == KEY_STEPS.tolist()
+
+
+@pytest.mark.parametrize("lowest, highest", [("C4", "C3"), ("Cs4", "C5"), ("C4", "H5")])
+def test_piano_keys_invalid_range(lowest: str, highest: str):
+    with pytest.raises(ValueError):
+        piano_keys(lowest, highest, Frequency(440))
+
+
+def test_piano_preset_keys_invalid():
+    with pytest.raises(ValueError):
+        piano_preset_keys(61, Frequency(440))
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__]))
@@ -8,7 +8,7 @@ import pytest
 
 from core.frequency import Frequency
 from core.notes import Note
-from instruments.tar_instrument import tar_string
+from instruments.tar_instrument import tar_string, tar_string_steps, tar_string_sweep
 
 A4_FREQUENCY = Frequency(440)
 
@@ -31,7 +31,7 @@ def _load_notes_from_csv(filename: str) -> Tuple[dict, dict]:
     return notes, frequencies
 
 
-@pytest.mark.parametrize("base", ["A3", "A#2", "Bk5", "Gs1"])
+@pytest.mark.parametrize("base", ["A3", "A#2", "Bk5", "Gs1", "Eb4", "B#3"])
 @pytest.mark.parametrize("fret_count", [25, 27, 28])
 @pytest.mark.parametrize("a4_frequency", [2, 270, 440])
 def test_tar_strings(fret_count: int, base: str, a4_frequency: float):
@@ -65,5 +65,23 @@ def test_tar_string_against_test_data_file():
             assert actual_note.frequency == expected_frequency
 
 
+@pytest.mark.parametrize("base", ["A3", "A#2", "Bk5", "Gs1", "Eb4", "B#3"])
+@pytest.mark.parametrize("fret_count", [25, 27, 28])
+def test_tar_string_sweep(fret_count: int, base: str):
+    a4_frequencies = [2, 270, 440]
+    fret_numbers, names, sweep = tar_string_sweep(base, fret_count, a4_frequencies)
+    assert sweep.shape == (len(a4_frequencies), fret_count + 1)
+    for a4_frequency, row in zip(a4_frequencies, sweep):
+        string = tar_string(Note.from_name(base, Frequency(a4_frequency)), fret_count)
+        assert list(string.keys()) == fret_numbers.tolist()
+        assert [note.name for note in string.values()] == names
+        assert all(note == frequency for note, frequency in zip(string.values(), row.tolist()))
+
+
+def test_tar_string_steps_out_of_range():
+    with pytest.raises(ValueError):
+        tar_string_steps(Note.from_name("C9", A4_FREQUENCY).step, 27)
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__]))